@@ -1,17 +1,64 @@
 """The Orchard Care integration."""
+import asyncio
 import logging
+from collections.abc import Awaitable, Callable
 from datetime import datetime, timedelta
 from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.event import async_track_time_interval
-from homeassistant.const import Platform
+from homeassistant.core import Event, EventStateChangedData, HomeAssistant, State, callback
+from homeassistant.helpers import device_registry as dr, entity_registry as er
+from homeassistant.helpers.event import (
+    async_track_state_change_event,
+    async_track_time_change,
+    async_track_time_interval,
+)
+from homeassistant.const import EVENT_HOMEASSISTANT_STARTED, Platform
+from homeassistant.util import dt as dt_util
+
+from .blocks import OrchardBlock, parse_blocks
+from .chill import ChillAccumulator
+from .climate import zone_for_site
+from .completion_log import CompletionLog
+from .conflicts import SprayConflict, find_conflicts
+from .const import (
+    CONF_CLIMATE_ZONE,
+    CONF_HUMIDITY_SENSOR,
+    CONF_PLANT_OVERRIDES,
+    CONF_RAIN_SENSOR,
+    CONF_SOLAR_RADIATION_SENSOR,
+    CONF_TEMPERATURE_SENSOR,
+    CONF_WIND_SPEED_SENSOR,
+    DEFAULT_REMINDER_DAYS,
+    IRRIGATION_DURATION_HOURS,
+    REMINDER_DAYS_OPTIONS,
+    TASK_IRRIGATION,
+    TASK_PRUNING,
+    TASK_SPRAY,
+)
+from .irrigation import IrrigationEngine, to_metric
+from .overlay import CalendarOverlay
+from .schedule import compile_schedule, iter_occurrences
+from .services import async_setup_services
+from .snapshot import ScheduleSnapshot, config_hash
+from .solar import SolarLocation, task_start
+from .statistics import ComplianceStatistics, build_statistics
+from .tankmix import TankMixPlanner
+from .templates import DEFAULT_LANGUAGE, async_load_templates
+from .workload import WorkloadIndex, build_workload_index
 
 _LOGGER = logging.getLogger(__name__)
 
 DOMAIN = "orchard_care"
-PLATFORMS = [Platform.SENSOR, Platform.CALENDAR]
+PLATFORMS = [Platform.SENSOR, Platform.CALENDAR, Platform.TODO]
+
+WEATHER_SENSORS = [
+    CONF_TEMPERATURE_SENSOR,
+    CONF_HUMIDITY_SENSOR,
+    CONF_WIND_SPEED_SENSOR,
+    CONF_SOLAR_RADIATION_SENSOR,
+    CONF_RAIN_SENSOR,
+]
 
 # Type alias for better type hints in HA 2025.8
 type OrchardCareConfigEntry = ConfigEntry[OrchardCareCoordinator]
@@ -20,6 +67,7 @@ type OrchardCareConfigEntry = ConfigEntry[OrchardCareCoordinator]
 async def async_setup(hass: HomeAssistant, config: dict[str, Any]) -> bool:
     """Set up the Orchard Care component."""
     hass.data.setdefault(DOMAIN, {})
+    await async_setup_services(hass)
     return True
 
 
@@ -36,6 +84,9 @@ async def async_setup_entry(hass: HomeAssistant, entry: OrchardCareConfigEntry)
     # Use the new async_forward_entry_setups method (required in HA 2025.8)
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
+    # Options such as the entity mode change which entities exist
+    entry.async_on_unload(entry.add_update_listener(async_reload_entry))
+
     return True
 
 
@@ -54,8 +105,61 @@ async def async_unload_entry(hass: HomeAssistant, entry: OrchardCareConfigEntry)
 
 async def async_reload_entry(hass: HomeAssistant, entry: OrchardCareConfigEntry) -> None:
     """Reload config entry."""
-    await async_unload_entry(hass, entry)
-    await async_setup_entry(hass, entry)
+    await hass.config_entries.async_reload(entry.entry_id)
+
+
+async def async_migrate_entry(hass: HomeAssistant, entry: OrchardCareConfigEntry) -> bool:
+    """Migrate a config entry from an older version."""
+    if entry.version > 1:
+        # Downgraded from a newer release
+        return False
+
+    if entry.minor_version < 2:
+        await _async_scope_registry_ids(hass, entry)
+        hass.config_entries.async_update_entry(entry, minor_version=2)
+
+    return True
+
+
+async def _async_scope_registry_ids(hass: HomeAssistant, entry: OrchardCareConfigEntry) -> None:
+    """Prefix the entry ID to per-plant unique IDs and device identifiers.
+
+    They used to be bare plant keys, so a second orchard collided with the first.
+    """
+    prefix = f"{DOMAIN}_{entry.entry_id}_"
+
+    @callback
+    def scope_unique_id(entity_entry: er.RegistryEntry) -> dict[str, Any] | None:
+        """Return the entry-scoped unique ID of an entity."""
+        if entity_entry.unique_id.startswith(prefix):
+            return None
+        return {"new_unique_id": prefix + entity_entry.unique_id.removeprefix(f"{DOMAIN}_")}
+
+    await er.async_migrate_entries(hass, entry.entry_id, scope_unique_id)
+
+    device_registry = dr.async_get(hass)
+    for device in dr.async_entries_for_config_entry(device_registry, entry.entry_id):
+        if device.config_entries != {entry.entry_id}:
+            # The master device was shared by every orchard; each now gets its own
+            device_registry.async_update_device(device.id, remove_config_entry_id=entry.entry_id)
+            continue
+        device_registry.async_update_device(device.id, new_identifiers={
+            (domain, f"{entry.entry_id}_{identifier}")
+            if domain == DOMAIN and not identifier.startswith(f"{entry.entry_id}_")
+            else (domain, identifier)
+            for domain, identifier in device.identifiers
+        })
+
+
+def _metric_state(state: State | None) -> float | None:
+    """Return a numeric sensor state in the units used by the weather models."""
+    if state is None:
+        return None
+    try:
+        value = float(state.state)
+    except ValueError:
+        return None
+    return to_metric(value, state.attributes.get("unit_of_measurement"))
 
 
 class OrchardCareCoordinator:
@@ -68,67 +172,364 @@ class OrchardCareCoordinator:
         self._data: dict[str, dict[str, Any]] = {}
         self._update_interval = timedelta(hours=1)
         self._unsub_timer = None
+        # Options saved from the options flow override the initial setup
+        self.blocks: list[OrchardBlock] = parse_blocks({**entry.data, **entry.options})
+        self.summary: dict[str, Any] = {}
+        self.workload: WorkloadIndex | None = None
+        self.solar_location = SolarLocation.from_config(hass.config)
+        self.climate_zone: str | None = None
+        self.tank_mix = TankMixPlanner(location=self.solar_location)
+        self.conflicts: list[SprayConflict] = []
+        self._conflicts_by_spray: dict[tuple[str, datetime], list[SprayConflict]] = {}
+        self.completions = CompletionLog(hass, entry.entry_id)
+        self.overlay = CalendarOverlay(hass, entry.entry_id)
+        self._listeners: list[Callable[[], None]] = []
+        self.irrigation = IrrigationEngine(
+            hass, entry.entry_id, self._data, hass.config.latitude, hass.config.elevation or 0
+        )
+        self.irrigation_plan: dict[str, tuple[datetime, float]] = {}
+        self.chill = ChillAccumulator(
+            hass, entry.entry_id, self._data, self.get_option("hemisphere", "northern")
+        )
+        self._last_temperature: float | None = None
+        self._unsub_weather: list[Callable[[], None]] = []
+        self._sensor_keys: dict[str, str] = {}
+        self.snapshot = ScheduleSnapshot(hass, entry.entry_id)
+        self.statistics = ComplianceStatistics(hass, entry.entry_id)
+        self._statistics_lock = asyncio.Lock()
+        self._config_hash = ""
+        self._startup_scans: list[Callable[[], Awaitable[None]]] | None = []
+        self._unsub_started: Callable[[], None] | None = None
+        # Event and notification text; the configured language is loaded at setup
+        self.language = DEFAULT_LANGUAGE
+
+    def get_option(self, key: str, default: Any = None) -> Any:
+        """Return a setting, preferring the options flow over the initial config."""
+        if key in self.entry.options:
+            return self.entry.options[key]
+        return self.entry.data.get(key, default)
+
+    @property
+    def irrigation_enabled(self) -> bool:
+        """Return True when a temperature sensor feeds the irrigation engine."""
+        return bool(self.get_option(CONF_TEMPERATURE_SENSOR))
+
+    @property
+    def chill_enabled(self) -> bool:
+        """Return True when a temperature sensor feeds the chill accumulator."""
+        return bool(self.get_option(CONF_TEMPERATURE_SENSOR))
+
+    def get_reminder_days(self, task: str) -> tuple[int, ...]:
+        """Return the reminder lead times for a task kind, longest first."""
+        if task not in REMINDER_DAYS_OPTIONS:
+            return ()
+        days = self.get_option(REMINDER_DAYS_OPTIONS[task], DEFAULT_REMINDER_DAYS)
+        return tuple(sorted(set(days), reverse=True))
+
+    @property
+    def max_reminder_days(self) -> int:
+        """Return the longest reminder lead time of any task kind."""
+        return max(
+            (days for task in REMINDER_DAYS_OPTIONS for days in self.get_reminder_days(task)),
+            default=0,
+        )
+
+    @callback
+    def async_add_listener(self, update_callback: Callable[[], None]) -> Callable[[], None]:
+        """Call update_callback whenever the schedules change; return a remover."""
+        self._listeners.append(update_callback)
+
+        @callback
+        def remove_listener() -> None:
+            self._listeners.remove(update_callback)
+
+        return remove_listener
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Tell entities that cached events may be stale."""
+        for update_callback in list(self._listeners):
+            update_callback()
 
     async def async_initialize(self) -> None:
         """Initialize the coordinator."""
-        # Calculate initial schedules
-        await self._calculate_care_schedules()
+        self.language = await async_load_templates(self.hass, self.hass.config.language)
+
+        # Load the completion history before anything asks about reminders
+        await self.completions.async_load()
+        await self.overlay.async_load()
+        await self.statistics.async_load()
+
+        # Resume the soil water balance where it stopped
+        if self.irrigation_enabled:
+            await self.irrigation.async_load()
+        if self.chill_enabled:
+            await self.chill.async_load()
+
+        # Come up from the last compiled schedules when nothing they depend on changed
+        self._config_hash = config_hash(
+            PLANT_CARE_DATA,
+            dict(self.entry.data),
+            dict(self.entry.options),
+            self.hass.config.latitude,
+        )
+        snapshot = await self.snapshot.async_load(self._config_hash)
+        if snapshot:
+            self._data.update(snapshot["schedules"])
+            self.summary = snapshot["summary"]
+        else:
+            await self._calculate_care_schedules()
 
         # Start periodic updates
         self._unsub_timer = async_track_time_interval(
             self.hass, self._async_update, self._update_interval
         )
 
+        if self.irrigation_enabled:
+            self._sensor_keys = {
+                entity_id: key
+                for key in WEATHER_SENSORS
+                if (entity_id := self.get_option(key))
+            }
+            self._unsub_weather = [
+                async_track_state_change_event(
+                    self.hass, list(self._sensor_keys), self._async_weather_changed
+                ),
+                # Close the day even when no reading arrives after midnight
+                async_track_time_change(
+                    self.hass, self._async_close_irrigation_day, hour=0, minute=0, second=30
+                ),
+            ]
+
+        if self.chill_enabled:
+            self._last_temperature = _metric_state(
+                self.hass.states.get(self.get_option(CONF_TEMPERATURE_SENSOR))
+            )
+            # Chill models are defined on hourly temperatures
+            self._unsub_weather.append(
+                async_track_time_change(self.hass, self._async_sample_chill, minute=0, second=0)
+            )
+
+        # Revalidation and reminder scans wait until Home Assistant has started
+        if self.hass.is_running:
+            self._async_start_revalidation()
+        else:
+            self._unsub_started = self.hass.bus.async_listen_once(
+                EVENT_HOMEASSISTANT_STARTED, self._async_start_revalidation
+            )
+
+    @callback
+    def _async_start_revalidation(self, _event: Event | None = None) -> None:
+        """Recompile the schedules in a background task."""
+        self._unsub_started = None
+        self.entry.async_create_background_task(
+            self.hass, self._async_revalidate(), f"{DOMAIN} revalidate {self.entry.entry_id}"
+        )
+
+    async def _async_revalidate(self) -> None:
+        """Refresh everything the snapshot left stale, then run the deferred scans."""
+        # Summaries, tank mixes and conflicts are not in the snapshot
+        await self._calculate_care_schedules(force_notify=True)
+        scans, self._startup_scans = self._startup_scans or [], None
+        for scan in scans:
+            await scan()
+
+    @callback
+    def async_add_startup_scan(self, scan: Callable[[], Awaitable[None]]) -> None:
+        """Run a reminder scan once the schedules have been revalidated."""
+        if self._startup_scans is None:
+            self.entry.async_create_background_task(
+                self.hass, scan(), f"{DOMAIN} reminder scan {self.entry.entry_id}"
+            )
+        else:
+            self._startup_scans.append(scan)
+
     async def async_cleanup(self) -> None:
         """Clean up coordinator resources."""
         if self._unsub_timer:
             self._unsub_timer()
             self._unsub_timer = None
+        if self._unsub_started:
+            self._unsub_started()
+            self._unsub_started = None
+        for unsub in self._unsub_weather:
+            unsub()
+        self._unsub_weather = []
+
+    @callback
+    def _async_weather_changed(self, event: Event[EventStateChangedData]) -> None:
+        """Fold a weather reading into today's aggregates."""
+        value = _metric_state(event.data["new_state"])
+        key = self._sensor_keys[event.data["entity_id"]]
+        if key == CONF_TEMPERATURE_SENSOR:
+            # An unavailable sensor must not keep accruing its last reading as chill
+            self._last_temperature = value
+        if value is None:
+            return
+
+        if self.irrigation.add_reading(key, value, datetime.now().date()):
+            self._irrigation_day_closed()
+
+    @callback
+    def _async_sample_chill(self, now: datetime) -> None:
+        """Accrue the hour's chill from the latest temperature."""
+        if self._last_temperature is not None:
+            self.chill.add_sample(self._last_temperature, datetime.now())
+
+    @callback
+    def _async_close_irrigation_day(self, now: datetime) -> None:
+        """Advance the water balance at the start of a new day."""
+        if self.irrigation.roll_over(datetime.now().date()):
+            self._irrigation_day_closed()
+
+    @callback
+    def _irrigation_day_closed(self) -> None:
+        """Re-plan irrigation after the balances advanced."""
+        self._update_irrigation_plan(datetime.now())
+        self.async_update_listeners()
+
+    @callback
+    def record_irrigation(self, plant: str) -> None:
+        """Mark a planting as watered back to field capacity."""
+        self.irrigation.record_irrigation(plant)
+        self._update_irrigation_plan(datetime.now())
+        self.async_update_listeners()
+
+    def _update_irrigation_plan(self, now: datetime) -> None:
+        """Work out when each planting next needs water."""
+        if not self.irrigation_enabled:
+            return
+
+        plan = {}
+        for plant in self._data:
+            due = self.irrigation.plan(plant, now.date())
+            if due is None:
+                continue
+            day, amount = due
+            start = task_start(TASK_IRRIGATION, day, self.solar_location)
+            # Once today's watering window has passed the task moves to tomorrow
+            if start + timedelta(hours=IRRIGATION_DURATION_HOURS) <= now:
+                start = task_start(TASK_IRRIGATION, day + timedelta(days=1), self.solar_location)
+            plan[plant] = (start, amount)
+        self.irrigation_plan = plan
 
     async def _async_update(self, now: datetime) -> None:
         """Update orchard care data."""
         await self._calculate_care_schedules()
 
-    async def _calculate_care_schedules(self) -> None:
+    async def _calculate_care_schedules(self, force_notify: bool = False) -> None:
         """Calculate care schedules for all configured plants."""
-        hemisphere = self.entry.data.get("hemisphere", "northern")
-        organic_preference = self.entry.data.get("organic_preference", True)
-        selected_plants = self.entry.data.get("selected_plants", [])
+        hemisphere = self.get_option("hemisphere", "northern")
+        organic_preference = self.get_option("organic_preference", True)
+        selected_plants = self.get_option("selected_plants", [])
+        overrides = self.get_option(CONF_PLANT_OVERRIDES, {})
+        # The zone is looked up once per pass and baked into every schedule
+        self.climate_zone = zone_for_site(
+            self.get_option(CONF_CLIMATE_ZONE), self.hass.config.latitude
+        )
 
-        for plant in selected_plants:
+        previous = dict(self._data)
+        previous_summary = self.summary
+
+        # Schedules are per species, so many blocks of one species share one
+        plants = dict.fromkeys([*selected_plants, *(block.plant for block in self.blocks)])
+        for plant in plants:
             plant_data = PLANT_CARE_DATA.get(plant, {})
             if plant_data:
                 self._data[plant] = self._get_plant_schedule(
-                    plant_data, hemisphere, organic_preference
+                    plant_data, hemisphere, organic_preference, overrides.get(plant)
                 )
 
+        now = datetime.now()
+        self.summary = self._build_summary(now)
+        self.workload = build_workload_index(self._data, self.blocks, now.date())
+        self._update_tank_mix(now)
+        self._update_conflicts(now)
+        self._update_irrigation_plan(now)
+
+        if self._config_hash and (self._data != previous or self.summary != previous_summary):
+            self.snapshot.async_save(
+                self._config_hash, {"schedules": self._data, "summary": self.summary}
+            )
+
+        # The hourly refresh usually changes nothing; only real changes reach the entities
+        if force_notify or self._data != previous:
+            self.async_update_listeners()
+
+        # Tasks fall due as time passes, so the counts are checked on every pass
+        await self.async_publish_statistics()
+
+    async def async_publish_statistics(self) -> None:
+        """Publish the season compliance counts as long-term statistics."""
+        if "recorder" not in self.hass.config.components:
+            return
+        # Passes are serialized so an older build never overwrites a newer one
+        async with self._statistics_lock:
+            # Counting walks every season since the first, so it runs in the
+            # executor on a copy of the schedules and of the completion log
+            statistics = await self.hass.async_add_executor_job(
+                build_statistics,
+                self.entry.entry_id,
+                dict(self._data),
+                list(self.completions.iter_records()),
+                dt_util.as_local(self.entry.created_at).year,
+                datetime.now(),
+                dt_util.get_default_time_zone(),
+                self.solar_location,
+            )
+            self.statistics.async_publish(statistics)
+
+    def _update_conflicts(self, now: datetime) -> None:
+        """Re-check the season's planned sprays against the product catalog."""
+        self.conflicts = find_conflicts(
+            self._data,
+            datetime(now.year, 1, 1),
+            datetime(now.year + 1, 12, 31, 23, 59),
+            self.solar_location,
+        )
+        self._conflicts_by_spray = {}
+        for conflict in self.conflicts:
+            self._conflicts_by_spray.setdefault((conflict.plant, conflict.date), []).append(conflict)
+
+    def get_conflicts(self, plant: str, spray_date: datetime | None = None) -> list[SprayConflict]:
+        """Return conflicts for a plant, or for one of its planned sprays."""
+        if spray_date is not None:
+            return self._conflicts_by_spray.get((plant, spray_date), [])
+        return [conflict for conflict in self.conflicts if conflict.plant == plant]
+
+    def _update_tank_mix(self, now: datetime) -> None:
+        """Refresh tank-mix groups for plantings whose spray plan changed."""
+        season_start = datetime(now.year, 1, 1)
+        season_end = datetime(now.year + 1, 12, 31, 23, 59)
+
+        for plant in self.tank_mix.plantings - self._data.keys():
+            self.tank_mix.remove_planting(plant)
+
+        # Unchanged plantings are skipped by the planner, so this stays incremental
+        for plant, schedule in self._data.items():
+            self.tank_mix.update_planting(
+                plant,
+                schedule.get("spray_months", []),
+                schedule.get("spray_products", [])[:3],
+                season_start,
+                season_end,
+            )
+
     def _get_plant_schedule(
-        self, plant_data: dict[str, Any], hemisphere: str, organic_preference: bool
+        self,
+        plant_data: dict[str, Any],
+        hemisphere: str,
+        organic_preference: bool,
+        overrides: dict[str, list[int]] | None = None,
     ) -> dict[str, Any]:
         """Get care schedule for a specific plant."""
-        current_date = datetime.now()
-
-        # Adjust months for southern hemisphere (6 month offset)
-        month_offset = 6 if hemisphere == "southern" else 0
-
-        pruning_months = plant_data.get("pruning_months", [])
-        spray_months = plant_data.get("spray_months", [])
-
-        # Adjust months for hemisphere
-        if month_offset:
-            pruning_months = [(m + month_offset - 1) % 12 + 1 for m in pruning_months]
-            spray_months = [(m + month_offset - 1) % 12 + 1 for m in spray_months]
-
-        # Get spray recommendations based on preference
-        spray_type = "organic" if organic_preference else "conventional"
-        spray_products = plant_data.get("spray_products", {}).get(spray_type, [])
-
+        schedule = compile_schedule(
+            plant_data, hemisphere, organic_preference, self.climate_zone, overrides
+        )
         return {
-            "pruning_months": pruning_months,
-            "spray_months": spray_months,
-            "spray_products": spray_products,
-            "next_pruning": self._get_next_occurrence(pruning_months),
-            "next_spray": self._get_next_occurrence(spray_months),
+            **schedule,
+            "next_pruning": self._get_next_occurrence(schedule["pruning_months"]),
+            "next_spray": self._get_next_occurrence(schedule["spray_months"]),
             "care_notes": plant_data.get("care_notes", "")
         }
 
@@ -148,6 +549,77 @@ class OrchardCareCoordinator:
         # If no month this year, return first month next year
         return datetime(current_year + 1, min(months), 1)
 
+    def _build_summary(self, now: datetime) -> dict[str, Any]:
+        """Roll the blocks up into the fixed set of aggregate figures."""
+        blocks_by_plant: dict[str, list[OrchardBlock]] = {}
+        for block in self.blocks:
+            blocks_by_plant.setdefault(block.plant, []).append(block)
+
+        week_end = now + timedelta(days=7)
+        tasks_due = []
+        species = {}
+        next_task: dict[str, dict[str, Any]] = {}
+
+        for plant, blocks in blocks_by_plant.items():
+            schedule = self._data.get(plant)
+            if not schedule:
+                continue
+            plant_count = sum(block.count for block in blocks)
+
+            for start, task in iter_occurrences(schedule, now, week_end, self.solar_location):
+                tasks_due.append({
+                    "plant": plant,
+                    "task": task,
+                    "date": start.isoformat(),
+                    "blocks": len(blocks),
+                    "plants": plant_count,
+                })
+
+            species[plant] = {
+                "name": PLANT_CARE_DATA.get(plant, {}).get("name", plant.title()),
+                "blocks": len(blocks),
+                "plants": plant_count,
+                "next_pruning": schedule.get("next_pruning"),
+                "next_spray": schedule.get("next_spray"),
+            }
+
+            for task, key in ((TASK_PRUNING, "next_pruning"), (TASK_SPRAY, "next_spray")):
+                when = schedule.get(key)
+                if when is None:
+                    continue
+                current = next_task.get(task)
+                if current is None or when < current["date"]:
+                    next_task[task] = {"date": when, "plants": [plant], "blocks": len(blocks)}
+                elif when == current["date"]:
+                    current["plants"].append(plant)
+                    current["blocks"] += len(blocks)
+
+        tasks_due.sort(key=lambda item: item["date"])
+        return {
+            "tasks_due_week": tasks_due,
+            "next_task": next_task,
+            "species": species,
+            "total_blocks": len(self.blocks),
+            "total_plants": sum(block.count for block in self.blocks),
+        }
+
+    def get_overview_rows(self) -> list[dict[str, Any]]:
+        """Return one compact row per block for the overview card and queries."""
+        rows = []
+        for block in self.blocks:
+            schedule = self._data.get(block.plant, {})
+            next_pruning = schedule.get("next_pruning")
+            next_spray = schedule.get("next_spray")
+            rows.append({
+                **block.as_dict(),
+                "entry_id": self.entry.entry_id,
+                "name": PLANT_CARE_DATA.get(block.plant, {}).get("name", block.plant.title()),
+                "next_pruning": next_pruning.isoformat() if next_pruning else None,
+                "next_spray": next_spray.isoformat() if next_spray else None,
+                "spray_products": schedule.get("spray_products", [])[:3],
+            })
+        return rows
+
 
 # Plant care data with seasonal care schedules
 PLANT_CARE_DATA = {
@@ -155,6 +627,11 @@ PLANT_CARE_DATA = {
         "name": "Apple Tree",
         "pruning_months": [12, 1, 2],  # Winter pruning
         "spray_months": [3, 4, 5, 9],  # Early spring and fall
+        "harvest_months": [8, 9, 10],
+        "crop_coefficients": [0.45, 0.95, 0.70],  # FAO-56 Kc initial, mid, end
+        "depletion_fraction": 0.5,
+        "root_zone_water_mm": 180,
+        "chill_requirement": {"hours": 1000, "units": 1000, "portions": 55},  # Mid-chill cultivars; hours, Utah units, portions
         "spray_products": {
             "organic": ["Neem oil", "Copper fungicide", "Horticultural oil", "Bacillus thuringiensis"],
             "conventional": ["Captan", "Imidacloprid", "Malathion", "Fungicide spray"]
@@ -165,6 +642,11 @@ PLANT_CARE_DATA = {
         "name": "Pear Tree",
         "pruning_months": [12, 1, 2],
         "spray_months": [3, 4, 5, 9],
+        "harvest_months": [8, 9],
+        "crop_coefficients": [0.45, 0.95, 0.70],
+        "depletion_fraction": 0.5,
+        "root_zone_water_mm": 180,
+        "chill_requirement": {"hours": 800, "units": 850, "portions": 50},
         "spray_products": {
             "organic": ["Neem oil", "Copper fungicide", "Kaolin clay", "Spinosad"],
             "conventional": ["Captan", "Imidacloprid", "Carbaryl", "Streptomycin"]
@@ -175,6 +657,11 @@ PLANT_CARE_DATA = {
         "name": "Cherry Tree",
         "pruning_months": [6, 7, 8],  # Summer pruning to avoid disease
         "spray_months": [3, 4, 5],
+        "harvest_months": [6, 7],
+        "crop_coefficients": [0.45, 0.95, 0.70],
+        "depletion_fraction": 0.5,
+        "root_zone_water_mm": 180,
+        "chill_requirement": {"hours": 1000, "units": 1100, "portions": 60},
         "spray_products": {
             "organic": ["Copper fungicide", "Neem oil", "Bacillus subtilis"],
             "conventional": ["Captan", "Propiconazole", "Imidacloprid"]
@@ -185,6 +672,11 @@ PLANT_CARE_DATA = {
         "name": "Plum Tree",
         "pruning_months": [6, 7, 8],
         "spray_months": [3, 4, 5],
+        "harvest_months": [7, 8],
+        "crop_coefficients": [0.45, 0.90, 0.65],
+        "depletion_fraction": 0.5,
+        "root_zone_water_mm": 160,
+        "chill_requirement": {"hours": 800, "units": 850, "portions": 50},
         "spray_products": {
             "organic": ["Copper fungicide", "Neem oil", "Horticultural oil"],
             "conventional": ["Captan", "Chlorpyrifos", "Fungicide spray"]
@@ -195,6 +687,11 @@ PLANT_CARE_DATA = {
         "name": "Peach Tree",
         "pruning_months": [12, 1, 2],
         "spray_months": [3, 4, 5, 6],
+        "harvest_months": [7, 8],
+        "crop_coefficients": [0.45, 0.90, 0.65],
+        "depletion_fraction": 0.5,
+        "root_zone_water_mm": 160,
+        "chill_requirement": {"hours": 650, "units": 700, "portions": 40},
         "spray_products": {
             "organic": ["Copper fungicide", "Neem oil", "Sulfur spray", "Spinosad"],
             "conventional": ["Captan", "Imidacloprid", "Propiconazole", "Malathion"]
@@ -205,6 +702,11 @@ PLANT_CARE_DATA = {
         "name": "Apricot Tree",
         "pruning_months": [12, 1, 2],
         "spray_months": [3, 4, 5, 6],
+        "harvest_months": [6, 7],
+        "crop_coefficients": [0.45, 0.90, 0.65],
+        "depletion_fraction": 0.5,
+        "root_zone_water_mm": 160,
+        "chill_requirement": {"hours": 600, "units": 700, "portions": 40},
         "spray_products": {
             "organic": ["Copper fungicide", "Neem oil", "Sulfur spray", "Horticultural oil", "Bacillus subtilis"],
             "conventional": ["Captan", "Imidacloprid", "Propiconazole", "Malathion", "Fungicide spray"]
@@ -215,6 +717,10 @@ PLANT_CARE_DATA = {
         "name": "Orange Tree",
         "pruning_months": [3, 4, 5],
         "spray_months": [2, 3, 4, 8, 9],
+        "harvest_months": [11, 12, 1, 2],
+        "crop_coefficients": [0.70, 0.65, 0.70],
+        "depletion_fraction": 0.5,
+        "root_zone_water_mm": 150,
         "spray_products": {
             "organic": ["Neem oil", "Horticultural oil", "Insecticidal soap", "Copper fungicide"],
             "conventional": ["Imidacloprid", "Abamectin", "Copper sulfate", "Fungicide spray"]
@@ -225,6 +731,10 @@ PLANT_CARE_DATA = {
         "name": "Lemon Tree",
         "pruning_months": [3, 4, 5],
         "spray_months": [2, 3, 4, 8, 9, 10],
+        "harvest_months": [11, 12, 1, 2, 3, 4],
+        "crop_coefficients": [0.70, 0.65, 0.70],
+        "depletion_fraction": 0.5,
+        "root_zone_water_mm": 150,
         "spray_products": {
             "organic": ["Neem oil", "Horticultural oil", "Insecticidal soap", "Copper fungicide"],
             "conventional": ["Imidacloprid", "Abamectin", "Copper sulfate", "Systemic insecticide"]
@@ -235,6 +745,11 @@ PLANT_CARE_DATA = {
         "name": "Grapevine",
         "pruning_months": [12, 1, 2],
         "spray_months": [4, 5, 6, 7],
+        "harvest_months": [8, 9, 10],
+        "crop_coefficients": [0.30, 0.85, 0.45],
+        "depletion_fraction": 0.35,
+        "root_zone_water_mm": 150,
+        "chill_requirement": {"hours": 200, "units": 250, "portions": 15},
         "spray_products": {
             "organic": ["Copper fungicide", "Sulfur spray", "Bacillus subtilis", "Neem oil"],
             "conventional": ["Captan", "Mancozeb", "Imidacloprid", "Fungicide spray"]
@@ -245,6 +760,11 @@ PLANT_CARE_DATA = {
         "name": "Blueberry Bush",
         "pruning_months": [12, 1, 2],
         "spray_months": [3, 4, 5],
+        "harvest_months": [6, 7, 8],
+        "crop_coefficients": [0.30, 1.05, 0.50],
+        "depletion_fraction": 0.5,
+        "root_zone_water_mm": 70,
+        "chill_requirement": {"hours": 800, "units": 850, "portions": 45},
         "spray_products": {
             "organic": ["Neem oil", "Copper fungicide", "Horticultural oil", "Bacillus thuringiensis"],
             "conventional": ["Captan", "Imidacloprid", "Fungicide spray", "Insecticide spray"]
@@ -255,6 +775,11 @@ PLANT_CARE_DATA = {
         "name": "Raspberry Cane",
         "pruning_months": [11, 12, 1, 2],
         "spray_months": [3, 4, 5],
+        "harvest_months": [6, 7, 8, 9],
+        "crop_coefficients": [0.30, 1.05, 0.50],
+        "depletion_fraction": 0.5,
+        "root_zone_water_mm": 90,
+        "chill_requirement": {"hours": 800, "units": 850, "portions": 45},
         "spray_products": {
             "organic": ["Neem oil", "Copper fungicide", "Horticultural oil"],
             "conventional": ["Captan", "Malathion", "Fungicide spray"]
@@ -265,6 +790,11 @@ PLANT_CARE_DATA = {
         "name": "Blackberry Cane",
         "pruning_months": [11, 12, 1, 2],
         "spray_months": [3, 4, 5],
+        "harvest_months": [7, 8],
+        "crop_coefficients": [0.30, 1.05, 0.50],
+        "depletion_fraction": 0.5,
+        "root_zone_water_mm": 90,
+        "chill_requirement": {"hours": 400, "units": 450, "portions": 25},
         "spray_products": {
             "organic": ["Neem oil", "Copper fungicide", "Horticultural oil"],
             "conventional": ["Captan", "Malathion", "Systemic fungicide"]
@@ -275,6 +805,11 @@ PLANT_CARE_DATA = {
         "name": "Strawberry Plant",
         "pruning_months": [11, 12, 1],
         "spray_months": [3, 4, 5, 9],
+        "harvest_months": [5, 6],
+        "crop_coefficients": [0.40, 0.85, 0.75],
+        "depletion_fraction": 0.2,
+        "root_zone_water_mm": 40,
+        "chill_requirement": {"hours": 200, "units": 250, "portions": 15},
         "spray_products": {
             "organic": ["Neem oil", "Copper fungicide", "Bacillus subtilis"],
             "conventional": ["Captan", "Imidacloprid", "Fungicide spray"]
@@ -285,6 +820,11 @@ PLANT_CARE_DATA = {
         "name": "Fig Tree",
         "pruning_months": [12, 1, 2, 3],
         "spray_months": [3, 4, 5, 8, 9],
+        "harvest_months": [7, 8, 9],
+        "crop_coefficients": [0.45, 0.85, 0.65],
+        "depletion_fraction": 0.5,
+        "root_zone_water_mm": 160,
+        "chill_requirement": {"hours": 100, "units": 150, "portions": 10},
         "spray_products": {
             "organic": ["Neem oil", "Copper fungicide", "Horticultural oil", "Insecticidal soap"],
             "conventional": ["Captan", "Imidacloprid", "Malathion", "Systemic fungicide"]
@@ -295,6 +835,10 @@ PLANT_CARE_DATA = {
         "name": "Avocado Tree",
         "pruning_months": [2, 3, 4],
         "spray_months": [2, 3, 4, 5, 8, 9, 10],
+        "harvest_months": [3, 4, 5, 6],
+        "crop_coefficients": [0.60, 0.85, 0.75],
+        "depletion_fraction": 0.7,
+        "root_zone_water_mm": 90,
         "spray_products": {
             "organic": ["Neem oil", "Horticultural oil", "Copper fungicide", "Bacillus thuringiensis", "Spinosad"],
             "conventional": ["Imidacloprid", "Abamectin", "Copper sulfate", "Systemic insecticide", "Fungicide spray"]
@@ -305,6 +849,11 @@ PLANT_CARE_DATA = {
         "name": "Kiwi Vine",
         "pruning_months": [6, 7, 8],
         "spray_months": [9, 10, 11, 3, 4],
+        "harvest_months": [10, 11],
+        "crop_coefficients": [0.40, 1.05, 1.05],
+        "depletion_fraction": 0.35,
+        "root_zone_water_mm": 120,
+        "chill_requirement": {"hours": 600, "units": 700, "portions": 40},
         "spray_products": {
             "organic": ["Copper fungicide", "Neem oil", "Horticultural oil", "Bacillus thuringiensis", "Spinosad"],
             "conventional": ["Captan", "Imidacloprid", "Mancozeb", "Systemic insecticide", "Fungicide spray"]
@@ -315,6 +864,11 @@ PLANT_CARE_DATA = {
         "name": "Persimmon Tree",
         "pruning_months": [12, 1, 2],
         "spray_months": [3, 4, 5, 8, 9],
+        "harvest_months": [10, 11],
+        "crop_coefficients": [0.45, 0.90, 0.65],
+        "depletion_fraction": 0.5,
+        "root_zone_water_mm": 160,
+        "chill_requirement": {"hours": 200, "units": 250, "portions": 15},
         "spray_products": {
             "organic": ["Neem oil", "Copper fungicide", "Horticultural oil", "Bacillus subtilis", "Kaolin clay"],
             "conventional": ["Captan", "Imidacloprid", "Propiconazole", "Malathion", "Fungicide spray"]
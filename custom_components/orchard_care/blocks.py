@@ -0,0 +1,54 @@
+"""Orchard block model for the Orchard Care integration."""
+from dataclasses import dataclass
+from typing import Any
+
+from .const import CONF_BLOCKS
+
+
+@dataclass(frozen=True, slots=True)
+class OrchardBlock:
+    """A planting of a single species at one location."""
+
+    block_id: str
+    plant: str
+    count: int = 1
+    location: str = ""
+    cultivar: str = ""
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the block as a plain dict for storage and service responses."""
+        return {
+            "block_id": self.block_id,
+            "plant": self.plant,
+            "count": self.count,
+            "location": self.location,
+            "cultivar": self.cultivar,
+        }
+
+
+def parse_blocks(config: dict[str, Any]) -> list[OrchardBlock]:
+    """Build the block list from config entry data.
+
+    Entries created before blocks existed get one single-plant block per
+    selected species, so both layouts share the same code paths.
+    """
+    raw_blocks = config.get(CONF_BLOCKS)
+    if not raw_blocks:
+        return [
+            OrchardBlock(block_id=plant, plant=plant)
+            for plant in config.get("selected_plants", [])
+        ]
+
+    blocks = []
+    for index, raw in enumerate(raw_blocks):
+        plant = raw.get("plant")
+        if not plant:
+            continue
+        blocks.append(OrchardBlock(
+            block_id=str(raw.get("block_id") or f"{plant}_{index + 1}"),
+            plant=plant,
+            count=max(int(raw.get("count", 1)), 0),
+            location=raw.get("location", ""),
+            cultivar=raw.get("cultivar", ""),
+        ))
+    return blocks
@@ -1,17 +1,79 @@
 # custom_components/orchard_care/calendar.py - FIXED VERSION
 """Calendar platform for Orchard Care integration with smart reminders."""
-from datetime import datetime, timedelta
+import heapq
+import logging
+from abc import ABC, abstractmethod
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass, replace
+from datetime import date, datetime, time, timedelta
+from functools import partial
 from typing import Optional, List, Any
 
-from homeassistant.components.calendar import CalendarEntity, CalendarEvent
+from homeassistant.components.calendar import (
+    EVENT_DESCRIPTION,
+    EVENT_END,
+    EVENT_LOCATION,
+    EVENT_RRULE,
+    EVENT_START,
+    EVENT_SUMMARY,
+    CalendarEntity,
+    CalendarEntityFeature,
+    CalendarEvent,
+)
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.event import async_track_time_interval, async_call_later
-from homeassistant.const import EVENT_HOMEASSISTANT_STARTED
 from homeassistant.helpers.entity import EntityCategory
+from homeassistant.util import dt as dt_util
+from homeassistant.util.ulid import ulid_now
 
 from . import DOMAIN, OrchardCareCoordinator, PLANT_CARE_DATA
+from .const import (
+    CHUNKED_QUERY_PLANT_DAYS,
+    CONF_ENTITY_MODE,
+    ENTITY_MODE_AGGREGATE,
+    IRRIGATION_DURATION_HOURS,
+    MAX_CALENDAR_EVENTS,
+    PRUNING_DURATION_HOURS,
+    REMINDER_DAYS_OPTIONS,
+    QUERY_CHUNK_DAYS,
+    SPRAY_DURATION_HOURS,
+    TASK_IRRIGATION,
+    TASK_PRUNING,
+    TASK_SPRAY,
+)
+from .descriptions import (
+    get_irrigation_description,
+    get_notification,
+    get_reminder_description,
+    get_reminder_summary,
+    get_spray_warnings,
+    get_task_description,
+    get_task_summary,
+)
+from .occurrences import Occurrence
+from .overlay import OverlayEvent
+from .schedule import freeze_schedule, iter_occurrences, occurrence_id, parse_occurrence_id
+from .solar import SolarLocation
+
+_LOGGER = logging.getLogger(__name__)
+
+# How far ahead the current-or-next event is searched, widening until one is found
+EVENT_SEARCH_DAYS = (7, 31, 366)
+EVENT_LOOKBACK = timedelta(hours=max(PRUNING_DURATION_HOURS, SPRAY_DURATION_HOURS))
+REMINDER_DURATION = timedelta(minutes=15)
+TASK_DURATIONS = {
+    TASK_PRUNING: timedelta(hours=PRUNING_DURATION_HOURS),
+    TASK_SPRAY: timedelta(hours=SPRAY_DURATION_HOURS),
+    TASK_IRRIGATION: timedelta(hours=IRRIGATION_DURATION_HOURS),
+}
+EDITABLE_FEATURES = (
+    CalendarEntityFeature.CREATE_EVENT
+    | CalendarEntityFeature.UPDATE_EVENT
+    | CalendarEntityFeature.DELETE_EVENT
+)
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -22,10 +84,12 @@ async def async_setup_entry(
     coordinator = hass.data[DOMAIN][config_entry.entry_id]
 
     entities = []
-    selected_plants = config_entry.data.get("selected_plants", [])
+    selected_plants = coordinator.get_option("selected_plants", [])
 
-    for plant in selected_plants:
-        entities.append(OrchardCareCalendar(coordinator, plant, config_entry))
+    # Aggregate mode keeps only the master calendar so entity count stays fixed
+    if coordinator.get_option(CONF_ENTITY_MODE) != ENTITY_MODE_AGGREGATE:
+        for plant in selected_plants:
+            entities.append(OrchardCareCalendar(coordinator, plant, config_entry))
 
     # Add a master calendar that combines all plants
     if selected_plants:
@@ -34,7 +98,241 @@ async def async_setup_entry(
     async_add_entities(entities)
 
 
-class OrchardCareCalendar(CalendarEntity):
+def _is_large_query(start_date: datetime, end_date: datetime, plant_count: int) -> bool:
+    """Return True when a range is too long to expand on the event loop."""
+    return (end_date - start_date).days * max(plant_count, 1) > CHUNKED_QUERY_PLANT_DAYS
+
+
+async def _async_expand_in_chunks(
+    hass: HomeAssistant,
+    expand: Callable[[datetime, datetime], list[CalendarEvent]],
+    start_date: datetime,
+    end_date: datetime,
+) -> list[CalendarEvent]:
+    """Expand a long range chunk by chunk in the executor.
+
+    Each chunk yields back to the event loop, and expansion stops once
+    MAX_CALENDAR_EVENTS have been produced.
+    """
+    events: list[CalendarEvent] = []
+    chunk_start = start_date
+    while chunk_start <= end_date and len(events) < MAX_CALENDAR_EVENTS:
+        next_start = min(chunk_start + timedelta(days=QUERY_CHUNK_DAYS), end_date + timedelta(microseconds=1))
+        # Chunks must not share an endpoint or boundary events would be duplicated
+        events.extend(await hass.async_add_executor_job(
+            expand, chunk_start, next_start - timedelta(microseconds=1)
+        ))
+        chunk_start = next_start
+
+    if len(events) > MAX_CALENDAR_EVENTS:
+        _LOGGER.warning(
+            "Calendar query from %s to %s truncated to %s events",
+            start_date, end_date, MAX_CALENDAR_EVENTS
+        )
+        del events[MAX_CALENDAR_EVENTS:]
+    return events
+
+
+def _occurrence_end(occurrence: Occurrence) -> datetime:
+    """Return when a record ends on the calendar."""
+    if occurrence.is_reminder:
+        return occurrence.start + REMINDER_DURATION
+    return occurrence.task_start + TASK_DURATIONS[occurrence.task]
+
+
+@dataclass(frozen=True, slots=True)
+class _QueryState:
+    """The coordinator state one plant's query reads, captured on the event loop.
+
+    Long queries expand in the executor while the loop goes on replacing the
+    coordinator's schedules, completions, conflicts and plans, so workers
+    read this snapshot and never the coordinator itself.
+    """
+
+    schedule: Mapping[str, Any]
+    spray_products: tuple[str, ...]
+    location: SolarLocation
+    language: str
+    reminder_days: Mapping[str, tuple[int, ...]]
+    max_reminder_days: int
+    replaced: frozenset[str]
+    completed: frozenset[tuple[str, str]]
+    conflicts: Mapping[datetime, tuple[str, ...]]
+    irrigation: tuple[datetime, float] | None
+    overlay_events: tuple[OverlayEvent, ...]
+
+    def is_completed(self, occurrence: Occurrence) -> bool:
+        """Return True when the task behind an occurrence has been completed."""
+        return (occurrence.task, occurrence.task_start.date().isoformat()) in self.completed
+
+
+def _local_time(value: date | datetime) -> datetime:
+    """Return a start or end as the naive local time the schedules use."""
+    if not isinstance(value, datetime):
+        # All-day events run from midnight to midnight
+        return datetime.combine(value, time())
+    if value.tzinfo is not None:
+        return dt_util.as_local(value).replace(tzinfo=None)
+    return value
+
+
+def _event_start(event: CalendarEvent) -> datetime:
+    """Return the start of an event for ordering timed and all-day events together."""
+    return _local_time(event.start)
+
+
+def _render_overlay_event(event: OverlayEvent) -> CalendarEvent:
+    """Render an event entered by the user."""
+    if event.all_day:
+        start, end = event.start.date(), event.end.date()
+    else:
+        start, end = event.start, event.end
+    return CalendarEvent(
+        start=start,
+        end=end,
+        summary=event.summary,
+        description=event.description,
+        location=event.location or "Orchard/Garden",
+        uid=event.uid,
+    )
+
+
+class _EditableCalendarMixin(ABC):
+    """Create, update and delete events as an overlay on the generated schedule.
+
+    Updating a generated task stores the user's version under the task's id
+    and deleting it cancels that occurrence; neither touches the schedule.
+    Events added by the user get ids of their own.
+    """
+
+    _attr_supported_features = EDITABLE_FEATURES
+
+    @abstractmethod
+    def _owns_plant(self, plant: str | None) -> bool:
+        """Return True when events of a plant can be edited here."""
+
+    @property
+    @abstractmethod
+    def _added_plant(self) -> str | None:
+        """Return the plant that events added here belong to."""
+
+    def _is_generated(self, uid: str) -> bool:
+        """Return True when an id belongs to a task generated for an owned plant."""
+        parsed = parse_occurrence_id(uid)
+        if parsed is None or not self._owns_plant(parsed[0]):
+            return False
+        plant, task, day = parsed
+        if task == TASK_IRRIGATION:
+            irrigation = self.coordinator.irrigation_plan.get(plant)
+            return irrigation is not None and irrigation[0].date() == day
+        return any(
+            kind == task
+            for _start, kind in iter_occurrences(
+                self.coordinator._data.get(plant, {}),
+                datetime.combine(day, time()),
+                datetime.combine(day, time.max),
+                self.coordinator.solar_location,
+            )
+        )
+
+    def _edited_plant(self, uid: str) -> str | None:
+        """Return the plant of an editable event, or raise for unknown ids."""
+        if (event := self.coordinator.overlay.get(uid)) is not None and self._owns_plant(event.plant):
+            return event.plant
+        if self._is_generated(uid):
+            return parse_occurrence_id(uid)[0]
+        raise HomeAssistantError(f"Unknown orchard event: {uid}")
+
+    def _overlay_event(self, uid: str, plant: str | None, fields: dict[str, Any]) -> OverlayEvent:
+        """Build the stored form of an event from calendar fields."""
+        if fields.get(EVENT_RRULE):
+            raise HomeAssistantError("Recurring orchard events are not supported")
+        return OverlayEvent(
+            uid=uid,
+            plant=plant,
+            start=_local_time(fields[EVENT_START]),
+            end=_local_time(fields[EVENT_END]),
+            summary=fields[EVENT_SUMMARY],
+            description=fields.get(EVENT_DESCRIPTION),
+            location=fields.get(EVENT_LOCATION),
+            all_day=not isinstance(fields[EVENT_START], datetime),
+        )
+
+    async def async_create_event(self, **kwargs: Any) -> None:
+        """Add an event of the user's own."""
+        event = self._overlay_event(f"{DOMAIN}-{ulid_now()}", self._added_plant, kwargs)
+        self.coordinator.overlay.async_set(event)
+        self.coordinator.async_update_listeners()
+
+    async def async_update_event(
+        self,
+        uid: str,
+        event: dict[str, Any],
+        recurrence_id: str | None = None,
+        recurrence_range: str | None = None,
+    ) -> None:
+        """Move or rewrite a generated task, or change an added event."""
+        plant = self._edited_plant(uid)
+        self.coordinator.overlay.async_set(self._overlay_event(uid, plant, event))
+        self.coordinator.async_update_listeners()
+
+    async def async_delete_event(
+        self,
+        uid: str,
+        recurrence_id: str | None = None,
+        recurrence_range: str | None = None,
+    ) -> None:
+        """Cancel a generated task, or delete an added event."""
+        self._edited_plant(uid)
+        if self._is_generated(uid):
+            self.coordinator.overlay.async_cancel(uid)
+        else:
+            self.coordinator.overlay.async_delete(uid)
+        self.coordinator.async_update_listeners()
+
+
+class _CachedEventMixin(ABC):
+    """Keep the current or next event until its next start or end boundary.
+
+    The calendar base class arms alarms at the start and end of the event
+    returned by ``event`` whenever state is written, so the event only has to
+    be looked up again once one of those boundaries has passed or the
+    coordinator reports a schedule change.
+    """
+
+    _cached_event: CalendarEvent | None = None
+    _cached_until: datetime | None = None
+
+    @property
+    def event(self) -> CalendarEvent | None:
+        """Return the current or next event."""
+        now = datetime.now()
+        if self._cached_until is None or now >= self._cached_until:
+            self._cached_event = self._find_event(now)
+            if self._cached_event is None:
+                self._cached_until = None
+            elif now < _event_start(self._cached_event):
+                self._cached_until = _event_start(self._cached_event)
+            else:
+                self._cached_until = _local_time(self._cached_event.end)
+        return self._cached_event
+
+    @abstractmethod
+    def _find_event(self, now: datetime) -> CalendarEvent | None:
+        """Return the event in progress, or the next one to start."""
+
+    async def _async_track_schedule(self) -> None:
+        """Invalidate the cached event whenever the coordinator's schedules change."""
+        self.async_on_remove(self.coordinator.async_add_listener(self._handle_schedule_update))
+
+    @callback
+    def _handle_schedule_update(self) -> None:
+        """Drop the cached event and write the new state."""
+        self._cached_until = None
+        self.async_write_ha_state()
+
+
+class OrchardCareCalendar(_EditableCalendarMixin, _CachedEventMixin, CalendarEntity):
     """Calendar entity for individual Orchard Care plants with smart reminders."""
 
     # Set this to ensure calendar is enabled by default
@@ -53,26 +351,22 @@ class OrchardCareCalendar(CalendarEntity):
         self._last_reminder_dates = {}
 
         # Set entity attributes for better organization
-        self._attr_unique_id = f"{DOMAIN}_{self.plant}_calendar"
+        self._attr_unique_id = f"{DOMAIN}_{config_entry.entry_id}_{self.plant}_calendar"
         self._attr_name = "Care Calendar"  # Will be combined with device name
         self._attr_available = True
 
     async def async_added_to_hass(self):
         """When entity is added to hass."""
         await super().async_added_to_hass()
+        await self._async_track_schedule()
 
         # Start reminder checking every hour
-        async_track_time_interval(
+        self.async_on_remove(async_track_time_interval(
             self.hass, self._check_reminders, timedelta(hours=1)
-        )
+        ))
 
-        # Check reminders on startup
-        if self.hass.is_running:
-            await self._check_reminders()
-        else:
-            self.hass.bus.async_listen_once(
-                EVENT_HOMEASSISTANT_STARTED, self._check_reminders
-            )
+        # The startup check runs in the background after the schedules are revalidated
+        self.coordinator.async_add_startup_scan(self._check_reminders)
 
     @property
     def unique_id(self):
@@ -89,254 +383,227 @@ class OrchardCareCalendar(CalendarEntity):
     def device_info(self):
         """Return device information."""
         return {
-            "identifiers": {(DOMAIN, self.plant)},
+            "identifiers": {(DOMAIN, f"{self.config_entry.entry_id}_{self.plant}")},
             "name": self.plant_data.get("name", self.plant.title()),
             "manufacturer": "Orchard Care",
             "model": "Fruit Tree/Berry Care",
             "sw_version": "1.0.0",
         }
 
-    @property
-    def event(self) -> CalendarEvent | None:
-        """Return the current or next event."""
-        now = datetime.now()
-        events = self._get_events(now, now + timedelta(days=7))
+    def _owns_plant(self, plant: str | None) -> bool:
+        """Return True for this calendar's plant."""
+        return plant == self.plant
 
-        # Return the most urgent event (closest to now)
-        if events:
-            return min(events, key=lambda x: abs((x.start - now).total_seconds()))
+    @property
+    def _added_plant(self) -> str:
+        """Return this calendar's plant."""
+        return self.plant
+
+    def _get_overlay_events(self, start_date: datetime, end_date: datetime) -> list[OverlayEvent]:
+        """Return this plant's edited and added events in a range."""
+        return [
+            event
+            for event in self.coordinator.overlay.events(start_date, end_date)
+            if event.plant == self.plant
+        ]
+
+    def _find_event(self, now: datetime) -> CalendarEvent | None:
+        """Return the event in progress, or the next one to start."""
+        for days in EVENT_SEARCH_DAYS:
+            start, end = now - EVENT_LOOKBACK, now + timedelta(days=days)
+            state = self._query_state(start, end)
+            occurrences = [
+                occurrence
+                for occurrence in self._get_occurrences(start, end, state)
+                if _occurrence_end(occurrence) > now
+            ]
+            edited = next((event for event in state.overlay_events if event.end > now), None)
+            # Render only the winning record
+            if occurrences:
+                occurrence = min(occurrences, key=lambda x: x.start)
+                if edited is None or occurrence.start <= edited.start:
+                    return self._render_event(occurrence, state)
+            if edited is not None:
+                return _render_overlay_event(edited)
         return None
 
     async def async_get_events(
         self, hass: HomeAssistant, start_date: datetime, end_date: datetime
     ) -> list[CalendarEvent]:
         """Get all events in a specific time range."""
-        return self._get_events(start_date, end_date)
+        if not _is_large_query(start_date, end_date, 1):
+            return self._get_events(start_date, end_date)
+
+        # Long ranges are expanded off the loop from a state snapshot taken here.
+        # The user's events are merged once, so one running across a chunk
+        # boundary is not listed twice.
+        state = self._query_state(start_date, end_date, frozen=True)
+        expand = partial(self._get_events, state=replace(state, overlay_events=()))
+        events = await _async_expand_in_chunks(hass, expand, start_date, end_date)
+        return list(heapq.merge(
+            events, map(_render_overlay_event, state.overlay_events), key=_event_start
+        ))[:MAX_CALENDAR_EVENTS]
+
+    def _query_state(self, start_date: datetime, end_date: datetime, frozen: bool = False) -> _QueryState:
+        """Capture the coordinator state a query of this plant reads."""
+        coordinator = self.coordinator
+        plant_schedule = coordinator._data.get(self.plant, {})
+        conflicts: dict[datetime, list[str]] = {}
+        for conflict in coordinator.get_conflicts(self.plant):
+            conflicts.setdefault(conflict.date, []).append(conflict.message)
+        return _QueryState(
+            schedule=freeze_schedule(plant_schedule) if frozen else plant_schedule,
+            spray_products=tuple(plant_schedule.get("spray_products", ())[:3]),
+            location=coordinator.solar_location,
+            language=coordinator.language,
+            reminder_days={task: coordinator.get_reminder_days(task) for task in REMINDER_DAYS_OPTIONS},
+            max_reminder_days=coordinator.max_reminder_days,
+            replaced=coordinator.overlay.replaced,
+            # Tasks are looked up as far ahead as the longest reminder lead time
+            completed=coordinator.completions.completed_tasks(
+                self.plant, start_date, end_date + timedelta(days=coordinator.max_reminder_days)
+            ),
+            conflicts={day: tuple(messages) for day, messages in conflicts.items()},
+            irrigation=coordinator.irrigation_plan.get(self.plant),
+            overlay_events=tuple(self._get_overlay_events(start_date, end_date)),
+        )
 
-    def _get_events(self, start_date: datetime, end_date: datetime) -> list[CalendarEvent]:
+    def _get_events(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        state: _QueryState | None = None,
+    ) -> list[CalendarEvent]:
         """Generate care events for the specified date range with enhanced details."""
-        events = []
-
-        # Get the current plant schedule from coordinator
-        plant_schedule = self.coordinator._data.get(self.plant, {})
-
+        if state is None:
+            state = self._query_state(start_date, end_date)
+        # Both streams are in start order, so the user's edits merge in one pass
+        return list(heapq.merge(
+            (self._render_event(occurrence, state)
+             for occurrence in self._get_occurrences(start_date, end_date, state)),
+            map(_render_overlay_event, (
+                event for event in state.overlay_events if event.overlaps(start_date, end_date)
+            )),
+            key=_event_start,
+        ))
+
+    def _get_occurrences(
+        self, start_date: datetime, end_date: datetime, state: _QueryState
+    ) -> list[Occurrence]:
+        """Generate compact task and reminder records for a date range."""
+        plant_schedule = state.schedule
         if not plant_schedule:
             # If no schedule data yet, return empty list
-            return events
+            return []
+
+        # One lookup widened by the longest lead time also finds the tasks whose
+        # reminders fall inside the range even though the task itself does not
+        lookup_end = end_date + timedelta(days=state.max_reminder_days)
+        reminder_days = state.reminder_days
+        replaced = state.replaced
+        occurrences = []
+        for task_start, task in iter_occurrences(plant_schedule, start_date, lookup_end, state.location):
+            occurrence = Occurrence(self.plant, task, task_start)
+            # Moved, rewritten and cancelled tasks are shown as the user left them,
+            # without reminders
+            if replaced and occurrence.uid in replaced:
+                continue
+            if task_start <= end_date:
+                occurrences.append(occurrence)
+
+            # Completed tasks need no further reminders
+            if state.is_completed(occurrence):
+                continue
+            for lead_days in reminder_days[task]:
+                reminder = occurrence.reminder(lead_days)
+                if lead_days and start_date <= reminder.start <= end_date:
+                    occurrences.append(reminder)
+
+        # Irrigation is planned from the soil water balance, not the schedule
+        irrigation = state.irrigation
+        if irrigation and start_date <= irrigation[0] <= end_date:
+            occurrence = Occurrence(self.plant, TASK_IRRIGATION, irrigation[0])
+            if occurrence.uid not in replaced:
+                occurrences.append(occurrence)
+
+        return sorted(occurrences, key=lambda x: x.start)
 
-        # Generate pruning events with reminders
-        pruning_months = plant_schedule.get("pruning_months", [])
-        self._generate_pruning_events(events, pruning_months, start_date, end_date)
-
-        # Generate spray events with weather considerations
-        spray_months = plant_schedule.get("spray_months", [])
-        spray_products = plant_schedule.get("spray_products", [])
-        self._generate_spray_events(events, spray_months, spray_products, start_date, end_date)
-
-        # Generate reminder events (1 week and 3 days before)
-        self._generate_reminder_events(events, start_date, end_date)
-
-        return sorted(events, key=lambda x: x.start)
-
-    def _generate_pruning_events(
-        self,
-        events: List[CalendarEvent],
-        pruning_months: List[int],
-        start_date: datetime,
-        end_date: datetime
-    ) -> None:
-        """Generate pruning events with detailed information."""
-        if not pruning_months:
-            return
-
-        for year in range(start_date.year, end_date.year + 2):
-            for month in pruning_months:
-                try:
-                    # Main pruning event (mid-month)
-                    event_date = datetime(year, month, 15, 9, 0)  # 9 AM
-                    if start_date <= event_date <= end_date:
-                        plant_name = self.plant_data.get('name', self.plant.title())
-                        care_notes = self.plant_data.get('care_notes', '')
-
-                        # Enhanced description with tips
-                        description = self._get_pruning_description(plant_name, care_notes, month)
-
-                        events.append(CalendarEvent(
-                            start=event_date,
-                            end=event_date + timedelta(hours=3),
-                            summary=f"🌳 Prune {plant_name}",
-                            description=description,
-                            location="Orchard/Garden"
-                        ))
-                except ValueError:
-                    # Handle invalid date (e.g., month 13)
-                    continue
-
-    def _generate_spray_events(
-        self,
-        events: List[CalendarEvent],
-        spray_months: List[int],
-        spray_products: List[str],
-        start_date: datetime,
-        end_date: datetime
-    ) -> None:
-        """Generate spray events with product recommendations."""
-        if not spray_months:
-            return
-
-        organic_pref = self.config_entry.data.get("organic_preference", True)
-
-        for year in range(start_date.year, end_date.year + 2):
-            for month in spray_months:
-                try:
-                    # Spray event (first week of month, weather permitting)
-                    event_date = datetime(year, month, 7, 7, 0)  # 7 AM (good spraying time)
-                    if start_date <= event_date <= end_date:
-                        plant_name = self.plant_data.get('name', self.plant.title())
-                        spray_type = "Organic" if organic_pref else "Conventional"
-
-                        # Enhanced description with weather and product info
-                        description = self._get_spray_description(
-                            plant_name, spray_type, spray_products, month
-                        )
-
-                        events.append(CalendarEvent(
-                            start=event_date,
-                            end=event_date + timedelta(hours=2),
-                            summary=f"🌿 Spray {plant_name} ({spray_type})",
-                            description=description,
-                            location="Orchard/Garden"
-                        ))
-                except ValueError:
-                    # Handle invalid date
-                    continue
-
-    def _generate_reminder_events(
-        self,
-        events: List[CalendarEvent],
-        start_date: datetime,
-        end_date: datetime
-    ) -> None:
-        """Generate reminder events for upcoming care tasks."""
-        main_events = [e for e in events if not e.summary.startswith("📅")]
-
-        for event in main_events:
-            # 1 week reminder
-            reminder_1w = event.start - timedelta(days=7)
-            if start_date <= reminder_1w <= end_date:
-                events.append(CalendarEvent(
-                    start=reminder_1w,
-                    end=reminder_1w + timedelta(minutes=15),
-                    summary=f"📅 Reminder: {event.summary} in 1 week",
-                    description=f"Prepare for upcoming care task: {event.description[:100]}...",
-                    location="Reminder"
-                ))
-
-            # 3 day reminder
-            reminder_3d = event.start - timedelta(days=3)
-            if start_date <= reminder_3d <= end_date:
-                events.append(CalendarEvent(
-                    start=reminder_3d,
-                    end=reminder_3d + timedelta(minutes=15),
-                    summary=f"📅 Reminder: {event.summary} in 3 days",
-                    description=f"Check weather and prepare materials for: {event.description[:100]}...",
-                    location="Reminder"
-                ))
-
-    def _get_pruning_description(self, plant_name: str, care_notes: str, month: int) -> str:
-        """Get detailed pruning description with seasonal tips."""
-        seasonal_tips = {
-            12: "Dormant season pruning - trees are fully dormant. Best time for major structural work.",
-            1: "Peak dormant season - ideal pruning conditions. Wounds heal quickly in spring.",
-            2: "Late dormant season - complete pruning before buds break. Last chance for major cuts.",
-            6: "Summer pruning - active growth period. Light pruning only, avoid heavy cuts.",
-            7: "Mid-summer pruning - good for stone fruits. Reduces disease risk.",
-            8: "Late summer pruning - healing time before winter. Focus on dead/diseased wood."
-        }
-
-        tip = seasonal_tips.get(month, "Follow seasonal pruning guidelines for your plant type.")
-
-        return f"""
-🌳 PRUNING TASK: {plant_name}
-
-📋 Care Notes: {care_notes}
-
-🕐 Best Time: Early morning when cool
-🌡️ Temperature: Above freezing, dry conditions
-🛠️ Tools Needed: Clean, sharp pruning shears, loppers, saw (if needed)
-
-💡 Seasonal Tip: {tip}
-
-✅ Checklist:
-• Check weather forecast (avoid rain for 24-48hrs)
-• Sanitize tools with rubbing alcohol
-• Remove dead, diseased, damaged wood first
-• Thin overcrowded branches
-• Make clean cuts at 45° angle above buds
-• Apply wound sealant if cuts are large (>2 inches)
-
-⚠️ Safety: Wear gloves and eye protection. Be aware of power lines.
-        """.strip()
+    @property
+    def _spray_type(self) -> str:
+        """Return the spray program shown on events."""
+        organic_pref = self.coordinator.get_option("organic_preference", True)
+        return "Organic" if organic_pref else "Conventional"
+
+    def _task_summary(self, occurrence: Occurrence, state: _QueryState) -> str:
+        """Return the summary of the task behind an occurrence."""
+        summary = get_task_summary(state.language, self.plant, occurrence.task, self._spray_type)
+        if occurrence.task != TASK_SPRAY:
+            return summary
+        if occurrence.task_start in state.conflicts:
+            summary = f"⚠️ {summary}"
+        return summary
+
+    def _render_event(self, occurrence: Occurrence, state: _QueryState) -> CalendarEvent:
+        """Render a record into a calendar event, sharing memoized descriptions."""
+        language = state.language
+        task_start = occurrence.task_start
+        summary = self._task_summary(occurrence, state)
+
+        if occurrence.is_reminder:
+            start = occurrence.start
+            return CalendarEvent(
+                start=start,
+                end=start + REMINDER_DURATION,
+                summary=get_reminder_summary(language, summary, occurrence.lead_days),
+                description=get_reminder_description(
+                    language, self.plant, occurrence.task, task_start.month, self._spray_type,
+                    state.spray_products, occurrence.lead_days
+                ),
+                location="Reminder"
+            )
 
-    def _get_spray_description(
-        self,
-        plant_name: str,
-        spray_type: str,
-        products: List[str],
-        month: int
-    ) -> str:
-        """Get detailed spray description with weather and product info."""
-        weather_conditions = """
-🌤️ IDEAL CONDITIONS:
-• Temperature: 60-80°F (15-27°C)
-• Wind: Less than 10 mph
-• Humidity: 40-70%
-• No rain expected for 4-6 hours
-• Early morning or evening application
-        """.strip()
-
-        products_text = ", ".join(products[:3]) if products else "See care guide for recommendations"
-
-        return f"""
-🌿 SPRAY TREATMENT: {plant_name} ({spray_type})
-
-📦 Recommended Products: {products_text}
-
-{weather_conditions}
-
-✅ Pre-Spray Checklist:
-• Check weather forecast
-• Inspect plant for beneficial insects
-• Ensure calm wind conditions
-• Mix chemicals according to label
-• Wear appropriate PPE
-
-🎯 Application Tips:
-• Cover all leaf surfaces (top and bottom)
-• Spray early morning or late evening
-• Avoid spraying during bloom (protect pollinators)
-• Keep pets and children away during application
-• Clean equipment thoroughly after use
-
-📱 Weather Check: Monitor conditions 24hrs before spraying
-⚠️ Safety: Always read and follow product labels
-        """.strip()
+        if occurrence.task == TASK_IRRIGATION:
+            amount = (state.irrigation or (None, 0.0))[1]
+            description = get_irrigation_description(language, self.plant, amount)
+        else:
+            description = get_task_description(
+                language, self.plant, occurrence.task, task_start.month, self._spray_type,
+                state.spray_products,
+            )
+        if occurrence.task == TASK_SPRAY:
+            # Flag label-interval and rotation problems on the event itself
+            conflicts = state.conflicts.get(task_start)
+            if conflicts:
+                description = get_spray_warnings(language, list(conflicts), description)
+
+        return CalendarEvent(
+            start=task_start,
+            end=task_start + TASK_DURATIONS[occurrence.task],
+            summary=summary,
+            description=description,
+            location="Orchard/Garden",
+            uid=occurrence.uid,
+        )
 
     @callback
     async def _check_reminders(self, now=None):
         """Check for upcoming events and send notifications."""
-        if now is None:
+        # Timers pass an aware time; the schedules use naive local times
+        if now is None or now.tzinfo is not None:
             now = datetime.now()
 
-        # Get events for the next 14 days
-        upcoming_events = self._get_events(now, now + timedelta(days=14))
+        # Notify on the configured lead days and on the day of the task itself
+        end = now + timedelta(days=self.coordinator.max_reminder_days + 1)
+        state = self._query_state(now, end)
 
-        for event in upcoming_events:
-            days_until = (event.start.date() - now.date()).days
+        for occurrence in self._get_occurrences(now, end, state):
+            days_until = (occurrence.start.date() - now.date()).days
 
-            # Send notifications for care tasks (not reminders)
-            if not event.summary.startswith("📅") and days_until in [7, 3, 1, 0]:
-                await self._send_care_notification(event, days_until)
+            # Send notifications for care tasks (not reminders) still to be done
+            if occurrence.is_reminder or state.is_completed(occurrence):
+                continue
+            if days_until == 0 or days_until in state.reminder_days.get(occurrence.task, ()):
+                await self._send_care_notification(self._render_event(occurrence, state), days_until)
 
     async def _send_care_notification(self, event: CalendarEvent, days_until: int):
         """Send notification for upcoming care task."""
@@ -349,32 +616,21 @@ class OrchardCareCalendar(CalendarEntity):
         self._last_reminder_dates[event_key] = datetime.now()
 
         # Create notification based on urgency
-        if days_until == 0:
-            urgency = "🚨 TODAY"
-            message = f"Today is the day for: {event.summary}"
-        elif days_until == 1:
-            urgency = "⏰ TOMORROW"
-            message = f"Don't forget: {event.summary} is tomorrow"
-        elif days_until == 3:
-            urgency = "📅 3 DAYS"
-            message = f"Coming up: {event.summary} in 3 days"
-        else:
-            urgency = "📅 1 WEEK"
-            message = f"Plan ahead: {event.summary} in 1 week"
+        title, message = get_notification(self.coordinator.language, days_until, event.summary)
 
         # Send to Home Assistant notification service
         await self.hass.services.async_call(
             "persistent_notification",
             "create",
             {
-                "title": f"{urgency} - Orchard Care",
+                "title": title,
                 "message": message,
                 "notification_id": f"orchard_care_{event_key}",
             },
         )
 
 
-class OrchardCareMasterCalendar(CalendarEntity):
+class OrchardCareMasterCalendar(_EditableCalendarMixin, _CachedEventMixin, CalendarEntity):
     """Master calendar combining all orchard care plants."""
 
     # Set this to ensure calendar is enabled by default
@@ -387,10 +643,13 @@ class OrchardCareMasterCalendar(CalendarEntity):
         """Initialize the master calendar."""
         self.coordinator = coordinator
         self.config_entry = config_entry
-        self.selected_plants = config_entry.data.get("selected_plants", [])
+        self.selected_plants = coordinator.get_option("selected_plants", [])
+        self._plant_calendars = [
+            OrchardCareCalendar(coordinator, plant, config_entry) for plant in self.selected_plants
+        ]
 
         # Set entity attributes
-        self._attr_unique_id = f"{DOMAIN}_master_calendar"
+        self._attr_unique_id = f"{DOMAIN}_{config_entry.entry_id}_master_calendar"
         self._attr_name = "Orchard Care - All Plants"
         self._attr_available = True
 
@@ -408,37 +667,149 @@ class OrchardCareMasterCalendar(CalendarEntity):
     def device_info(self):
         """Return device information."""
         return {
-            "identifiers": {(DOMAIN, "master")},
+            "identifiers": {(DOMAIN, f"{self.config_entry.entry_id}_master")},
             "name": "Orchard Care Master",
             "manufacturer": "Orchard Care",
             "model": "All Plants Combined",
             "sw_version": "1.0.0",
         }
 
-    @property
-    def event(self) -> CalendarEvent | None:
-        """Return the most urgent event across all plants."""
-        now = datetime.now()
-        all_events = []
+    async def async_added_to_hass(self):
+        """When entity is added to hass."""
+        await super().async_added_to_hass()
+        await self._async_track_schedule()
 
-        for plant in self.selected_plants:
-            plant_calendar = OrchardCareCalendar(self.coordinator, plant, self.config_entry)
-            events = plant_calendar._get_events(now, now + timedelta(days=30))
-            all_events.extend(events)
+    def _owns_plant(self, plant: str | None) -> bool:
+        """Return True for orchard-wide events and the selected plants."""
+        return plant is None or plant in self.selected_plants
 
-        if all_events:
-            return min(all_events, key=lambda x: abs((x.start - now).total_seconds()))
+    @property
+    def _added_plant(self) -> None:
+        """Events added here are orchard-wide."""
+        return None
+
+    def _get_overlay_events(self, start_date: datetime, end_date: datetime) -> list[OverlayEvent]:
+        """Return the orchard-wide events the user added in a range."""
+        return [
+            event
+            for event in self.coordinator.overlay.events(start_date, end_date)
+            if event.plant is None
+        ]
+
+    def _find_event(self, now: datetime) -> CalendarEvent | None:
+        """Return the event in progress, or the next one to start, across all plants."""
+        for days in EVENT_SEARCH_DAYS:
+            start, end = now - EVENT_LOOKBACK, now + timedelta(days=days)
+            best = None
+
+            for event in self._get_tank_mix_events(start, end):
+                if event.end > now and (best is None or event.start < _event_start(best)):
+                    best = event
+
+            for edited in self.coordinator.overlay.events(start, end):
+                if edited.end > now and self._owns_plant(edited.plant):
+                    if best is None or edited.start < _event_start(best):
+                        best = _render_overlay_event(edited)
+                    break
+
+            # Compare compact records first and render only the winning one
+            batched = self._batched_spray_ids(start, end)
+            best_occurrence = None
+            for plant_calendar in self._plant_calendars:
+                state = plant_calendar._query_state(start, end)
+                for occurrence in plant_calendar._get_occurrences(start, end, state):
+                    if _occurrence_end(occurrence) <= now:
+                        continue
+                    if batched and not occurrence.is_reminder and occurrence.uid in batched:
+                        continue
+                    if best_occurrence is None or occurrence.start < best_occurrence[2].start:
+                        best_occurrence = (plant_calendar, state, occurrence)
+
+            if best_occurrence is not None:
+                plant_calendar, state, occurrence = best_occurrence
+                if best is None or occurrence.start < _event_start(best):
+                    best = plant_calendar._render_event(occurrence, state)
+            if best is not None:
+                return best
         return None
 
     async def async_get_events(
         self, hass: HomeAssistant, start_date: datetime, end_date: datetime
     ) -> list[CalendarEvent]:
         """Get all events from all plants."""
-        all_events = []
+        all_events = self._get_tank_mix_events(start_date, end_date)
+        all_events.extend(map(_render_overlay_event, self._get_overlay_events(start_date, end_date)))
+        batched = self._batched_spray_ids(start_date, end_date)
+
+        if _is_large_query(start_date, end_date, len(self.selected_plants)):
+            snapshots = []
+            for plant_calendar in self._plant_calendars:
+                state = plant_calendar._query_state(start_date, end_date, frozen=True)
+                # Each plant's edits are listed once rather than once per chunk
+                all_events.extend(map(_render_overlay_event, state.overlay_events))
+                snapshots.append((plant_calendar, replace(state, overlay_events=())))
+
+            def expand(chunk_start: datetime, chunk_end: datetime) -> list[CalendarEvent]:
+                """Expand one chunk for every plant."""
+                events = []
+                for plant_calendar, state in snapshots:
+                    events.extend(
+                        event
+                        for event in plant_calendar._get_events(chunk_start, chunk_end, state)
+                        if event.uid not in batched
+                    )
+                return events
+
+            all_events.extend(await _async_expand_in_chunks(hass, expand, start_date, end_date))
+            return sorted(all_events, key=_event_start)[:MAX_CALENDAR_EVENTS]
+
+        for plant_calendar in self._plant_calendars:
+            all_events.extend(
+                event
+                for event in plant_calendar._get_events(start_date, end_date)
+                if event.uid not in batched
+            )
 
-        for plant in self.selected_plants:
-            plant_calendar = OrchardCareCalendar(self.coordinator, plant, self.config_entry)
-            events = plant_calendar._get_events(start_date, end_date)
-            all_events.extend(events)
+        return sorted(all_events, key=_event_start)
+
+    def _replaced_sprays(self) -> frozenset[tuple[str, date]]:
+        """Return the (plant, day) sprays the user cancelled or moved out of their jobs."""
+        sprays = set()
+        for uid in self.coordinator.overlay.replaced:
+            parsed = parse_occurrence_id(uid)
+            if parsed is not None and parsed[1] == TASK_SPRAY:
+                sprays.add((parsed[0], parsed[2]))
+        return frozenset(sprays)
+
+    def _batched_spray_ids(self, start_date: datetime, end_date: datetime) -> frozenset[str]:
+        """Return the ids of plant sprays done entirely by the listed tank-mix jobs.
+
+        Sprays the user moved or cancelled have left their jobs, so they are
+        never batched.
+        """
+        return frozenset(
+            occurrence_id(plant, TASK_SPRAY, datetime.combine(day, time()))
+            for plant, day in self.coordinator.tank_mix.covered_sprays(
+                start_date, end_date, self._replaced_sprays()
+            )
+        )
 
-        return sorted(all_events, key=lambda x: x.start)
\ No newline at end of file
+    def _get_tank_mix_events(self, start_date: datetime, end_date: datetime) -> list[CalendarEvent]:
+        """Generate one event per combined tank-mix job."""
+        events = []
+        for job in self.coordinator.tank_mix.jobs(start_date, end_date, self._replaced_sprays()):
+            names = [
+                PLANT_CARE_DATA.get(plant, {}).get("name", plant.title())
+                for plant in sorted(job.plantings)
+            ]
+            events.append(CalendarEvent(
+                start=job.start,
+                end=job.start + timedelta(hours=SPRAY_DURATION_HOURS),
+                summary=f"🧪 Tank Mix: {job.product} ({len(names)} plantings)",
+                description=(
+                    f"Mix one batch of {job.product} and spray: {', '.join(names)}.\n"
+                    "Check label rates for each crop before mixing."
+                ),
+                location="Orchard/Garden"
+            ))
+        return events
\ No newline at end of file
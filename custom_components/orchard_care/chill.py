@@ -0,0 +1,216 @@
+"""Winter chill accumulation for the Orchard Care integration."""
+import math
+from collections import deque
+from datetime import date, datetime, timedelta
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+
+from .const import CHILL_SEASON_START_MONTH, CHILL_WINDOW_DAYS, DOMAIN
+
+STORAGE_VERSION = 1
+# One sample arrives per hour; a lost hour is cheaper than a write per sample
+SAVE_DELAY = 300
+
+# Totals kept per model: Weinberger chill hours, Utah chill units, Dynamic chill portions
+CHILL_MODELS = ("hours", "units", "portions")
+# Dormancy is judged by the Dynamic model, which copes best with warm winters
+GUIDANCE_MODEL = "portions"
+
+CHILL_HOUR_THRESHOLD = 7.2
+
+# Utah model weights as (upper temperature bound in °C, chill units)
+_UTAH_WEIGHTS = (
+    (1.4, 0.0),
+    (2.4, 0.5),
+    (9.1, 1.0),
+    (12.4, 0.5),
+    (15.9, 0.0),
+    (18.0, -0.5),
+)
+
+# Dynamic model constants (Fishman et al., 1987)
+_E0 = 4153.5
+_E1 = 12888.8
+_A0 = 1.395e5
+_A1 = 2.567e18
+_SLOPE = 1.6
+_TETMLT = 277.0
+
+
+def utah_units(temperature: float) -> float:
+    """Return the Utah chill units of one hour at a temperature."""
+    for upper, units in _UTAH_WEIGHTS:
+        if temperature <= upper:
+            return units
+    return -1.0
+
+
+def dynamic_step(intermediate: float, temperature: float) -> tuple[float, float]:
+    """Advance the Dynamic model by one hour.
+
+    Returns the new intermediate product and the chill portion fixed during
+    the hour.
+    """
+    kelvin = temperature + 273.0
+    transition = _SLOPE * _TETMLT * (kelvin - _TETMLT) / kelvin
+    fixed_share = 1 / (1 + math.exp(-transition))
+    equilibrium = _A0 / _A1 * math.exp((_E1 - _E0) / kelvin)
+    rate = _A1 * math.exp(-_E1 / kelvin)
+
+    intermediate = equilibrium - (equilibrium - intermediate) * math.exp(-rate)
+    if intermediate < 1:
+        return intermediate, 0.0
+    portion = intermediate * fixed_share
+    return intermediate - portion, portion
+
+
+def season_start(day: date, hemisphere: str) -> date:
+    """Return the first day of the chill season containing a day."""
+    month = CHILL_SEASON_START_MONTH
+    if hemisphere == "southern":
+        month = (month + 5) % 12 + 1
+    start = date(day.year, month, 1)
+    return start if day >= start else date(day.year - 1, month, 1)
+
+
+class ChillAccumulator:
+    """Season-to-date chill under the Weinberger, Utah and Dynamic models.
+
+    Each hourly sample updates all three models in one pass. The last
+    CHILL_WINDOW_DAYS of hourly accruals sit in a fixed-size ring buffer with
+    running sums, so the recent chill rate used for projections costs O(1)
+    per sample. State is stored so a restart resumes mid-season.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry_id: str,
+        schedules: dict[str, dict[str, Any]],
+        hemisphere: str,
+    ) -> None:
+        """Initialize the accumulator for the coordinator's planting schedules."""
+        self.schedules = schedules
+        self.hemisphere = hemisphere
+        self.season: date = season_start(date.today(), hemisphere)
+        self.totals = dict.fromkeys(CHILL_MODELS, 0.0)
+        self.intermediate = 0.0
+        self.last_sample: datetime | None = None
+        self.satisfied: dict[str, date] = {}
+        self.window: deque[tuple[float, float, float]] = deque(maxlen=CHILL_WINDOW_DAYS * 24)
+        self._window_totals = [0.0, 0.0, 0.0]
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}.chill"
+        )
+
+    async def async_load(self) -> None:
+        """Restore the season totals and the recent accruals."""
+        data = await self._store.async_load()
+        if not data:
+            return
+        self.season = date.fromisoformat(data["season"])
+        self.totals.update(data["totals"])
+        self.intermediate = data["intermediate"]
+        if data.get("last_sample"):
+            self.last_sample = datetime.fromisoformat(data["last_sample"])
+        self.satisfied = {
+            plant: date.fromisoformat(day) for plant, day in data.get("satisfied", {}).items()
+        }
+        for accrual in data.get("window", []):
+            self._push(tuple(accrual))
+
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the accumulator state for storage."""
+        return {
+            "season": self.season.isoformat(),
+            "totals": self.totals,
+            "intermediate": self.intermediate,
+            "last_sample": self.last_sample.isoformat() if self.last_sample else None,
+            "satisfied": {plant: day.isoformat() for plant, day in self.satisfied.items()},
+            "window": list(self.window),
+        }
+
+    def _push(self, accrual: tuple[float, float, float]) -> None:
+        """Add an hour to the ring buffer, dropping the oldest when it is full."""
+        if len(self.window) == self.window.maxlen:
+            for index, value in enumerate(self.window[0]):
+                self._window_totals[index] -= value
+        self.window.append(accrual)
+        for index, value in enumerate(accrual):
+            self._window_totals[index] += value
+
+    def add_sample(self, temperature: float, at: datetime) -> bool:
+        """Accrue one hourly sample; return False for a repeated hour."""
+        hour = at.replace(minute=0, second=0, microsecond=0)
+        if self.last_sample is not None and hour <= self.last_sample:
+            return False
+        self.last_sample = hour
+
+        season = season_start(hour.date(), self.hemisphere)
+        if season != self.season:
+            self.season = season
+            self.totals = dict.fromkeys(CHILL_MODELS, 0.0)
+            self.intermediate = 0.0
+            self.satisfied = {}
+
+        hours = 1.0 if temperature < CHILL_HOUR_THRESHOLD else 0.0
+        units = utah_units(temperature)
+        self.intermediate, portions = dynamic_step(self.intermediate, temperature)
+        self._push((hours, units, portions))
+
+        self.totals["hours"] += hours
+        # Warm spells undo Utah chill, but never below the start of the season
+        self.totals["units"] = max(self.totals["units"] + units, 0.0)
+        self.totals["portions"] += portions
+
+        for plant, schedule in self.schedules.items():
+            required = (schedule.get("chill_requirement") or {}).get(GUIDANCE_MODEL)
+            if required and plant not in self.satisfied and self.totals[GUIDANCE_MODEL] >= required:
+                self.satisfied[plant] = hour.date()
+
+        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+        return True
+
+    def daily_rate(self, model: str = GUIDANCE_MODEL) -> float | None:
+        """Return the mean daily accrual over the ring buffer."""
+        if not self.window:
+            return None
+        return self._window_totals[CHILL_MODELS.index(model)] * 24 / len(self.window)
+
+    def status(self, plant: str, today: date) -> dict[str, Any] | None:
+        """Return a planting's chill progress and late-pruning guidance."""
+        schedule = self.schedules.get(plant, {})
+        requirement = schedule.get("chill_requirement")
+        if not requirement:
+            return None
+
+        required = requirement[GUIDANCE_MODEL]
+        progress = min(self.totals[GUIDANCE_MODEL] / required, 1.0)
+        satisfied_on = self.satisfied.get(plant)
+        projected = None
+        if satisfied_on is None:
+            rate = self.daily_rate()
+            if rate:
+                remaining = required - self.totals[GUIDANCE_MODEL]
+                projected = today + timedelta(days=math.ceil(remaining / rate))
+
+        if satisfied_on is not None:
+            guidance = f"Chill requirement met on {satisfied_on:%B} {satisfied_on.day}; finish pruning before bud break"
+        elif projected is not None:
+            guidance = f"Chill {progress:.0%} complete; hold late pruning until about {projected:%B} {projected.day}"
+        else:
+            guidance = f"Chill {progress:.0%} complete; hold late pruning until the requirement is met"
+
+        return {
+            "season_start": self.season,
+            "chill_hours": round(self.totals["hours"]),
+            "chill_units": round(self.totals["units"], 1),
+            "chill_portions": round(self.totals["portions"], 1),
+            "required": requirement,
+            "progress": round(progress * 100, 1),
+            "satisfied": satisfied_on is not None,
+            "late_pruning_from": satisfied_on or projected,
+            "guidance": guidance,
+        }
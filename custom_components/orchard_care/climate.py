@@ -0,0 +1,164 @@
+"""Climate-zone season adjustments for the Orchard Care integration.
+
+The catalog months describe a temperate northern site. A climate zone shifts
+each task's window earlier or later and stretches or shortens it, before the
+hemisphere shift is applied.
+"""
+from dataclasses import dataclass
+
+from .const import (
+    CLIMATE_ZONE_AUTO,
+    CLIMATE_ZONE_CONTINENTAL,
+    CLIMATE_ZONE_MEDITERRANEAN,
+    CLIMATE_ZONE_SUBARCTIC,
+    CLIMATE_ZONE_SUBTROPICAL,
+    CLIMATE_ZONE_TEMPERATE,
+    CLIMATE_ZONE_TROPICAL,
+    CLIMATE_ZONES,
+    TASK_HARVEST,
+    TASK_PRUNING,
+    TASK_SPRAY,
+)
+
+
+@dataclass(frozen=True, slots=True)
+class SeasonAdjustment:
+    """How one task's window moves in a zone, in whole months."""
+
+    offset: int = 0
+    stretch: int = 0
+
+
+_NO_ADJUSTMENT = SeasonAdjustment()
+
+# Warmer zones start the season earlier and keep it going longer; colder
+# zones start later and have less time for it
+ZONE_ADJUSTMENTS: dict[str, dict[str, SeasonAdjustment]] = {
+    CLIMATE_ZONE_TROPICAL: {
+        TASK_PRUNING: SeasonAdjustment(offset=-1, stretch=-1),
+        TASK_SPRAY: SeasonAdjustment(offset=-2, stretch=2),
+        TASK_HARVEST: SeasonAdjustment(offset=-1, stretch=1),
+    },
+    CLIMATE_ZONE_SUBTROPICAL: {
+        TASK_PRUNING: SeasonAdjustment(offset=-1),
+        TASK_SPRAY: SeasonAdjustment(offset=-1, stretch=1),
+        TASK_HARVEST: SeasonAdjustment(offset=-1, stretch=1),
+    },
+    CLIMATE_ZONE_MEDITERRANEAN: {
+        TASK_SPRAY: SeasonAdjustment(offset=-1, stretch=1),
+        TASK_HARVEST: SeasonAdjustment(offset=-1),
+    },
+    CLIMATE_ZONE_TEMPERATE: {},
+    CLIMATE_ZONE_CONTINENTAL: {
+        TASK_PRUNING: SeasonAdjustment(offset=1),
+        TASK_SPRAY: SeasonAdjustment(offset=1),
+    },
+    CLIMATE_ZONE_SUBARCTIC: {
+        TASK_PRUNING: SeasonAdjustment(offset=1, stretch=-1),
+        TASK_SPRAY: SeasonAdjustment(offset=1, stretch=-1),
+        TASK_HARVEST: SeasonAdjustment(stretch=-1),
+    },
+}
+
+# Upper absolute latitude of each band, compiled below into one entry per degree
+_LATITUDE_BANDS = (
+    (23, CLIMATE_ZONE_TROPICAL),
+    (30, CLIMATE_ZONE_SUBTROPICAL),
+    (40, CLIMATE_ZONE_MEDITERRANEAN),
+    (50, CLIMATE_ZONE_TEMPERATE),
+    (60, CLIMATE_ZONE_CONTINENTAL),
+    (90, CLIMATE_ZONE_SUBARCTIC),
+)
+_LATITUDE_ZONES = tuple(
+    next(zone for upper, zone in _LATITUDE_BANDS if degree < upper or upper == 90)
+    for degree in range(91)
+)
+
+_KOPPEN_ZONES = {
+    **dict.fromkeys(("Af", "Am", "Aw", "As"), CLIMATE_ZONE_TROPICAL),
+    **dict.fromkeys(("BWh", "BSh", "Cwa", "Cwb", "Cfa"), CLIMATE_ZONE_SUBTROPICAL),
+    **dict.fromkeys(("Csa", "Csb", "Csc"), CLIMATE_ZONE_MEDITERRANEAN),
+    **dict.fromkeys(("Cfb", "Cfc", "Cwc"), CLIMATE_ZONE_TEMPERATE),
+    **dict.fromkeys(
+        ("BWk", "BSk", "Dfa", "Dfb", "Dsa", "Dsb", "Dwa", "Dwb"), CLIMATE_ZONE_CONTINENTAL
+    ),
+    **dict.fromkeys(
+        ("Dfc", "Dfd", "Dsc", "Dsd", "Dwc", "Dwd", "ET", "EF"), CLIMATE_ZONE_SUBARCTIC
+    ),
+}
+
+# USDA hardiness zones by number; the a/b half zone does not change the season
+_USDA_ZONES = {
+    **dict.fromkeys(("1", "2", "3"), CLIMATE_ZONE_SUBARCTIC),
+    **dict.fromkeys(("4", "5"), CLIMATE_ZONE_CONTINENTAL),
+    **dict.fromkeys(("6", "7"), CLIMATE_ZONE_TEMPERATE),
+    "8": CLIMATE_ZONE_MEDITERRANEAN,
+    **dict.fromkeys(("9", "10"), CLIMATE_ZONE_SUBTROPICAL),
+    **dict.fromkeys(("11", "12", "13"), CLIMATE_ZONE_TROPICAL),
+}
+
+# Every accepted setting, compiled into a single lookup
+ZONE_CODES: dict[str, str] = {
+    **{zone: zone for zone in CLIMATE_ZONES},
+    **{code.lower(): zone for code, zone in _KOPPEN_ZONES.items()},
+    **_USDA_ZONES,
+    **{f"{number}{half}": zone for number, zone in _USDA_ZONES.items() for half in "ab"},
+}
+
+
+def parse_zone(setting: str) -> str | None:
+    """Return the zone of a zone name, Köppen code or USDA zone, or None."""
+    return ZONE_CODES.get(setting.strip().lower())
+
+
+def zone_for_site(setting: str | None, latitude: float | None) -> str | None:
+    """Return a site's climate zone, or None to use the catalog months as is.
+
+    "auto" maps the site latitude to a zone; any other setting is looked up
+    in the zone table. Settings are matched regardless of case and padding.
+    """
+    setting = (setting or "").strip().lower()
+    if not setting:
+        return None
+    if setting == CLIMATE_ZONE_AUTO:
+        if latitude is None:
+            return None
+        return _LATITUDE_ZONES[min(int(abs(latitude)), 90)]
+    return parse_zone(setting)
+
+
+def adjust_months(months: list[int], adjustment: SeasonAdjustment) -> list[int]:
+    """Shift and stretch each run of consecutive months in a task window.
+
+    Stretching adds months to the end of a run and shortening drops them,
+    always keeping at least one month per run.
+    """
+    if not months or adjustment == _NO_ADJUSTMENT:
+        return list(months)
+
+    month_set = set(months)
+    if len(month_set) == 12:
+        return list(months)
+
+    adjusted: dict[int, None] = {}
+    for start in months:
+        # Runs are walked from their first month only
+        if (start - 2) % 12 + 1 in month_set:
+            continue
+        run = [start]
+        while run[-1] % 12 + 1 in month_set:
+            run.append(run[-1] % 12 + 1)
+        if adjustment.stretch > 0:
+            last = run[-1]
+            run.extend((last + step - 1) % 12 + 1 for step in range(1, adjustment.stretch + 1))
+        elif adjustment.stretch < 0:
+            run = run[:max(len(run) + adjustment.stretch, 1)]
+        adjusted.update(dict.fromkeys((month + adjustment.offset - 1) % 12 + 1 for month in run))
+    return list(adjusted)
+
+
+def zone_adjustment(zone: str | None, task: str) -> SeasonAdjustment:
+    """Return how a zone moves one task's window."""
+    if zone is None:
+        return _NO_ADJUSTMENT
+    return ZONE_ADJUSTMENTS[zone].get(task, _NO_ADJUSTMENT)
@@ -0,0 +1,142 @@
+"""Append-only task completion log for the Orchard Care integration."""
+import asyncio
+import json
+import logging
+import os
+from collections.abc import Iterator
+from datetime import date, datetime
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+# Rewrite the log once superseded lines outnumber live records by this much
+COMPACT_MIN_LINES = 200
+COMPACT_RATIO = 2
+
+type SeasonKey = tuple[str, int]
+type TaskKey = tuple[str, str]
+
+
+class CompletionLog:
+    """Completed care tasks, indexed by plant and season.
+
+    Changes are appended as JSON lines so a write never rewrites history; the
+    file is compacted to one line per live record once it grows too long.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Initialize the log."""
+        self.hass = hass
+        self.path = hass.config.path(".storage", f"{DOMAIN}.{entry_id}.completions.jsonl")
+        self._index: dict[SeasonKey, dict[TaskKey, dict[str, Any]]] = {}
+        self._lines = 0
+        # An append landing while compaction replaces the file would be lost
+        self._write_lock = asyncio.Lock()
+
+    @property
+    def record_count(self) -> int:
+        """Return the number of live completion records."""
+        return sum(len(records) for records in self._index.values())
+
+    async def async_load(self) -> None:
+        """Replay the log file into the in-memory index."""
+        lines = await self.hass.async_add_executor_job(self._read_lines)
+        for line in lines:
+            try:
+                self._apply(json.loads(line))
+            except (ValueError, KeyError, TypeError):
+                _LOGGER.warning("Skipping corrupt completion log line in %s", self.path)
+        self._lines = len(lines)
+        await self.async_compact_if_needed()
+
+    def _read_lines(self) -> list[str]:
+        """Read the raw log lines."""
+        if not os.path.exists(self.path):
+            return []
+        with open(self.path, encoding="utf-8") as log_file:
+            return [line for line in log_file if line.strip()]
+
+    def _apply(self, record: dict[str, Any]) -> None:
+        """Apply one log record to the index."""
+        season_key = (record["plant"], int(record["season"]))
+        task_key = (record["task"], record["date"])
+        if record.get("completed"):
+            self._index.setdefault(season_key, {})[task_key] = record
+        else:
+            records = self._index.get(season_key, {})
+            records.pop(task_key, None)
+            if not records:
+                self._index.pop(season_key, None)
+
+    async def async_set_completed(
+        self, plant: str, task: str, occurrence: date, completed: bool
+    ) -> None:
+        """Record that a task occurrence was completed or reopened."""
+        record = {
+            "plant": plant,
+            "task": task,
+            "date": occurrence.isoformat(),
+            "season": occurrence.year,
+            "completed": datetime.now().isoformat() if completed else None,
+        }
+        async with self._write_lock:
+            self._apply(record)
+            await self.hass.async_add_executor_job(self._append, json.dumps(record))
+            self._lines += 1
+        await self.async_compact_if_needed()
+
+    def _append(self, line: str) -> None:
+        """Append a line to the log file."""
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        with open(self.path, "a", encoding="utf-8") as log_file:
+            log_file.write(line + "\n")
+
+    async def async_compact_if_needed(self) -> None:
+        """Compact once superseded lines dominate the file."""
+        if self._lines >= COMPACT_MIN_LINES and self._lines > COMPACT_RATIO * self.record_count:
+            await self.async_compact()
+
+    async def async_compact(self) -> None:
+        """Rewrite the log with one line per live record."""
+        async with self._write_lock:
+            lines = [json.dumps(record) for record in self.iter_records()]
+            await self.hass.async_add_executor_job(self._rewrite, lines)
+            self._lines = len(lines)
+
+    def _rewrite(self, lines: list[str]) -> None:
+        """Atomically replace the log file."""
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        temp_path = f"{self.path}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as log_file:
+            log_file.writelines(line + "\n" for line in lines)
+        os.replace(temp_path, self.path)
+
+    def is_completed(self, plant: str, task: str, occurrence: date) -> bool:
+        """Return True when a task occurrence has been completed."""
+        records = self._index.get((plant, occurrence.year))
+        return bool(records) and (task, occurrence.isoformat()) in records
+
+    def completed_tasks(self, plant: str, first: date, last: date) -> frozenset[TaskKey]:
+        """Return the (task, date) keys of a plant's completed occurrences in a range of seasons.
+
+        Only the seasons of the first and last dates and those between are read.
+        """
+        return frozenset(
+            task_key
+            for season in range(first.year, last.year + 1)
+            for task_key in self._index.get((plant, season), ())
+        )
+
+    def iter_records(self) -> Iterator[dict[str, Any]]:
+        """Yield every live completion record."""
+        for records in self._index.values():
+            yield from records.values()
+
+    def season_records(self, plant: str, season: int) -> list[dict[str, Any]]:
+        """Return the completion records of one plant and season."""
+        records = self._index.get((plant, season), {})
+        return sorted(records.values(), key=lambda record: record["date"])
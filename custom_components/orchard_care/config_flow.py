@@ -1,26 +1,183 @@
 """Config flow for Orchard Care integration."""
+from abc import ABC, abstractmethod
+import math
+
 import voluptuous as vol
 from homeassistant import config_entries
 from homeassistant.core import callback
 from homeassistant.data_entry_flow import FlowResult
 import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers import selector
+
+from .climate import parse_zone
+from .const import (
+    CLIMATE_ZONE_AUTO,
+    CONF_CLIMATE_ZONE,
+    CONF_ENTITY_MODE,
+    CONF_HUMIDITY_SENSOR,
+    CONF_PRUNING_REMINDER_DAYS,
+    CONF_RAIN_SENSOR,
+    CONF_SENSOR_STATE,
+    CONF_SOLAR_RADIATION_SENSOR,
+    CONF_SPRAY_REMINDER_DAYS,
+    CONF_TEMPERATURE_SENSOR,
+    CONF_WIND_SPEED_SENSOR,
+    DEFAULT_REMINDER_DAYS,
+    DOMAIN,
+    ENTITY_MODE_PER_PLANT,
+    ENTITY_MODES,
+    MAX_REMINDER_DAYS,
+    PLANT_PAGE_SIZE,
+    REMINDER_DAYS_OPTIONS,
+    SENSOR_STATE_TEXT,
+    SENSOR_STATES,
+)
+from .plant_search import plant_index
+
+
+# Optional weather sensors feeding the irrigation engine, by sensor device class
+WEATHER_SENSOR_CLASSES = {
+    CONF_TEMPERATURE_SENSOR: "temperature",
+    CONF_HUMIDITY_SENSOR: "humidity",
+    CONF_WIND_SPEED_SENSOR: "wind_speed",
+    CONF_SOLAR_RADIATION_SENSOR: "irradiance",
+    CONF_RAIN_SENSOR: "precipitation",
+}
+
+
+def _weather_sensor_fields(current: dict | None = None) -> dict:
+    """Return the optional weather sensor fields, pre-filled from current settings."""
+    current = current or {}
+    return {
+        vol.Optional(
+            key, description={"suggested_value": current.get(key)}
+        ): selector.EntitySelector(
+            selector.EntitySelectorConfig(domain="sensor", device_class=device_class)
+        )
+        for key, device_class in WEATHER_SENSOR_CLASSES.items()
+    }
+
+
+def _format_reminder_days(days: list[int]) -> str:
+    """Return reminder lead times as the comma-separated form value."""
+    return ", ".join(str(day) for day in days)
+
+
+def _parse_reminder_days(user_input: dict) -> dict[str, str]:
+    """Convert the reminder lead-time fields to lists of days; return form errors."""
+    errors = {}
+    for key in REMINDER_DAYS_OPTIONS.values():
+        value = user_input.get(key, _format_reminder_days(DEFAULT_REMINDER_DAYS))
+        try:
+            days = sorted({int(part) for part in value.split(",") if part.strip()}, reverse=True)
+        except ValueError:
+            errors[key] = "invalid_reminder_days"
+            continue
+        if any(day < 1 or day > MAX_REMINDER_DAYS for day in days):
+            errors[key] = "invalid_reminder_days"
+            continue
+        user_input[key] = days
+    return errors
+
+
+def _validate_climate_zone(user_input: dict) -> dict[str, str]:
+    """Normalize the climate zone field; return form errors."""
+    zone = user_input.get(CONF_CLIMATE_ZONE, "").strip()
+    if zone and zone.lower() != CLIMATE_ZONE_AUTO and parse_zone(zone) is None:
+        return {CONF_CLIMATE_ZONE: "invalid_climate_zone"}
+    user_input[CONF_CLIMATE_ZONE] = zone
+    return {}
+
 
-from .const import DOMAIN, PLANT_TYPES
+PLANT_ACTION_DONE = "done"
+PLANT_ACTION_NEXT = "next_page"
+PLANT_ACTION_PREVIOUS = "previous_page"
+PLANT_ACTIONS = [PLANT_ACTION_DONE, PLANT_ACTION_NEXT, PLANT_ACTION_PREVIOUS]
 
-class OrchardCareConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
+
+class _PlantSelectionFlow(ABC):
+    """The paged, searchable plant step shared by the config and options flows.
+
+    Only the current page of matches is sent to the frontend. Plants chosen
+    on other pages or before a new search are kept in the flow.
+    """
+
+    _selected_plants: list[str]
+    _plant_query = ""
+    _plant_page = 0
+
+    async def async_step_plants(self, user_input=None) -> FlowResult:
+        """Search the catalog and pick plants a page at a time."""
+        index = plant_index()
+        if user_input is not None:
+            shown, total = index.page(self._plant_query, self._plant_page, PLANT_PAGE_SIZE)
+            chosen = set(user_input.get("selected_plants", []))
+            self._selected_plants = [
+                plant for plant in self._selected_plants if plant not in shown or plant in chosen
+            ] + [plant for plant in shown if plant in chosen and plant not in self._selected_plants]
+
+            query = user_input.get("search", "").strip()
+            action = user_input.get("action", PLANT_ACTION_DONE)
+            if query != self._plant_query:
+                self._plant_query, self._plant_page = query, 0
+            elif action == PLANT_ACTION_NEXT:
+                last_page = max(math.ceil(total / PLANT_PAGE_SIZE) - 1, 0)
+                self._plant_page = min(self._plant_page + 1, last_page)
+            elif action == PLANT_ACTION_PREVIOUS:
+                self._plant_page = max(self._plant_page - 1, 0)
+            else:
+                return self._async_plants_done()
+
+        shown, total = index.page(self._plant_query, self._plant_page, PLANT_PAGE_SIZE)
+        selected_names = [index.names.get(plant, plant) for plant in self._selected_plants]
+        return self.async_show_form(
+            step_id="plants",
+            data_schema=vol.Schema({
+                vol.Optional("search", description={"suggested_value": self._plant_query}): str,
+                vol.Optional(
+                    "selected_plants",
+                    default=[plant for plant in shown if plant in self._selected_plants],
+                ): cv.multi_select({plant: index.names[plant] for plant in shown}),
+                vol.Required("action", default=PLANT_ACTION_DONE): selector.SelectSelector(
+                    selector.SelectSelectorConfig(
+                        options=PLANT_ACTIONS, translation_key="plant_action"
+                    )
+                ),
+            }),
+            description_placeholders={
+                "selected": ", ".join(selected_names) or "-",
+                "matches": str(total),
+                "page": str(self._plant_page + 1),
+                "pages": str(max(math.ceil(total / PLANT_PAGE_SIZE), 1)),
+            },
+        )
+
+    @abstractmethod
+    def _async_plants_done(self) -> FlowResult:
+        """Finish the flow once the plants are chosen."""
+
+
+class OrchardCareConfigFlow(_PlantSelectionFlow, config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Orchard Care."""
 
     VERSION = 1
+    # 1.2 scoped unique IDs and device identifiers to the entry
+    MINOR_VERSION = 2
+
+    def __init__(self) -> None:
+        """Initialize the flow."""
+        self._data: dict = {}
+        self._selected_plants = []
 
     async def async_step_user(self, user_input=None) -> FlowResult:
         """Handle the initial step."""
         errors = {}
 
         if user_input is not None:
-            return self.async_create_entry(
-                title="Orchard Care",
-                data=user_input
-            )
+            errors = {**_parse_reminder_days(user_input), **_validate_climate_zone(user_input)}
+            if not errors:
+                self._data = user_input
+                return await self.async_step_plants()
 
         return self.async_show_form(
             step_id="user",
@@ -29,48 +186,103 @@ class OrchardCareConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                     "northern", "southern"
                 ]),
                 vol.Required("organic_preference", default=True): bool,
-                vol.Required("selected_plants", default=[]): cv.multi_select(PLANT_TYPES),
                 vol.Optional("custom_plants", default=""): str,
+                vol.Required(CONF_ENTITY_MODE, default=ENTITY_MODE_PER_PLANT): vol.In(ENTITY_MODES),
+                vol.Required(CONF_SENSOR_STATE, default=SENSOR_STATE_TEXT): vol.In(SENSOR_STATES),
+                vol.Optional(CONF_CLIMATE_ZONE, default=CLIMATE_ZONE_AUTO): str,
+                vol.Optional(
+                    CONF_PRUNING_REMINDER_DAYS, default=_format_reminder_days(DEFAULT_REMINDER_DAYS)
+                ): str,
+                vol.Optional(
+                    CONF_SPRAY_REMINDER_DAYS, default=_format_reminder_days(DEFAULT_REMINDER_DAYS)
+                ): str,
+                **_weather_sensor_fields(),
             }),
             errors=errors,
         )
 
+    def _async_plants_done(self) -> FlowResult:
+        """Create the entry with the chosen plants."""
+        return self.async_create_entry(
+            title="Orchard Care",
+            data={**self._data, "selected_plants": self._selected_plants},
+        )
+
     @staticmethod
     @callback
     def async_get_options_flow(config_entry):
         """Get the options flow for this handler."""
         return OrchardCareOptionsFlow(config_entry)
 
-class OrchardCareOptionsFlow(config_entries.OptionsFlow):
+class OrchardCareOptionsFlow(_PlantSelectionFlow, config_entries.OptionsFlow):
     """Handle options flow for Orchard Care."""
 
     def __init__(self, config_entry):
         """Initialize options flow."""
         self.config_entry = config_entry
+        self._options: dict = {}
+        # Saved options override the initial config, as in the coordinator
+        self._current = {**config_entry.data, **config_entry.options}
+        self._selected_plants = list(self._current.get("selected_plants", []))
+
+    def _current_reminder_days(self, key: str) -> str:
+        """Return the saved reminder lead times as the form value."""
+        return _format_reminder_days(self._current.get(key, DEFAULT_REMINDER_DAYS))
 
     async def async_step_init(self, user_input=None) -> FlowResult:
         """Manage the options."""
+        errors = {}
         if user_input is not None:
-            return self.async_create_entry(title="", data=user_input)
+            errors = {**_parse_reminder_days(user_input), **_validate_climate_zone(user_input)}
+            if not errors:
+                # Cleared sensors must override the ones chosen during setup
+                for key in WEATHER_SENSOR_CLASSES:
+                    user_input.setdefault(key, None)
+                self._options = user_input
+                return await self.async_step_plants()
 
         return self.async_show_form(
             step_id="init",
             data_schema=vol.Schema({
                 vol.Required(
                     "hemisphere",
-                    default=self.config_entry.data.get("hemisphere", "northern")
+                    default=self._current.get("hemisphere", "northern")
                 ): vol.In(["northern", "southern"]),
                 vol.Required(
                     "organic_preference",
-                    default=self.config_entry.data.get("organic_preference", True)
+                    default=self._current.get("organic_preference", True)
                 ): bool,
-                vol.Required(
-                    "selected_plants",
-                    default=self.config_entry.data.get("selected_plants", [])
-                ): cv.multi_select(PLANT_TYPES),
                 vol.Optional(
                     "custom_plants",
-                    default=self.config_entry.data.get("custom_plants", "")
+                    default=self._current.get("custom_plants", "")
+                ): str,
+                vol.Required(
+                    CONF_ENTITY_MODE,
+                    default=self._current.get(CONF_ENTITY_MODE, ENTITY_MODE_PER_PLANT)
+                ): vol.In(ENTITY_MODES),
+                vol.Required(
+                    CONF_SENSOR_STATE,
+                    default=self._current.get(CONF_SENSOR_STATE, SENSOR_STATE_TEXT)
+                ): vol.In(SENSOR_STATES),
+                vol.Optional(
+                    CONF_CLIMATE_ZONE,
+                    default=self._current.get(CONF_CLIMATE_ZONE, ""),
+                ): str,
+                vol.Optional(
+                    CONF_PRUNING_REMINDER_DAYS,
+                    default=self._current_reminder_days(CONF_PRUNING_REMINDER_DAYS),
                 ): str,
+                vol.Optional(
+                    CONF_SPRAY_REMINDER_DAYS,
+                    default=self._current_reminder_days(CONF_SPRAY_REMINDER_DAYS),
+                ): str,
+                **_weather_sensor_fields(self._current),
             }),
-        )
\ No newline at end of file
+            errors=errors,
+        )
+
+    def _async_plants_done(self) -> FlowResult:
+        """Save the options with the chosen plants."""
+        return self.async_create_entry(
+            title="", data={**self._options, "selected_plants": self._selected_plants}
+        )
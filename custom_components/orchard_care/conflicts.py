@@ -0,0 +1,197 @@
+"""Spray conflict detection for the Orchard Care integration."""
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Generic, TypeVar
+
+from .const import PRUNING_DURATION_HOURS, TASK_PRUNING, TASK_SPRAY
+from .products import get_spray_product
+from .schedule import iter_task_dates, iter_task_starts
+from .solar import SolarLocation
+
+CONFLICT_PHI = "pre_harvest_interval"
+CONFLICT_REI = "re_entry_interval"
+CONFLICT_RESISTANCE = "resistance_rotation"
+
+# Same mode of action in more consecutive applications than this is flagged
+MAX_CONSECUTIVE_GROUP_APPLICATIONS = 2
+
+T = TypeVar("T")
+
+
+class IntervalTree(Generic[T]):
+    """Static centered interval tree over closed intervals.
+
+    Building is O(n log n) per level and a stabbing or overlap query costs
+    O(log n + k) for k results.
+    """
+
+    __slots__ = ("_center", "_by_start", "_by_end", "_left", "_right")
+
+    def __init__(self, intervals: list[tuple[Any, Any, T]]) -> None:
+        """Build the tree from (start, end, payload) tuples."""
+        self._left: IntervalTree[T] | None = None
+        self._right: IntervalTree[T] | None = None
+        self._by_start: list[tuple[Any, Any, T]] = []
+        self._by_end: list[tuple[Any, Any, T]] = []
+        self._center = None
+        if not intervals:
+            return
+
+        starts = sorted(interval[0] for interval in intervals)
+        self._center = center = starts[len(starts) // 2]
+
+        left, right, here = [], [], []
+        for interval in intervals:
+            if interval[1] < center:
+                left.append(interval)
+            elif interval[0] > center:
+                right.append(interval)
+            else:
+                here.append(interval)
+
+        self._by_start = sorted(here, key=lambda interval: interval[0])
+        self._by_end = sorted(here, key=lambda interval: interval[1], reverse=True)
+        if left:
+            self._left = IntervalTree(left)
+        if right:
+            self._right = IntervalTree(right)
+
+    def overlapping(self, start: Any, end: Any) -> list[T]:
+        """Return the payloads of all intervals overlapping [start, end]."""
+        found: list[T] = []
+        node: IntervalTree[T] | None = self
+        pending: list[IntervalTree[T]] = []
+
+        while node is not None or pending:
+            if node is None:
+                node = pending.pop()
+            if node._center is None:
+                node = None
+                continue
+
+            if end < node._center:
+                for interval in node._by_start:
+                    if interval[0] > end:
+                        break
+                    found.append(interval[2])
+                node = node._left
+            elif start > node._center:
+                for interval in node._by_end:
+                    if interval[1] < start:
+                        break
+                    found.append(interval[2])
+                node = node._right
+            else:
+                found.extend(interval[2] for interval in node._by_start)
+                if node._right is not None:
+                    pending.append(node._right)
+                node = node._left
+
+        return found
+
+
+@dataclass(frozen=True, slots=True)
+class SprayConflict:
+    """A planned spray that violates a label interval or rotation rule."""
+
+    plant: str
+    date: datetime
+    kind: str
+    product: str
+    message: str
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the conflict as a plain dict for attributes."""
+        return {
+            "plant": self.plant,
+            "date": self.date.isoformat(),
+            "kind": self.kind,
+            "product": self.product,
+            "message": self.message,
+        }
+
+
+def _month_windows(
+    months: list[int], start_date: datetime, end_date: datetime
+) -> list[tuple[datetime, datetime]]:
+    """Return whole-month windows for the given months inside a date range."""
+    windows = []
+    for first_day in iter_task_dates(months, 1, 0, start_date - timedelta(days=31), end_date):
+        next_month = (first_day + timedelta(days=32)).replace(day=1)
+        windows.append((first_day, next_month - timedelta(seconds=1)))
+    return windows
+
+
+def find_conflicts(
+    schedules: dict[str, dict[str, Any]],
+    start_date: datetime,
+    end_date: datetime,
+    location: SolarLocation | None = None,
+) -> list[SprayConflict]:
+    """Check every planned spray in a season against PHI, REI and rotation rules.
+
+    Label intervals are checked for every recommended product, since any of
+    them may be the one applied. The recommendations are used in turn through
+    the season's spray months, so rotation is checked against the product
+    each spray applies.
+    """
+    conflicts: list[SprayConflict] = []
+
+    for plant, schedule in schedules.items():
+        products = [get_spray_product(name) for name in schedule.get("spray_products", [])[:3]]
+        spray_months = schedule.get("spray_months", [])
+        sprays = list(iter_task_starts(TASK_SPRAY, spray_months, start_date, end_date, location))
+        if not sprays or not products:
+            continue
+        sprays.sort()
+
+        harvest_tree: IntervalTree[str] = IntervalTree([
+            (window_start, window_end, "harvest")
+            for window_start, window_end in _month_windows(
+                schedule.get("harvest_months", []), start_date, end_date
+            )
+        ])
+        task_tree: IntervalTree[str] = IntervalTree([
+            (task_start, task_start + timedelta(hours=PRUNING_DURATION_HOURS), TASK_PRUNING)
+            for task_start in iter_task_starts(
+                TASK_PRUNING, schedule.get("pruning_months", []),
+                start_date, end_date + timedelta(days=7), location
+            )
+        ])
+
+        group_run: tuple[str | None, int] = (None, 0)
+        for spray in sprays:
+            for product in products:
+                if product.phi_days and harvest_tree.overlapping(
+                    spray, spray + timedelta(days=product.phi_days)
+                ):
+                    conflicts.append(SprayConflict(
+                        plant, spray, CONFLICT_PHI, product.name,
+                        f"{product.name} needs {product.phi_days} days before harvest",
+                    ))
+                if not product.rei_hours:
+                    continue
+                # Pickers and pruners both have to enter the treated block
+                rei_end = spray + timedelta(hours=product.rei_hours)
+                for work in sorted(
+                    {*task_tree.overlapping(spray, rei_end), *harvest_tree.overlapping(spray, rei_end)}
+                ):
+                    conflicts.append(SprayConflict(
+                        plant, spray, CONFLICT_REI, product.name,
+                        f"{work.capitalize()} falls inside the {product.rei_hours} h "
+                        f"re-entry interval of {product.name}",
+                    ))
+
+            # Count consecutive sprays applying the same mode of action
+            applied = products[spray_months.index(spray.month) % len(products)]
+            group = applied.resistance_group if applied.rotation_sensitive else None
+            run = group_run[1] + 1 if group is not None and group == group_run[0] else 1
+            group_run = (group, run)
+            if group is not None and run > MAX_CONSECUTIVE_GROUP_APPLICATIONS:
+                conflicts.append(SprayConflict(
+                    plant, spray, CONFLICT_RESISTANCE, applied.name,
+                    f"{group} used in {run} consecutive applications; rotate modes of action",
+                ))
+
+    conflicts.sort(key=lambda conflict: (conflict.date, conflict.plant))
+    return conflicts
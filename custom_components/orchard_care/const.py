@@ -21,3 +21,120 @@ PLANT_TYPES = {
     "kiwi": "Kiwi Vine",
     "persimmon": "Persimmon Tree"
 }
+
+# Other names a plant is found by in the setup search, such as botanical names
+PLANT_ALIASES = {
+    "apple": ["Malus domestica"],
+    "pear": ["Pyrus communis"],
+    "cherry": ["Prunus avium", "Sweet cherry", "Sour cherry"],
+    "plum": ["Prunus domestica", "Damson", "Greengage"],
+    "peach": ["Prunus persica", "Nectarine"],
+    "apricot": ["Prunus armeniaca"],
+    "citrus_orange": ["Citrus sinensis", "Citrus", "Mandarin"],
+    "citrus_lemon": ["Citrus limon", "Citrus", "Lime"],
+    "grape": ["Vitis vinifera", "Vine", "Table grape", "Wine grape"],
+    "blueberry": ["Vaccinium corymbosum", "Highbush blueberry"],
+    "raspberry": ["Rubus idaeus", "Cane fruit"],
+    "blackberry": ["Rubus fruticosus", "Bramble", "Cane fruit"],
+    "strawberry": ["Fragaria ananassa"],
+    "fig": ["Ficus carica"],
+    "avocado": ["Persea americana"],
+    "kiwi": ["Actinidia deliciosa", "Kiwifruit"],
+    "persimmon": ["Diospyros kaki", "Kaki", "Sharon fruit"],
+}
+
+# Plants listed per page of the setup plant selector
+PLANT_PAGE_SIZE = 25
+
+
+# Entity layout
+CONF_ENTITY_MODE = "entity_mode"
+ENTITY_MODE_PER_PLANT = "per_plant"
+ENTITY_MODE_AGGREGATE = "aggregate"
+ENTITY_MODES = [ENTITY_MODE_PER_PLANT, ENTITY_MODE_AGGREGATE]
+
+# How the pruning and spray sensors report the next task
+CONF_SENSOR_STATE = "sensor_state"
+SENSOR_STATE_TEXT = "text"
+SENSOR_STATE_TIMESTAMP = "timestamp"
+SENSOR_STATES = [SENSOR_STATE_TEXT, SENSOR_STATE_TIMESTAMP]
+
+# Climate zones adjusting the temperate catalog months
+CONF_CLIMATE_ZONE = "climate_zone"
+CLIMATE_ZONE_AUTO = "auto"
+CLIMATE_ZONE_TROPICAL = "tropical"
+CLIMATE_ZONE_SUBTROPICAL = "subtropical"
+CLIMATE_ZONE_MEDITERRANEAN = "mediterranean"
+CLIMATE_ZONE_TEMPERATE = "temperate"
+CLIMATE_ZONE_CONTINENTAL = "continental"
+CLIMATE_ZONE_SUBARCTIC = "subarctic"
+CLIMATE_ZONES = [
+    CLIMATE_ZONE_TROPICAL,
+    CLIMATE_ZONE_SUBTROPICAL,
+    CLIMATE_ZONE_MEDITERRANEAN,
+    CLIMATE_ZONE_TEMPERATE,
+    CLIMATE_ZONE_CONTINENTAL,
+    CLIMATE_ZONE_SUBARCTIC,
+]
+
+# Orchard blocks (plantings with counts and locations)
+CONF_BLOCKS = "blocks"
+
+# Per-species month overrides set by plan imports, applied after the hemisphere shift
+CONF_PLANT_OVERRIDES = "plant_overrides"
+PLAN_OVERRIDE_FIELDS = ("pruning_months", "spray_months", "harvest_months")
+# Plan rows validated per executor job
+PLAN_BATCH_SIZE = 500
+
+# Scenarios accepted by one simulate call
+SIMULATION_MAX_SCENARIOS = 1000
+
+# Task timing used by calendars and the aggregate sensors
+TASK_PRUNING = "pruning"
+TASK_SPRAY = "spray"
+PRUNING_DAY = 15
+PRUNING_HOUR = 9
+PRUNING_DURATION_HOURS = 3
+SPRAY_DAY = 7
+SPRAY_HOUR = 7
+SPRAY_DURATION_HOURS = 2
+TASK_IRRIGATION = "irrigation"
+TASK_HARVEST = "harvest"
+IRRIGATION_HOUR = 6
+IRRIGATION_DURATION_HOURS = 1
+
+# Reminder lead times in days before each task, configurable per task kind
+CONF_PRUNING_REMINDER_DAYS = "pruning_reminder_days"
+CONF_SPRAY_REMINDER_DAYS = "spray_reminder_days"
+REMINDER_DAYS_OPTIONS = {
+    TASK_PRUNING: CONF_PRUNING_REMINDER_DAYS,
+    TASK_SPRAY: CONF_SPRAY_REMINDER_DAYS,
+}
+DEFAULT_REMINDER_DAYS = [7, 3, 1]
+MAX_REMINDER_DAYS = 60
+
+# With a known location, tasks start relative to sunrise instead of the fixed hours
+PRUNING_SUNRISE_OFFSET_MINUTES = 120
+SPRAY_SUNRISE_OFFSET_MINUTES = 30
+IRRIGATION_SUNRISE_OFFSET_MINUTES = -60
+SOLAR_CACHE_SIZE = 2048
+
+# Spray occurrences sharing a product inside this window become one tank-mix job
+TANK_MIX_WINDOW_DAYS = 7
+
+# Calendar queries spanning more plant-days than this are expanded in chunks
+CHUNKED_QUERY_PLANT_DAYS = 2000
+QUERY_CHUNK_DAYS = 92
+MAX_CALENDAR_EVENTS = 5000
+
+# Irrigation from an FAO-56 soil water balance fed by weather sensors
+CONF_TEMPERATURE_SENSOR = "temperature_sensor"
+CONF_HUMIDITY_SENSOR = "humidity_sensor"
+CONF_WIND_SPEED_SENSOR = "wind_speed_sensor"
+CONF_SOLAR_RADIATION_SENSOR = "solar_radiation_sensor"
+CONF_RAIN_SENSOR = "rain_sensor"
+IRRIGATION_HORIZON_DAYS = 14
+
+# Winter chill accumulated from hourly temperature samples
+CHILL_SEASON_START_MONTH = 10
+CHILL_WINDOW_DAYS = 14
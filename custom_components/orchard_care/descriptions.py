@@ -0,0 +1,133 @@
+"""Event descriptions and notification text for the Orchard Care calendars.
+
+Every text is rendered from the templates of the entry's language and cached
+by the language and the task it describes, so adding languages adds no cost
+per event.
+"""
+from functools import lru_cache
+
+from . import PLANT_CARE_DATA
+from .const import TASK_PRUNING
+from .templates import get_templates
+
+# Notifications further ahead than this read as planning, not as a countdown
+PLAN_AHEAD_DAYS = 7
+
+
+def _plant_name(plant: str) -> str:
+    """Return the display name of a plant."""
+    return PLANT_CARE_DATA.get(plant, {}).get('name', plant.title())
+
+
+@lru_cache(maxsize=256)
+def get_task_summary(language: str, plant: str, task: str, spray_type: str) -> str:
+    """Return the summary of a task, built once per key."""
+    return get_templates(language).summaries[task].format(
+        plant_name=_plant_name(plant), spray_type=spray_type
+    )
+
+
+@lru_cache(maxsize=64)
+def get_lead_time_text(language: str, days: int) -> str:
+    """Return how far ahead a reminder is, as shown in its summary."""
+    lead_times = get_templates(language).lead_times
+    if days == 1:
+        return lead_times["tomorrow"]
+    if days % 7 == 0:
+        weeks = days // 7
+        return lead_times["week"] if weeks == 1 else lead_times["weeks"].format(weeks=weeks)
+    return lead_times["days"].format(days=days)
+
+
+@lru_cache(maxsize=512)
+def get_reminder_summary(language: str, summary: str, lead_days: int) -> str:
+    """Return the summary of a reminder for a task summary."""
+    return get_templates(language).summaries["reminder"].format(
+        summary=summary, when=get_lead_time_text(language, lead_days)
+    )
+
+
+@lru_cache(maxsize=2048)
+def get_task_description(
+    language: str, plant: str, task: str, month: int, spray_type: str, products: tuple[str, ...]
+) -> str:
+    """Return the shared description for a task, built once per key.
+
+    ``products`` are the spray products of the plant's resolved schedule.
+    """
+    templates = get_templates(language)
+    plant_data = PLANT_CARE_DATA.get(plant, {})
+    plant_name = _plant_name(plant)
+
+    if task == TASK_PRUNING:
+        tip = templates.pruning_tips.get(month, templates.pruning_tip)
+        return templates.pruning.format(
+            plant_name=plant_name, care_notes=plant_data.get('care_notes', ''), tip=tip
+        )
+
+    return templates.spray.format(
+        plant_name=plant_name,
+        spray_type=spray_type,
+        products=", ".join(products[:3]) if products else templates.spray_no_products,
+    )
+
+
+@lru_cache(maxsize=2048)
+def get_reminder_description(
+    language: str,
+    plant: str,
+    task: str,
+    month: int,
+    spray_type: str,
+    products: tuple[str, ...],
+    lead_days: int,
+) -> str:
+    """Return the shared description for a reminder, built once per key."""
+    description = get_task_description(language, plant, task, month, spray_type, products)
+    key = "ahead" if lead_days >= PLAN_AHEAD_DAYS else "soon"
+    return get_templates(language).reminders[key].format(excerpt=description[:100])
+
+
+@lru_cache(maxsize=512)
+def get_irrigation_description(language: str, plant: str, amount_mm: float) -> str:
+    """Return the description of an irrigation task, built once per amount."""
+    # 1 mm over 1 m² is 1 liter
+    return get_templates(language).irrigation.format(
+        plant_name=_plant_name(plant), amount=f"{amount_mm:.0f}"
+    )
+
+
+def get_spray_warnings(language: str, warnings: list[str], description: str) -> str:
+    """Return a spray description headed by its conflict warnings."""
+    return get_templates(language).spray_warnings.format(
+        warnings="\n".join(f"• {warning}" for warning in warnings),
+        description=description,
+    )
+
+
+@lru_cache(maxsize=128)
+def _notification_templates(language: str, days_until: int) -> tuple[str, str]:
+    """Return the title and message templates for a lead time."""
+    templates = get_templates(language)
+    if days_until == 0:
+        key = "today"
+    elif days_until == 1:
+        key = "tomorrow"
+    elif days_until >= PLAN_AHEAD_DAYS:
+        if days_until % 7:
+            key = "later"
+        else:
+            key = "week" if days_until == 7 else "weeks"
+    else:
+        key = "days"
+    urgency, message = templates.notifications[key]
+    fields = {"days": days_until, "weeks": days_until // 7}
+    title = templates.notification_title.format(urgency=urgency.format(**fields))
+    # The summary is filled in per event
+    return title, message.format(summary="{summary}", **fields)
+
+
+def get_notification(language: str, days_until: int, summary: str) -> tuple[str, str]:
+    """Return the title and message of a care notification."""
+    title, message = _notification_templates(language, days_until)
+    return title, message.replace("{summary}", summary)
@@ -0,0 +1,310 @@
+"""Evapotranspiration-based irrigation scheduling for the Orchard Care integration."""
+import math
+from collections import deque
+from dataclasses import asdict, dataclass
+from datetime import date, timedelta
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+
+from .const import (
+    CONF_HUMIDITY_SENSOR,
+    CONF_RAIN_SENSOR,
+    CONF_SOLAR_RADIATION_SENSOR,
+    CONF_TEMPERATURE_SENSOR,
+    CONF_WIND_SPEED_SENSOR,
+    DOMAIN,
+    IRRIGATION_HORIZON_DAYS,
+)
+
+STORAGE_VERSION = 1
+# Readings arrive often; coalesce their writes
+SAVE_DELAY = 60
+# Days of reference ET averaged to project when the next irrigation is due
+ET_HISTORY_DAYS = 7
+
+DEFAULT_CROP_COEFFICIENTS = (0.45, 0.90, 0.65)
+DEFAULT_DEPLETION_FRACTION = 0.5
+DEFAULT_ROOT_ZONE_WATER_MM = 150
+
+# Solar constant (MJ m-2 min-1) and Stefan-Boltzmann constant (MJ K-4 m-2 day-1)
+_SOLAR_CONSTANT = 0.0820
+_STEFAN_BOLTZMANN = 4.903e-9
+
+# Unit conversions to °C, m/s, W/m² and mm
+_UNIT_CONVERSIONS = {
+    "°F": lambda value: (value - 32) * 5 / 9,
+    "K": lambda value: value - 273.15,
+    "km/h": lambda value: value / 3.6,
+    "mph": lambda value: value * 0.44704,
+    "kn": lambda value: value * 0.514444,
+    "in": lambda value: value * 25.4,
+    "cm": lambda value: value * 10,
+}
+
+
+def extraterrestrial_radiation(day: date, latitude: float) -> float:
+    """Return extraterrestrial radiation Ra in MJ m-2 day-1 (FAO-56 eq. 21)."""
+    day_of_year = day.timetuple().tm_yday
+    phi = math.radians(latitude)
+    inverse_distance = 1 + 0.033 * math.cos(2 * math.pi * day_of_year / 365)
+    declination = 0.409 * math.sin(2 * math.pi * day_of_year / 365 - 1.39)
+    sunset_angle = math.acos(max(-1.0, min(1.0, -math.tan(phi) * math.tan(declination))))
+    return (
+        24 * 60 / math.pi * _SOLAR_CONSTANT * inverse_distance
+        * (
+            sunset_angle * math.sin(phi) * math.sin(declination)
+            + math.cos(phi) * math.cos(declination) * math.sin(sunset_angle)
+        )
+    )
+
+
+def hargreaves_et0(temp_min: float, temp_max: float, radiation: float) -> float:
+    """Return reference ET0 in mm/day from temperature alone (FAO-56 eq. 52)."""
+    temp_mean = (temp_min + temp_max) / 2
+    return max(
+        0.0,
+        0.0023 * (temp_mean + 17.8) * math.sqrt(max(temp_max - temp_min, 0.0)) * 0.408 * radiation,
+    )
+
+
+def _vapour_pressure(temperature: float) -> float:
+    """Return saturation vapour pressure in kPa (FAO-56 eq. 11)."""
+    return 0.6108 * math.exp(17.27 * temperature / (temperature + 237.3))
+
+
+def penman_monteith_et0(
+    temp_min: float,
+    temp_max: float,
+    humidity: float,
+    wind_speed: float,
+    solar_radiation: float,
+    radiation: float,
+    elevation: float,
+) -> float:
+    """Return reference ET0 in mm/day (FAO-56 eq. 6).
+
+    Humidity is the daily mean in %, wind speed the mean at 2 m in m/s and
+    solar radiation the measured daily total in MJ m-2 day-1.
+    """
+    temp_mean = (temp_min + temp_max) / 2
+    slope = 4098 * _vapour_pressure(temp_mean) / (temp_mean + 237.3) ** 2
+    pressure = 101.3 * ((293 - 0.0065 * elevation) / 293) ** 5.26
+    psychrometric = 0.000665 * pressure
+
+    saturation = (_vapour_pressure(temp_max) + _vapour_pressure(temp_min)) / 2
+    actual = saturation * min(max(humidity, 0.0), 100.0) / 100
+
+    clear_sky = (0.75 + 2e-5 * elevation) * radiation
+    relative_shortwave = min(solar_radiation / clear_sky, 1.0) if clear_sky > 0 else 1.0
+    net_longwave = (
+        _STEFAN_BOLTZMANN
+        * ((temp_max + 273.16) ** 4 + (temp_min + 273.16) ** 4) / 2
+        * (0.34 - 0.14 * math.sqrt(actual))
+        * (1.35 * relative_shortwave - 0.35)
+    )
+    net_radiation = 0.77 * solar_radiation - net_longwave
+
+    return max(
+        0.0,
+        (
+            0.408 * slope * net_radiation
+            + psychrometric * 900 / (temp_mean + 273) * wind_speed * (saturation - actual)
+        )
+        / (slope + psychrometric * (1 + 0.34 * wind_speed)),
+    )
+
+
+def to_metric(value: float, unit: str | None) -> float:
+    """Convert a sensor reading to the units used by the water balance."""
+    convert = _UNIT_CONVERSIONS.get(unit or "")
+    return convert(value) if convert else value
+
+
+def crop_coefficient(schedule: dict[str, Any], month: int) -> float:
+    """Return the crop coefficient for a planting in a month.
+
+    Dormant (pruning) months use the initial Kc, harvest months the late
+    season Kc and everything else the mid-season Kc.
+    """
+    initial, mid, late = schedule.get("crop_coefficients") or DEFAULT_CROP_COEFFICIENTS
+    if month in schedule.get("harvest_months", []):
+        return late
+    if month in schedule.get("pruning_months", []):
+        return initial
+    return mid
+
+
+@dataclass(slots=True)
+class DailyWeather:
+    """Running aggregates of one day's weather readings."""
+
+    day: date
+    temp_min: float | None = None
+    temp_max: float | None = None
+    humidity_sum: float = 0.0
+    humidity_count: int = 0
+    wind_sum: float = 0.0
+    wind_count: int = 0
+    radiation_sum: float = 0.0
+    radiation_count: int = 0
+    rain: float = 0.0
+
+    def add(self, sensor: str, value: float) -> None:
+        """Fold one metric reading into the day's aggregates."""
+        if sensor == CONF_TEMPERATURE_SENSOR:
+            self.temp_min = value if self.temp_min is None else min(self.temp_min, value)
+            self.temp_max = value if self.temp_max is None else max(self.temp_max, value)
+        elif sensor == CONF_HUMIDITY_SENSOR:
+            self.humidity_sum += value
+            self.humidity_count += 1
+        elif sensor == CONF_WIND_SPEED_SENSOR:
+            self.wind_sum += value
+            self.wind_count += 1
+        elif sensor == CONF_SOLAR_RADIATION_SENSOR:
+            self.radiation_sum += value
+            self.radiation_count += 1
+        elif sensor == CONF_RAIN_SENSOR:
+            # Rain sensors report a running daily total
+            self.rain = max(self.rain, value)
+
+    def et0(self, latitude: float, elevation: float) -> float | None:
+        """Return the day's reference ET0, or None without temperature readings."""
+        if self.temp_min is None or self.temp_max is None:
+            return None
+
+        radiation = extraterrestrial_radiation(self.day, latitude)
+        if self.humidity_count and self.wind_count and self.radiation_count:
+            return penman_monteith_et0(
+                self.temp_min,
+                self.temp_max,
+                self.humidity_sum / self.humidity_count,
+                self.wind_sum / self.wind_count,
+                # Mean W/m² over the day to MJ m-2 day-1
+                self.radiation_sum / self.radiation_count * 0.0864,
+                radiation,
+                elevation,
+            )
+        return hargreaves_et0(self.temp_min, self.temp_max, radiation)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the aggregates for storage."""
+        return {**asdict(self), "day": self.day.isoformat()}
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "DailyWeather":
+        """Restore stored aggregates."""
+        return cls(**{**data, "day": date.fromisoformat(data["day"])})
+
+
+class IrrigationEngine:
+    """Per-planting soil water balance driven by daily reference ET.
+
+    Readings only update the running aggregates of the current day; the
+    balances advance once per day when the day is closed, and everything is
+    stored so a restart resumes from the last closed day.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry_id: str,
+        schedules: dict[str, dict[str, Any]],
+        latitude: float,
+        elevation: float,
+    ) -> None:
+        """Initialize the engine for the coordinator's planting schedules."""
+        self.schedules = schedules
+        self.latitude = latitude
+        self.elevation = elevation
+        self.weather = DailyWeather(date.today())
+        self.recent_et0: deque[float] = deque(maxlen=ET_HISTORY_DAYS)
+        self.depletion: dict[str, float] = {}
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}.irrigation"
+        )
+
+    async def async_load(self) -> None:
+        """Restore the stored balances and the day in progress."""
+        data = await self._store.async_load()
+        if not data:
+            return
+        self.weather = DailyWeather.from_dict(data["weather"])
+        self.recent_et0.extend(data.get("recent_et0", []))
+        self.depletion = dict(data.get("depletion", {}))
+
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the engine state for storage."""
+        return {
+            "weather": self.weather.as_dict(),
+            "recent_et0": list(self.recent_et0),
+            "depletion": self.depletion,
+        }
+
+    def add_reading(self, sensor: str, value: float, today: date) -> bool:
+        """Record one reading; return True when it closed the previous day."""
+        closed = self.roll_over(today)
+        self.weather.add(sensor, value)
+        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+        return closed
+
+    def roll_over(self, today: date) -> bool:
+        """Close the accumulated day once a later day has started."""
+        if self.weather.day >= today:
+            return False
+
+        weather = self.weather
+        et0 = weather.et0(self.latitude, self.elevation)
+        if et0 is not None:
+            self.recent_et0.append(et0)
+            self._close_day(weather.day, et0, weather.rain)
+
+        # Days without readings, e.g. while Home Assistant was down, still use
+        # water; they are closed at the recent mean ET0, assuming no rain
+        if self.recent_et0:
+            estimated_et0 = sum(self.recent_et0) / len(self.recent_et0)
+            day = weather.day + timedelta(days=1)
+            while day < today:
+                self._close_day(day, estimated_et0, 0.0)
+                day += timedelta(days=1)
+
+        self.weather = DailyWeather(today)
+        self._store.async_delay_save(self._data_to_save, 0)
+        return True
+
+    def _close_day(self, day: date, et0: float, rain: float) -> None:
+        """Advance every planting's balance by one day's rain and crop use."""
+        for planting, schedule in self.schedules.items():
+            capacity = schedule.get("root_zone_water_mm") or DEFAULT_ROOT_ZONE_WATER_MM
+            crop_et = crop_coefficient(schedule, day.month) * et0
+            depletion = self.depletion.get(planting, 0.0) - rain + crop_et
+            self.depletion[planting] = round(min(max(depletion, 0.0), capacity), 2)
+
+    def record_irrigation(self, planting: str, amount: float | None = None) -> None:
+        """Apply an irrigation; without an amount the root zone is refilled."""
+        depletion = self.depletion.get(planting, 0.0)
+        self.depletion[planting] = 0.0 if amount is None else max(depletion - amount, 0.0)
+        self._store.async_delay_save(self._data_to_save, 0)
+
+    def plan(self, planting: str, today: date) -> tuple[date, float] | None:
+        """Return when a planting next needs water and how many mm to apply."""
+        schedule = self.schedules.get(planting)
+        if not schedule or not self.recent_et0:
+            return None
+
+        capacity = schedule.get("root_zone_water_mm") or DEFAULT_ROOT_ZONE_WATER_MM
+        readily_available = capacity * (schedule.get("depletion_fraction") or DEFAULT_DEPLETION_FRACTION)
+        depletion = self.depletion.get(planting, 0.0)
+        if depletion >= readily_available:
+            return today, round(depletion, 1)
+
+        crop_et = crop_coefficient(schedule, today.month) * (
+            sum(self.recent_et0) / len(self.recent_et0)
+        )
+        if crop_et <= 0:
+            return None
+        days = math.ceil((readily_available - depletion) / crop_et)
+        if days > IRRIGATION_HORIZON_DAYS:
+            return None
+        return today + timedelta(days=days), round(depletion + days * crop_et, 1)
@@ -0,0 +1,54 @@
+"""Compact occurrence records for the Orchard Care calendars."""
+import sys
+from datetime import datetime, timedelta
+
+from .schedule import occurrence_id
+
+_EPOCH = datetime(2000, 1, 1)
+
+
+class Occurrence:
+    """One generated task or reminder, stored without any rendered text.
+
+    Records hold an interned plant id, the task kind and the task start as
+    minutes since an epoch; summaries and descriptions are only produced when
+    an event is returned to a caller.
+    """
+
+    __slots__ = ("plant", "task", "offset", "lead_days")
+
+    def __init__(self, plant: str, task: str, task_start: datetime, lead_days: int = 0) -> None:
+        """Initialize the record; lead_days > 0 marks a reminder for the task."""
+        self.plant = sys.intern(plant)
+        self.task = task
+        self.offset = int((task_start - _EPOCH).total_seconds()) // 60
+        self.lead_days = lead_days
+
+    def reminder(self, lead_days: int) -> "Occurrence":
+        """Return a reminder record for this task."""
+        reminder = Occurrence.__new__(Occurrence)
+        reminder.plant = self.plant
+        reminder.task = self.task
+        reminder.offset = self.offset
+        reminder.lead_days = lead_days
+        return reminder
+
+    @property
+    def task_start(self) -> datetime:
+        """Return when the underlying task starts."""
+        return _EPOCH + timedelta(minutes=self.offset)
+
+    @property
+    def start(self) -> datetime:
+        """Return when this record appears on the calendar."""
+        return self.task_start - timedelta(days=self.lead_days)
+
+    @property
+    def is_reminder(self) -> bool:
+        """Return True for reminder records."""
+        return self.lead_days > 0
+
+    @property
+    def uid(self) -> str:
+        """Return the stable id of the underlying task."""
+        return occurrence_id(self.plant, self.task, self.task_start)
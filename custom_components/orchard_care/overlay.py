@@ -0,0 +1,163 @@
+"""User edits to the Orchard Care calendars.
+
+Generated tasks are never stored. Edits are kept as an overlay keyed by
+occurrence id: tasks moved or rewritten by the user and events the user added
+are records indexed by start time, and cancelled tasks are a set of ids. The
+calendars merge the overlay with the generated occurrences when they are
+queried, so an edit never recompiles a schedule.
+"""
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN
+
+STORAGE_VERSION = 1
+# Edits are rare and typed by hand, so they are written almost at once
+SAVE_DELAY = 1
+
+type IndexEntry = tuple[datetime, str, "OverlayEvent"]
+
+
+@dataclass(frozen=True, slots=True)
+class OverlayEvent:
+    """An event entered by the user, replacing a generated task or added to it.
+
+    ``plant`` is None for events added to the master calendar only. All-day
+    events run from midnight to midnight and are shown as dates.
+    """
+
+    uid: str
+    plant: str | None
+    start: datetime
+    end: datetime
+    summary: str
+    description: str | None = None
+    location: str | None = None
+    all_day: bool = False
+
+    def overlaps(self, start: datetime, end: datetime) -> bool:
+        """Return True when the event starts in or runs into a range."""
+        return self.start <= end and (self.start >= start or self.end > start)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the stored form of the event."""
+        return {
+            "plant": self.plant,
+            "start": self.start.isoformat(),
+            "end": self.end.isoformat(),
+            "summary": self.summary,
+            "description": self.description,
+            "location": self.location,
+            "all_day": self.all_day,
+        }
+
+    @classmethod
+    def from_dict(cls, uid: str, record: dict[str, Any]) -> "OverlayEvent":
+        """Restore a stored event."""
+        return cls(
+            uid=uid,
+            plant=record["plant"],
+            start=datetime.fromisoformat(record["start"]),
+            end=datetime.fromisoformat(record["end"]),
+            summary=record["summary"],
+            description=record.get("description"),
+            location=record.get("location"),
+            all_day=record.get("all_day", False),
+        )
+
+
+class CalendarOverlay:
+    """Persisted user edits, indexed by occurrence id and by start time.
+
+    The index and the replaced ids are swapped for new objects on every edit
+    rather than changed in place, so long queries expanding in the executor
+    always read a consistent overlay.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Initialize an empty overlay."""
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}.calendar_overlay"
+        )
+        self._events: dict[str, OverlayEvent] = {}
+        self._cancelled: set[str] = set()
+        self._index: list[IndexEntry] = []
+        # Events starting this long before a range can still run into it
+        self._longest = timedelta()
+        # Ids of generated occurrences the calendars must leave out
+        self.replaced: frozenset[str] = frozenset()
+
+    async def async_load(self) -> None:
+        """Load the stored edits."""
+        data = await self._store.async_load() or {}
+        self._events = {
+            uid: OverlayEvent.from_dict(uid, record)
+            for uid, record in data.get("events", {}).items()
+        }
+        self._cancelled = set(data.get("cancelled", []))
+        self._reindex()
+
+    def _reindex(self) -> None:
+        """Rebuild the start-time index and the replaced ids."""
+        self._index = sorted(
+            ((event.start, uid, event) for uid, event in self._events.items()),
+            key=lambda entry: entry[:2],
+        )
+        self._longest = max(
+            (event.end - event.start for event in self._events.values()), default=timedelta()
+        )
+        self.replaced = frozenset(self._events.keys() | self._cancelled)
+
+    @callback
+    def _async_save(self) -> None:
+        """Schedule a write of the edits."""
+        self._store.async_delay_save(
+            lambda: {
+                "events": {uid: event.as_dict() for uid, event in self._events.items()},
+                "cancelled": sorted(self._cancelled),
+            },
+            SAVE_DELAY,
+        )
+
+    def get(self, uid: str) -> OverlayEvent | None:
+        """Return the user's event with an id."""
+        return self._events.get(uid)
+
+    def is_cancelled(self, uid: str) -> bool:
+        """Return True when the user cancelled a generated occurrence."""
+        return uid in self._cancelled
+
+    def events(self, start: datetime, end: datetime) -> list[OverlayEvent]:
+        """Return the user's events starting in or running into a range, in start order."""
+        index, longest = self._index, self._longest
+        first = bisect_left(index, start - longest, key=lambda entry: entry[0])
+        last = bisect_right(index, end, key=lambda entry: entry[0])
+        return [event for _start, _uid, event in index[first:last] if event.overlaps(start, end)]
+
+    @callback
+    def async_set(self, event: OverlayEvent) -> None:
+        """Store an added event, or the user's version of a generated one."""
+        self._cancelled.discard(event.uid)
+        self._events[event.uid] = event
+        self._reindex()
+        self._async_save()
+
+    @callback
+    def async_cancel(self, uid: str) -> None:
+        """Cancel a generated occurrence, dropping any edit made to it."""
+        self._events.pop(uid, None)
+        self._cancelled.add(uid)
+        self._reindex()
+        self._async_save()
+
+    @callback
+    def async_delete(self, uid: str) -> None:
+        """Delete an event the user added."""
+        self._events.pop(uid, None)
+        self._reindex()
+        self._async_save()
@@ -0,0 +1,203 @@
+"""Orchard plan import and export for the Orchard Care integration."""
+import csv
+import json
+import os
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+from itertools import islice
+from typing import IO, Any
+
+from .blocks import OrchardBlock
+from .const import PLAN_OVERRIDE_FIELDS, PLANT_TYPES
+
+PLAN_FORMAT_CSV = "csv"
+PLAN_FORMAT_JSON = "json"
+PLAN_FORMAT_JSONL = "jsonl"
+PLAN_FORMATS = [PLAN_FORMAT_CSV, PLAN_FORMAT_JSON, PLAN_FORMAT_JSONL]
+
+PLAN_FIELDS = ["block_id", "plant", "cultivar", "count", "location", *PLAN_OVERRIDE_FIELDS]
+
+# Plants may be given by key ("apple") or display name ("Apple Tree")
+_PLANT_KEYS = {key: key for key in PLANT_TYPES} | {
+    name.lower(): key for key, name in PLANT_TYPES.items()
+}
+
+# Marks a JSON Lines row that could not be decoded
+_DECODE_ERROR = "_decode_error"
+
+
+class PlanError(ValueError):
+    """Raised when a plan file cannot be read at all."""
+
+
+def plan_format(path: str, requested: str | None = None) -> str:
+    """Return the plan format, from the request or the file extension."""
+    if requested:
+        return requested
+    extension = os.path.splitext(path)[1].lstrip(".").lower()
+    if extension == "ndjson":
+        return PLAN_FORMAT_JSONL
+    if extension not in PLAN_FORMATS:
+        raise PlanError(f"Cannot tell the plan format of {path}; set format")
+    return extension
+
+
+def iter_plan_rows(plan_file: IO[str], fmt: str) -> Iterator[dict[str, Any]]:
+    """Yield raw plan rows.
+
+    CSV and JSON Lines are read one line at a time. A JSON document (a list
+    of rows, or an object with a "blocks" list) has to be decoded whole.
+    """
+    if fmt == PLAN_FORMAT_CSV:
+        yield from csv.DictReader(plan_file)
+    elif fmt == PLAN_FORMAT_JSONL:
+        for line in plan_file:
+            if not line.strip():
+                continue
+            try:
+                yield json.loads(line)
+            except ValueError as err:
+                yield {_DECODE_ERROR: str(err)}
+    else:
+        try:
+            document = json.load(plan_file)
+        except ValueError as err:
+            raise PlanError(f"Invalid JSON plan: {err}") from err
+        rows = document.get("blocks") if isinstance(document, dict) else document
+        if not isinstance(rows, list):
+            raise PlanError("A JSON plan must be a list of rows or contain a blocks list")
+        yield from rows
+
+
+def _parse_months(value: Any) -> list[int]:
+    """Parse a month list given as a JSON list or "12;1;2" text."""
+    if isinstance(value, str):
+        value = value.replace(";", " ").replace(",", " ").split()
+    if not isinstance(value, list):
+        raise ValueError
+    months = [int(month) for month in value]
+    if any(month < 1 or month > 12 for month in months):
+        raise ValueError
+    return months
+
+
+@dataclass(slots=True)
+class PlanImport:
+    """Validated plan rows accumulated batch by batch."""
+
+    blocks: list[OrchardBlock] = field(default_factory=list)
+    overrides: dict[str, dict[str, list[int]]] = field(default_factory=dict)
+    results: list[dict[str, Any]] = field(default_factory=list)
+    _block_ids: set[str] = field(default_factory=set)
+
+    @property
+    def error_count(self) -> int:
+        """Return the number of rejected rows."""
+        return len(self.results) - len(self.blocks)
+
+    def read_batch(self, rows: Iterator[dict[str, Any]], size: int) -> int:
+        """Validate the next rows; return how many were read.
+
+        Runs in the executor, so decoding and validation never hold the loop.
+        """
+        batch = list(islice(rows, size))
+        first = len(self.results) + 1
+        for number, row in enumerate(batch, start=first):
+            try:
+                block, overrides = self._validate_row(row, number)
+            except ValueError as err:
+                self.results.append({"row": number, "status": "error", "error": str(err)})
+                continue
+            self.blocks.append(block)
+            self._block_ids.add(block.block_id)
+            if overrides:
+                self.overrides.setdefault(block.plant, {}).update(overrides)
+            self.results.append({"row": number, "status": "ok", "block_id": block.block_id})
+        return len(batch)
+
+    def _validate_row(
+        self, row: Any, number: int
+    ) -> tuple[OrchardBlock, dict[str, list[int]]]:
+        """Return the block and month overrides of one row, or raise ValueError."""
+        if not isinstance(row, dict):
+            raise ValueError("row is not an object")
+        if _DECODE_ERROR in row:
+            raise ValueError(f"invalid JSON: {row[_DECODE_ERROR]}")
+
+        name = str(row.get("plant") or "").strip()
+        plant = _PLANT_KEYS.get(name.lower())
+        if plant is None:
+            raise ValueError(f"unknown plant '{name}'" if name else "plant is required")
+
+        count = row.get("count")
+        try:
+            count = 1 if count in (None, "") else int(count)
+        except (TypeError, ValueError):
+            raise ValueError("count must be a whole number") from None
+        if count < 0:
+            raise ValueError("count must not be negative")
+
+        block_id = str(row.get("block_id") or "").strip() or f"{plant}_{number}"
+        if block_id in self._block_ids:
+            raise ValueError(f"duplicate block_id '{block_id}'")
+
+        overrides = {}
+        for key in PLAN_OVERRIDE_FIELDS:
+            value = row.get(key)
+            if value in (None, "", []):
+                continue
+            try:
+                months = _parse_months(value)
+            except (TypeError, ValueError):
+                raise ValueError(f"{key} must be months from 1 to 12") from None
+            # Schedules are per species, so every block must agree
+            current = self.overrides.get(plant, {}).get(key)
+            if current is not None and current != months:
+                raise ValueError(f"{key} conflicts with an earlier {plant} row")
+            overrides[key] = months
+
+        block = OrchardBlock(
+            block_id=block_id,
+            plant=plant,
+            count=count,
+            location=str(row.get("location") or "").strip(),
+            cultivar=str(row.get("cultivar") or "").strip(),
+        )
+        return block, overrides
+
+
+def plan_rows(
+    blocks: Iterable[OrchardBlock], overrides: dict[str, dict[str, list[int]]]
+) -> Iterator[dict[str, Any]]:
+    """Yield export rows: each block with its species' month overrides."""
+    for block in blocks:
+        yield {**block.as_dict(), **overrides.get(block.plant, {})}
+
+
+def write_plan(path: str, fmt: str, rows: Iterable[dict[str, Any]]) -> int:
+    """Stream rows to a plan file; return how many were written."""
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    written = 0
+    temp_path = f"{path}.tmp"
+    with open(temp_path, "w", encoding="utf-8", newline="") as plan_file:
+        if fmt == PLAN_FORMAT_CSV:
+            writer = csv.DictWriter(plan_file, fieldnames=PLAN_FIELDS)
+            writer.writeheader()
+            for row in rows:
+                writer.writerow({
+                    key: ";".join(map(str, value)) if isinstance(value, list) else value
+                    for key, value in row.items()
+                })
+                written += 1
+        elif fmt == PLAN_FORMAT_JSONL:
+            for row in rows:
+                plan_file.write(json.dumps(row) + "\n")
+                written += 1
+        else:
+            plan_file.write('{"blocks": [')
+            for row in rows:
+                plan_file.write((",\n" if written else "\n") + json.dumps(row))
+                written += 1
+            plan_file.write("\n]}\n")
+    os.replace(temp_path, path)
+    return written
@@ -0,0 +1,66 @@
+"""Plant catalog search for the Orchard Care config and options flows."""
+from bisect import bisect_left
+from functools import lru_cache
+
+from .const import PLANT_ALIASES, PLANT_TYPES
+
+
+def _words(text: str) -> list[str]:
+    """Split a name or query into lowercase words."""
+    return text.lower().replace("_", " ").replace("-", " ").split()
+
+
+class PrefixIndex:
+    """Catalog words in sorted order, answering prefix lookups by bisection.
+
+    Every word of a plant's key, display name and aliases is indexed, so a
+    lookup costs O(log n + k) for k matching words whatever the catalog size.
+    """
+
+    def __init__(self, names: dict[str, str], aliases: dict[str, list[str]]) -> None:
+        """Index the display names and aliases of a catalog."""
+        self.names = names
+        entries = {
+            (word, key)
+            for key, name in names.items()
+            for text in (key, name, *aliases.get(key, ()))
+            for word in _words(text)
+        }
+        self._entries = sorted(entries)
+        self._words = [word for word, _key in self._entries]
+        self._ordered = sorted(names, key=self._sort_key)
+
+    def _sort_key(self, key: str) -> str:
+        """Return the order plants are listed in."""
+        return self.names[key].lower()
+
+    def _prefixed(self, prefix: str) -> set[str]:
+        """Return the plants with a word starting with the prefix."""
+        keys = set()
+        for index in range(bisect_left(self._words, prefix), len(self._entries)):
+            word, key = self._entries[index]
+            if not word.startswith(prefix):
+                break
+            keys.add(key)
+        return keys
+
+    def search(self, query: str) -> list[str]:
+        """Return the plants matching every word of a query, by name."""
+        words = _words(query)
+        if not words:
+            return self._ordered
+        matches = self._prefixed(words[0])
+        for word in words[1:]:
+            matches &= self._prefixed(word)
+        return sorted(matches, key=self._sort_key)
+
+    def page(self, query: str, page: int, size: int) -> tuple[list[str], int]:
+        """Return one page of matches and the number of matches."""
+        matches = self.search(query)
+        return matches[page * size:(page + 1) * size], len(matches)
+
+
+@lru_cache(maxsize=1)
+def plant_index() -> PrefixIndex:
+    """Return the index of the plant catalog, built on first use."""
+    return PrefixIndex(PLANT_TYPES, PLANT_ALIASES)
@@ -0,0 +1,76 @@
+"""Spray product catalog for the Orchard Care integration.
+
+Intervals are typical label values for tree fruit. Labels differ by crop and
+country, so the catalog is guidance for planning, not a substitute for the
+product label.
+"""
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass(frozen=True, slots=True)
+class SprayProduct:
+    """A spray product with its label intervals and mode of action."""
+
+    name: str
+    phi_days: int
+    rei_hours: int
+    active_ingredients: tuple[str, ...] = ()
+    resistance_group: str | None = None
+
+    @property
+    def rotation_sensitive(self) -> bool:
+        """Return True when repeated use risks resistance.
+
+        Multi-site (FRAC M) and unclassified products are exempt.
+        """
+        group = self.resistance_group
+        return bool(group) and not group.startswith(("FRAC M", "NC", "UN"))
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the product as a plain dict for attributes."""
+        return {
+            "name": self.name,
+            "phi_days": self.phi_days,
+            "rei_hours": self.rei_hours,
+            "active_ingredients": list(self.active_ingredients),
+            "resistance_group": self.resistance_group,
+        }
+
+
+SPRAY_PRODUCTS: dict[str, SprayProduct] = {
+    product.name: product
+    for product in (
+        # Organic
+        SprayProduct("Neem oil", 0, 4, ("azadirachtin",), "UN"),
+        SprayProduct("Copper fungicide", 0, 48, ("copper hydroxide",), "FRAC M01"),
+        SprayProduct("Horticultural oil", 0, 4, ("mineral oil",), "NC"),
+        SprayProduct("Bacillus thuringiensis", 0, 4, ("Bacillus thuringiensis kurstaki",), "IRAC 11A"),
+        SprayProduct("Kaolin clay", 0, 4, ("kaolin",), "NC"),
+        SprayProduct("Spinosad", 7, 4, ("spinosad",), "IRAC 5"),
+        SprayProduct("Bacillus subtilis", 0, 4, ("Bacillus subtilis QST 713",), "FRAC BM02"),
+        SprayProduct("Sulfur spray", 1, 24, ("sulfur",), "FRAC M02"),
+        SprayProduct("Insecticidal soap", 0, 12, ("potassium salts of fatty acids",), "NC"),
+        # Conventional
+        SprayProduct("Captan", 1, 24, ("captan",), "FRAC M04"),
+        SprayProduct("Imidacloprid", 7, 12, ("imidacloprid",), "IRAC 4A"),
+        SprayProduct("Malathion", 7, 12, ("malathion",), "IRAC 1B"),
+        SprayProduct("Carbaryl", 3, 12, ("carbaryl",), "IRAC 1A"),
+        SprayProduct("Streptomycin", 50, 12, ("streptomycin sulfate",), "FRAC 25"),
+        SprayProduct("Propiconazole", 0, 24, ("propiconazole",), "FRAC 3"),
+        SprayProduct("Chlorpyrifos", 21, 96, ("chlorpyrifos",), "IRAC 1B"),
+        SprayProduct("Abamectin", 28, 12, ("abamectin",), "IRAC 6"),
+        SprayProduct("Copper sulfate", 0, 48, ("copper sulfate",), "FRAC M01"),
+        SprayProduct("Mancozeb", 77, 24, ("mancozeb",), "FRAC M03"),
+        # Generic recommendations without a single active ingredient
+        SprayProduct("Fungicide spray", 7, 12),
+        SprayProduct("Systemic fungicide", 14, 12),
+        SprayProduct("Systemic insecticide", 14, 12),
+        SprayProduct("Insecticide spray", 7, 12),
+    )
+}
+
+
+def get_spray_product(name: str) -> SprayProduct:
+    """Return the catalog entry for a product, with zero intervals if unknown."""
+    return SPRAY_PRODUCTS.get(name) or SprayProduct(name, 0, 0)
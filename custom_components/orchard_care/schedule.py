@@ -0,0 +1,140 @@
+"""Schedule helpers shared by the Orchard Care platforms."""
+from collections.abc import Iterator
+from datetime import date, datetime
+from types import MappingProxyType
+from typing import Any
+
+from .climate import adjust_months, zone_adjustment
+from .const import (
+    PRUNING_DAY,
+    SPRAY_DAY,
+    TASK_HARVEST,
+    TASK_PRUNING,
+    TASK_SPRAY,
+)
+from .solar import SolarLocation, task_start
+
+TASK_DAYS = {TASK_PRUNING: PRUNING_DAY, TASK_SPRAY: SPRAY_DAY}
+
+
+def compile_schedule(
+    plant_data: dict[str, Any],
+    hemisphere: str,
+    organic_preference: bool,
+    climate_zone: str | None = None,
+    overrides: dict[str, list[int]] | None = None,
+) -> dict[str, Any]:
+    """Compile the task months and spray program of one species for a site."""
+    # Adjust months for southern hemisphere (6 month offset)
+    month_offset = 6 if hemisphere == "southern" else 0
+
+    pruning_months = adjust_months(
+        plant_data.get("pruning_months", []), zone_adjustment(climate_zone, TASK_PRUNING)
+    )
+    spray_months = adjust_months(
+        plant_data.get("spray_months", []), zone_adjustment(climate_zone, TASK_SPRAY)
+    )
+    harvest_months = adjust_months(
+        plant_data.get("harvest_months", []), zone_adjustment(climate_zone, TASK_HARVEST)
+    )
+
+    # Adjust months for hemisphere
+    if month_offset:
+        pruning_months = [(m + month_offset - 1) % 12 + 1 for m in pruning_months]
+        spray_months = [(m + month_offset - 1) % 12 + 1 for m in spray_months]
+        harvest_months = [(m + month_offset - 1) % 12 + 1 for m in harvest_months]
+
+    # Imported plans give months as observed at the site, so they are not shifted
+    if overrides:
+        pruning_months = overrides.get("pruning_months", pruning_months)
+        spray_months = overrides.get("spray_months", spray_months)
+        harvest_months = overrides.get("harvest_months", harvest_months)
+
+    # Get spray recommendations based on preference
+    spray_type = "organic" if organic_preference else "conventional"
+    spray_products = plant_data.get("spray_products", {}).get(spray_type, [])
+
+    return {
+        "pruning_months": pruning_months,
+        "spray_months": spray_months,
+        "harvest_months": harvest_months,
+        "spray_products": spray_products,
+        "climate_zone": climate_zone,
+        "crop_coefficients": plant_data.get("crop_coefficients"),
+        "depletion_fraction": plant_data.get("depletion_fraction"),
+        "root_zone_water_mm": plant_data.get("root_zone_water_mm"),
+        "chill_requirement": plant_data.get("chill_requirement"),
+    }
+
+
+def iter_task_dates(
+    months: list[int], day: int, hour: int, start_date: datetime, end_date: datetime
+) -> Iterator[datetime]:
+    """Yield the task start times for the given months inside a date range."""
+    if not months:
+        return
+
+    for year in range(start_date.year, end_date.year + 2):
+        for month in months:
+            try:
+                event_date = datetime(year, month, day, hour, 0)
+            except ValueError:
+                # Handle invalid date (e.g., month 13)
+                continue
+            if start_date <= event_date <= end_date:
+                yield event_date
+
+
+def iter_task_starts(
+    task: str,
+    months: list[int],
+    start_date: datetime,
+    end_date: datetime,
+    location: SolarLocation | None = None,
+) -> Iterator[datetime]:
+    """Yield the start times of one task kind inside a date range."""
+    # Match on whole days first; the exact start depends on that day's sunrise
+    day_start = datetime.combine(start_date.date(), datetime.min.time())
+    day_end = datetime.combine(end_date.date(), datetime.max.time())
+    for event_day in iter_task_dates(months, TASK_DAYS[task], 0, day_start, day_end):
+        event_start = task_start(task, event_day.date(), location)
+        if start_date <= event_start <= end_date:
+            yield event_start
+
+
+def iter_occurrences(
+    plant_schedule: dict[str, Any],
+    start_date: datetime,
+    end_date: datetime,
+    location: SolarLocation | None = None,
+) -> Iterator[tuple[datetime, str]]:
+    """Yield (start, task) pairs for a compiled plant schedule."""
+    for task, key in ((TASK_PRUNING, "pruning_months"), (TASK_SPRAY, "spray_months")):
+        for event_start in iter_task_starts(
+            task, plant_schedule.get(key, []), start_date, end_date, location
+        ):
+            yield event_start, task
+
+
+def occurrence_id(plant: str, task: str, start: datetime) -> str:
+    """Return the stable id of a task occurrence."""
+    return f"{plant}:{task}:{start.date().isoformat()}"
+
+
+def parse_occurrence_id(uid: str | None) -> tuple[str, str, date] | None:
+    """Split an occurrence id into plant, task and date."""
+    if not uid:
+        return None
+    try:
+        plant, task, day = uid.split(":")
+        return plant, task, date.fromisoformat(day)
+    except ValueError:
+        return None
+
+
+def freeze_schedule(plant_schedule: dict[str, Any]) -> MappingProxyType:
+    """Return a read-only copy of a schedule that is safe to hand to the executor."""
+    return MappingProxyType({
+        key: tuple(value) if isinstance(value, list) else value
+        for key, value in plant_schedule.items()
+    })
@@ -1,12 +1,33 @@
 """Sensor platform for Orchard Care integration."""
+from collections.abc import Iterable
 from datetime import datetime, timedelta
-from homeassistant.components.sensor import SensorEntity, SensorDeviceClass
+from homeassistant.components.sensor import SensorEntity, SensorDeviceClass, SensorStateClass
+from homeassistant.const import PERCENTAGE, UnitOfPrecipitationDepth, UnitOfTime
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.entity import EntityCategory
+from homeassistant.util import dt as dt_util
 
 from . import DOMAIN, OrchardCareCoordinator, PLANT_CARE_DATA
+from .const import (
+    CONF_ENTITY_MODE,
+    CONF_SENSOR_STATE,
+    ENTITY_MODE_AGGREGATE,
+    SENSOR_STATE_TIMESTAMP,
+    TASK_PRUNING,
+    TASK_SPRAY,
+)
+from .irrigation import crop_coefficient
+from .products import get_spray_product
+from .schedule import iter_task_starts
+
+MAX_CONFLICT_ATTRIBUTES = 20
+
+WORKLOAD_FORECAST_DAYS = (7, 30)
+
+# Tasks recur yearly; two years still finds one when this year's is already done
+NEXT_TASK_LOOKAHEAD = timedelta(days=2 * 366)
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -16,16 +37,109 @@ async def async_setup_entry(
     """Set up Orchard Care sensor based on a config entry."""
     coordinator = hass.data[DOMAIN][config_entry.entry_id]
 
+    # Labor forecasts are orchard-wide, so they exist in every entity mode
+    workload_sensors = [
+        OrchardCareWorkloadSensor(coordinator, config_entry, days)
+        for days in WORKLOAD_FORECAST_DAYS
+    ]
+
+    # Aggregate mode exposes a fixed set of orchard-wide sensors
+    if coordinator.get_option(CONF_ENTITY_MODE) == ENTITY_MODE_AGGREGATE:
+        entities = [
+            OrchardCareTasksDueSensor(coordinator, config_entry),
+            OrchardCareNextTaskSensor(coordinator, config_entry, TASK_PRUNING),
+            OrchardCareNextTaskSensor(coordinator, config_entry, TASK_SPRAY),
+            OrchardCarePlantingsSensor(coordinator, config_entry),
+            *workload_sensors,
+        ]
+        if coordinator.irrigation_enabled:
+            entities.append(OrchardCareOrchardWaterDeficitSensor(coordinator, config_entry))
+        if coordinator.chill_enabled:
+            entities.append(OrchardCareOrchardChillSensor(coordinator, config_entry))
+        async_add_entities(entities)
+        return
+
     entities = []
-    selected_plants = config_entry.data.get("selected_plants", [])
+    selected_plants = coordinator.get_option("selected_plants", [])
 
     for plant in selected_plants:
         entities.extend([
             OrchardCarePruningSensor(coordinator, plant, config_entry),
             OrchardCareSpraySensor(coordinator, plant, config_entry),
         ])
+        if coordinator.irrigation_enabled:
+            entities.append(OrchardCareWaterDeficitSensor(coordinator, plant, config_entry))
+        if coordinator.chill_enabled and PLANT_CARE_DATA.get(plant, {}).get("chill_requirement"):
+            entities.append(OrchardCareChillSensor(coordinator, plant, config_entry))
+
+    async_add_entities([*entities, *workload_sensors])
+
+def _format_next_date(next_date: datetime | None) -> str:
+    """Return the human readable time until a task."""
+    if next_date:
+        days_until = (next_date - datetime.now()).days
+        if days_until <= 0:
+            return "Now"
+        elif days_until <= 30:
+            return f"In {days_until} days"
+        else:
+            return next_date.strftime("%B %Y")
+    return "Not scheduled"
+
+
+class _NextTaskStateMixin:
+    """State of a sensor reporting when a task is next due.
+
+    As text ("In 12 days") the state changes every day. As a timestamp it only
+    changes when the next task date does, and the frontend shows the time left.
+    """
+
+    coordinator: OrchardCareCoordinator
+
+    @property
+    def _timestamp_state(self) -> bool:
+        """Return True when the state is reported as a timestamp."""
+        return self.coordinator.get_option(CONF_SENSOR_STATE) == SENSOR_STATE_TIMESTAMP
+
+    @property
+    def device_class(self) -> SensorDeviceClass | None:
+        """Return the device class."""
+        return SensorDeviceClass.TIMESTAMP if self._timestamp_state else None
+
+    def _next_task_start(self, task: str, plants: Iterable[str]) -> datetime | None:
+        """Return the first calendar start of a task still to be done by any plant."""
+        coordinator = self.coordinator
+        now = datetime.now()
+        # Starts are yielded month by month in schedule order, not by date
+        return min((
+            start
+            for plant in plants
+            for start in iter_task_starts(
+                task,
+                coordinator._data.get(plant, {}).get(f"{task}_months", []),
+                now,
+                now + NEXT_TASK_LOOKAHEAD,
+                coordinator.solar_location,
+            )
+            if not coordinator.completions.is_completed(plant, task, start.date())
+        ), default=None)
+
+    def _next_task_state(
+        self, next_date: datetime | None, task: str, plants: Iterable[str]
+    ) -> datetime | str | None:
+        """Return the state for the next task of some plants.
+
+        The text keeps the month-level date of the schedule. The timestamp is
+        the start of the next calendar event, so it never lies in the past.
+        """
+        if not self._timestamp_state:
+            return _format_next_date(next_date)
+        next_start = self._next_task_start(task, plants)
+        if next_start is None:
+            return None
+        # Schedules use naive local times
+        return next_start.replace(tzinfo=dt_util.get_default_time_zone())
 
-    async_add_entities(entities)
 
 class OrchardCareBaseSensor(SensorEntity):
     """Base sensor for Orchard Care."""
@@ -41,19 +155,19 @@ class OrchardCareBaseSensor(SensorEntity):
     def device_info(self):
         """Return device information."""
         return {
-            "identifiers": {(DOMAIN, self.plant)},
+            "identifiers": {(DOMAIN, f"{self.config_entry.entry_id}_{self.plant}")},
             "name": self.plant_data.get("name", self.plant.title()),
             "manufacturer": "Orchard Care",
             "model": "Fruit Tree/Berry Care",
         }
 
-class OrchardCarePruningSensor(OrchardCareBaseSensor):
+class OrchardCarePruningSensor(_NextTaskStateMixin, OrchardCareBaseSensor):
     """Sensor for pruning schedule."""
 
     @property
     def unique_id(self):
         """Return unique ID."""
-        return f"{DOMAIN}_{self.plant}_pruning"
+        return f"{DOMAIN}_{self.config_entry.entry_id}_{self.plant}_pruning"
 
     @property
     def name(self):
@@ -69,36 +183,32 @@ class OrchardCarePruningSensor(OrchardCareBaseSensor):
     def native_value(self):
         """Return the state."""
         plant_schedule = self.coordinator._data.get(self.plant, {})
-        next_pruning = plant_schedule.get("next_pruning")
-
-        if next_pruning:
-            days_until = (next_pruning - datetime.now()).days
-            if days_until <= 0:
-                return "Now"
-            elif days_until <= 30:
-                return f"In {days_until} days"
-            else:
-                return next_pruning.strftime("%B %Y")
-        return "Not scheduled"
+        return self._next_task_state(plant_schedule.get("next_pruning"), TASK_PRUNING, [self.plant])
 
     @property
     def extra_state_attributes(self):
         """Return additional attributes."""
         plant_schedule = self.coordinator._data.get(self.plant, {})
-        return {
+        attributes = {
             "pruning_months": plant_schedule.get("pruning_months", []),
             "next_pruning_date": plant_schedule.get("next_pruning"),
             "care_notes": self.plant_data.get("care_notes", ""),
             "plant_type": self.plant_data.get("name", self.plant.title())
         }
+        if self.coordinator.chill_enabled:
+            chill = self.coordinator.chill.status(self.plant, datetime.now().date())
+            if chill:
+                attributes["late_pruning_from"] = chill["late_pruning_from"]
+                attributes["chill_guidance"] = chill["guidance"]
+        return attributes
 
-class OrchardCareSpraySensor(OrchardCareBaseSensor):
+class OrchardCareSpraySensor(_NextTaskStateMixin, OrchardCareBaseSensor):
     """Sensor for spraying schedule."""
 
     @property
     def unique_id(self):
         """Return unique ID."""
-        return f"{DOMAIN}_{self.plant}_spray"
+        return f"{DOMAIN}_{self.config_entry.entry_id}_{self.plant}_spray"
 
     @property
     def name(self):
@@ -114,30 +224,390 @@ class OrchardCareSpraySensor(OrchardCareBaseSensor):
     def native_value(self):
         """Return the state."""
         plant_schedule = self.coordinator._data.get(self.plant, {})
-        next_spray = plant_schedule.get("next_spray")
-
-        if next_spray:
-            days_until = (next_spray - datetime.now()).days
-            if days_until <= 0:
-                return "Now"
-            elif days_until <= 30:
-                return f"In {days_until} days"
-            else:
-                return next_spray.strftime("%B %Y")
-        return "Not scheduled"
+        return self._next_task_state(plant_schedule.get("next_spray"), TASK_SPRAY, [self.plant])
 
     @property
     def extra_state_attributes(self):
         """Return additional attributes."""
         plant_schedule = self.coordinator._data.get(self.plant, {})
-        organic_pref = self.config_entry.data.get("organic_preference", True)
+        organic_pref = self.coordinator.get_option("organic_preference", True)
         spray_type = "organic" if organic_pref else "conventional"
 
+        conflicts = self.coordinator.get_conflicts(self.plant)
+
         return {
             "spray_months": plant_schedule.get("spray_months", []),
             "next_spray_date": plant_schedule.get("next_spray"),
             "spray_products": plant_schedule.get("spray_products", []),
+            "product_details": [
+                get_spray_product(name).as_dict()
+                for name in plant_schedule.get("spray_products", [])[:3]
+            ],
+            "conflicts": [conflict.as_dict() for conflict in conflicts],
             "spray_type": spray_type,
             "care_notes": self.plant_data.get("care_notes", ""),
             "plant_type": self.plant_data.get("name", self.plant.title())
-        }
\ No newline at end of file
+        }
+
+class OrchardCareWaterDeficitSensor(OrchardCareBaseSensor):
+    """Sensor for the root-zone water deficit of a planting."""
+
+    _attr_native_unit_of_measurement = UnitOfPrecipitationDepth.MILLIMETERS
+    _attr_state_class = SensorStateClass.MEASUREMENT
+
+    @property
+    def unique_id(self):
+        """Return unique ID."""
+        return f"{DOMAIN}_{self.config_entry.entry_id}_{self.plant}_water_deficit"
+
+    @property
+    def name(self):
+        """Return the name."""
+        return f"{self.plant_data.get('name', self.plant.title())} Water Deficit"
+
+    @property
+    def icon(self):
+        """Return the icon."""
+        return "mdi:water-alert"
+
+    @property
+    def native_value(self):
+        """Return the water needed to refill the root zone."""
+        return self.coordinator.irrigation.depletion.get(self.plant, 0.0)
+
+    @property
+    def extra_state_attributes(self):
+        """Return additional attributes."""
+        plant_schedule = self.coordinator._data.get(self.plant, {})
+        start, amount = self.coordinator.irrigation_plan.get(self.plant, (None, None))
+        return {
+            "next_irrigation": start,
+            "irrigation_amount_mm": amount,
+            "crop_coefficient": crop_coefficient(plant_schedule, datetime.now().month),
+            "root_zone_water_mm": plant_schedule.get("root_zone_water_mm"),
+            "plant_type": self.plant_data.get("name", self.plant.title())
+        }
+
+class OrchardCareChillSensor(OrchardCareBaseSensor):
+    """Sensor for progress towards a planting's winter chill requirement."""
+
+    _attr_native_unit_of_measurement = PERCENTAGE
+    _attr_state_class = SensorStateClass.MEASUREMENT
+
+    @property
+    def unique_id(self):
+        """Return unique ID."""
+        return f"{DOMAIN}_{self.config_entry.entry_id}_{self.plant}_chill"
+
+    @property
+    def name(self):
+        """Return the name."""
+        return f"{self.plant_data.get('name', self.plant.title())} Chill"
+
+    @property
+    def icon(self):
+        """Return the icon."""
+        return "mdi:snowflake-thermometer"
+
+    def _status(self) -> dict:
+        """Return the planting's chill status."""
+        return self.coordinator.chill.status(self.plant, datetime.now().date()) or {}
+
+    @property
+    def native_value(self):
+        """Return the share of the chill requirement met this season."""
+        return self._status().get("progress")
+
+    @property
+    def extra_state_attributes(self):
+        """Return additional attributes."""
+        status = self._status()
+        return {
+            "chill_hours": status.get("chill_hours"),
+            "chill_units": status.get("chill_units"),
+            "chill_portions": status.get("chill_portions"),
+            "chill_requirement": status.get("required"),
+            "dormancy_satisfied": status.get("satisfied"),
+            "late_pruning_from": status.get("late_pruning_from"),
+            "guidance": status.get("guidance"),
+            "season_start": status.get("season_start"),
+            "plant_type": self.plant_data.get("name", self.plant.title())
+        }
+
+class OrchardCareAggregateSensor(SensorEntity):
+    """Base sensor for orchard-wide figures that do not grow with orchard size.
+
+    Unique IDs include the entry ID so several orchards can run side by side.
+    """
+
+    def __init__(self, coordinator: OrchardCareCoordinator, config_entry: ConfigEntry):
+        """Initialize the sensor."""
+        self.coordinator = coordinator
+        self.config_entry = config_entry
+
+    @property
+    def device_info(self):
+        """Return device information."""
+        return {
+            "identifiers": {(DOMAIN, f"{self.config_entry.entry_id}_master")},
+            "name": "Orchard Care Master",
+            "manufacturer": "Orchard Care",
+            "model": "All Plants Combined",
+        }
+
+class OrchardCareTasksDueSensor(OrchardCareAggregateSensor):
+    """Sensor counting care tasks due in the next seven days."""
+
+    _attr_native_unit_of_measurement = "tasks"
+
+    @property
+    def unique_id(self):
+        """Return unique ID."""
+        return f"{DOMAIN}_{self.config_entry.entry_id}_tasks_due_week"
+
+    @property
+    def name(self):
+        """Return the name."""
+        return "Orchard Tasks Due This Week"
+
+    @property
+    def icon(self):
+        """Return the icon."""
+        return "mdi:calendar-check"
+
+    @property
+    def native_value(self):
+        """Return the number of block tasks due this week."""
+        tasks = self.coordinator.summary.get("tasks_due_week", [])
+        return sum(task["blocks"] for task in tasks)
+
+    @property
+    def extra_state_attributes(self):
+        """Return additional attributes."""
+        tasks = self.coordinator.summary.get("tasks_due_week", [])
+        return {
+            "tasks": tasks,
+            "plants_affected": sum(task["plants"] for task in tasks),
+        }
+
+class OrchardCareNextTaskSensor(_NextTaskStateMixin, OrchardCareAggregateSensor):
+    """Sensor for the next pruning or spray across the orchard."""
+
+    def __init__(self, coordinator: OrchardCareCoordinator, config_entry: ConfigEntry, task: str):
+        """Initialize the sensor."""
+        super().__init__(coordinator, config_entry)
+        self.task = task
+
+    @property
+    def unique_id(self):
+        """Return unique ID."""
+        return f"{DOMAIN}_{self.config_entry.entry_id}_next_{self.task}"
+
+    @property
+    def name(self):
+        """Return the name."""
+        return f"Orchard Next {self.task.title()}"
+
+    @property
+    def icon(self):
+        """Return the icon."""
+        return "mdi:content-cut" if self.task == TASK_PRUNING else "mdi:spray"
+
+    @property
+    def native_value(self):
+        """Return the state."""
+        next_task = self.coordinator.summary.get("next_task", {}).get(self.task, {})
+        return self._next_task_state(
+            next_task.get("date"), self.task, self.coordinator.summary.get("species", {})
+        )
+
+    @property
+    def extra_state_attributes(self):
+        """Return additional attributes."""
+        next_task = self.coordinator.summary.get("next_task", {}).get(self.task, {})
+        attributes = {
+            "next_date": next_task.get("date"),
+            "plants": next_task.get("plants", []),
+            "blocks": next_task.get("blocks", 0),
+        }
+        if self.task == TASK_SPRAY:
+            now = datetime.now()
+            upcoming = [conflict for conflict in self.coordinator.conflicts if conflict.date >= now]
+            attributes["conflict_count"] = len(upcoming)
+            attributes["conflicts"] = [
+                conflict.as_dict() for conflict in upcoming[:MAX_CONFLICT_ATTRIBUTES]
+            ]
+        return attributes
+
+class OrchardCarePlantingsSensor(OrchardCareAggregateSensor):
+    """Sensor with the orchard size and per-species rollups."""
+
+    _attr_native_unit_of_measurement = "plants"
+
+    @property
+    def unique_id(self):
+        """Return unique ID."""
+        return f"{DOMAIN}_{self.config_entry.entry_id}_plantings"
+
+    @property
+    def name(self):
+        """Return the name."""
+        return "Orchard Plantings"
+
+    @property
+    def icon(self):
+        """Return the icon."""
+        return "mdi:tree"
+
+    @property
+    def native_value(self):
+        """Return the total number of plants."""
+        return self.coordinator.summary.get("total_plants", 0)
+
+    @property
+    def extra_state_attributes(self):
+        """Return additional attributes."""
+        return {
+            "blocks": self.coordinator.summary.get("total_blocks", 0),
+            "species": self.coordinator.summary.get("species", {}),
+        }
+
+class OrchardCareWorkloadSensor(OrchardCareAggregateSensor):
+    """Sensor forecasting labor hours due over the next days."""
+
+    _attr_native_unit_of_measurement = UnitOfTime.HOURS
+    _attr_state_class = SensorStateClass.MEASUREMENT
+
+    def __init__(self, coordinator: OrchardCareCoordinator, config_entry: ConfigEntry, days: int):
+        """Initialize the sensor."""
+        super().__init__(coordinator, config_entry)
+        self.days = days
+
+    @property
+    def unique_id(self):
+        """Return unique ID."""
+        return f"{DOMAIN}_{self.config_entry.entry_id}_labor_hours_{self.days}d"
+
+    @property
+    def name(self):
+        """Return the name."""
+        return f"Orchard Labor Next {self.days} Days"
+
+    @property
+    def icon(self):
+        """Return the icon."""
+        return "mdi:account-hard-hat"
+
+    def _forecast(self) -> dict:
+        """Return the forecast summary from the workload index."""
+        if self.coordinator.workload is None:
+            return {}
+        today = datetime.now().date()
+        return self.coordinator.workload.summary(today, today + timedelta(days=self.days - 1))
+
+    @property
+    def native_value(self):
+        """Return the labor hours due."""
+        return self._forecast().get("hours")
+
+    @property
+    def extra_state_attributes(self):
+        """Return additional attributes."""
+        forecast = self._forecast()
+        return {
+            "hours_by_task": forecast.get("by_task", {}),
+            "start_date": forecast.get("start_date"),
+            "end_date": forecast.get("end_date"),
+        }
+
+class OrchardCareOrchardWaterDeficitSensor(OrchardCareAggregateSensor):
+    """Sensor for the largest water deficit across the orchard."""
+
+    _attr_native_unit_of_measurement = UnitOfPrecipitationDepth.MILLIMETERS
+    _attr_state_class = SensorStateClass.MEASUREMENT
+
+    @property
+    def unique_id(self):
+        """Return unique ID."""
+        return f"{DOMAIN}_{self.config_entry.entry_id}_water_deficit"
+
+    @property
+    def name(self):
+        """Return the name."""
+        return "Orchard Water Deficit"
+
+    @property
+    def icon(self):
+        """Return the icon."""
+        return "mdi:water-alert"
+
+    @property
+    def native_value(self):
+        """Return the largest deficit of any planting."""
+        return max(self.coordinator.irrigation.depletion.values(), default=0.0)
+
+    @property
+    def extra_state_attributes(self):
+        """Return additional attributes."""
+        irrigation = self.coordinator.irrigation
+        plan = self.coordinator.irrigation_plan
+        return {
+            "reference_et0": irrigation.recent_et0[-1] if irrigation.recent_et0 else None,
+            "plantings": {
+                plant: {
+                    "deficit_mm": irrigation.depletion.get(plant, 0.0),
+                    "next_irrigation": plan[plant][0].isoformat() if plant in plan else None,
+                    "irrigation_amount_mm": plan[plant][1] if plant in plan else None,
+                }
+                for plant in self.coordinator._data
+            },
+        }
+
+class OrchardCareOrchardChillSensor(OrchardCareAggregateSensor):
+    """Sensor for the season's chill portions with per-planting progress."""
+
+    _attr_native_unit_of_measurement = "portions"
+    _attr_state_class = SensorStateClass.MEASUREMENT
+
+    @property
+    def unique_id(self):
+        """Return unique ID."""
+        return f"{DOMAIN}_{self.config_entry.entry_id}_chill"
+
+    @property
+    def name(self):
+        """Return the name."""
+        return "Orchard Chill"
+
+    @property
+    def icon(self):
+        """Return the icon."""
+        return "mdi:snowflake-thermometer"
+
+    @property
+    def native_value(self):
+        """Return the Dynamic model chill portions accumulated this season."""
+        return round(self.coordinator.chill.totals["portions"], 1)
+
+    @property
+    def extra_state_attributes(self):
+        """Return additional attributes."""
+        chill = self.coordinator.chill
+        today = datetime.now().date()
+        plantings = {}
+        for plant in self.coordinator._data:
+            status = chill.status(plant, today)
+            if status:
+                plantings[plant] = {
+                    "progress": status["progress"],
+                    "satisfied": status["satisfied"],
+                    "late_pruning_from": status["late_pruning_from"],
+                    "guidance": status["guidance"],
+                }
+        return {
+            "season_start": chill.season,
+            "chill_hours": round(chill.totals["hours"]),
+            "chill_units": round(chill.totals["units"], 1),
+            "portions_per_day": chill.daily_rate(),
+            "plantings": plantings,
+        }
@@ -0,0 +1,373 @@
+"""Services for the Orchard Care integration."""
+import csv
+import logging
+import os
+from datetime import date, datetime, timedelta
+from functools import partial
+from typing import Any
+
+import voluptuous as vol
+
+from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse, SupportsResponse
+from homeassistant.exceptions import ServiceValidationError
+import homeassistant.helpers.config_validation as cv
+
+from .climate import parse_zone, zone_for_site
+from .const import (
+    CLIMATE_ZONE_AUTO,
+    CONF_BLOCKS,
+    CONF_CLIMATE_ZONE,
+    CONF_PLANT_OVERRIDES,
+    DOMAIN,
+    PLAN_BATCH_SIZE,
+    PLAN_OVERRIDE_FIELDS,
+    PLANT_TYPES,
+    SIMULATION_MAX_SCENARIOS,
+)
+from .plan import (
+    PLAN_FORMATS,
+    PlanError,
+    PlanImport,
+    iter_plan_rows,
+    plan_format,
+    plan_rows,
+    write_plan,
+)
+from .simulate import Scenario, async_get_simulation_pool
+
+_LOGGER = logging.getLogger(__name__)
+
+SERVICE_QUERY = "query"
+SERVICE_IMPORT_PLAN = "import_plan"
+SERVICE_EXPORT_PLAN = "export_plan"
+SERVICE_SIMULATE = "simulate"
+
+QUERY_OVERVIEW = "overview"
+QUERY_BLOCKS = "blocks"
+QUERY_WORKLOAD = "workload"
+QUERY_COMPLETIONS = "completions"
+QUERY_TYPES = [QUERY_OVERVIEW, QUERY_BLOCKS, QUERY_WORKLOAD, QUERY_COMPLETIONS]
+
+QUERY_SCHEMA = vol.Schema({
+    vol.Optional("query", default=QUERY_OVERVIEW): vol.In(QUERY_TYPES),
+    vol.Optional("entry_id"): cv.string,
+    vol.Optional("plant"): cv.string,
+    vol.Optional("location"): cv.string,
+    vol.Optional("start_date"): cv.date,
+    vol.Optional("end_date"): cv.date,
+    vol.Optional("season"): vol.Coerce(int),
+})
+
+PLAN_MODE_REPLACE = "replace"
+PLAN_MODE_MERGE = "merge"
+
+IMPORT_PLAN_SCHEMA = vol.Schema({
+    vol.Optional("entry_id"): cv.string,
+    vol.Required("path"): cv.string,
+    vol.Optional("format"): vol.In(PLAN_FORMATS),
+    vol.Optional("mode", default=PLAN_MODE_REPLACE): vol.In([PLAN_MODE_REPLACE, PLAN_MODE_MERGE]),
+    vol.Optional("dry_run", default=False): cv.boolean,
+})
+
+EXPORT_PLAN_SCHEMA = vol.Schema({
+    vol.Optional("entry_id"): cv.string,
+    vol.Optional("path"): cv.string,
+    vol.Optional("format"): vol.In(PLAN_FORMATS),
+})
+
+_MONTHS = vol.All(cv.ensure_list, [vol.All(vol.Coerce(int), vol.Range(min=1, max=12))])
+
+SCENARIO_SCHEMA = vol.Schema({
+    vol.Required("name"): cv.string,
+    vol.Optional("plants"): vol.Any(
+        {vol.In(PLANT_TYPES): vol.All(vol.Coerce(int), vol.Range(min=0))},
+        vol.All(cv.ensure_list, [vol.In(PLANT_TYPES)]),
+    ),
+    vol.Optional("season"): vol.Coerce(int),
+    vol.Optional("hemisphere"): vol.In(["northern", "southern"]),
+    vol.Optional("organic_preference"): cv.boolean,
+    vol.Optional("climate_zone"): cv.string,
+    vol.Optional("overrides"): {vol.In(PLANT_TYPES): {vol.In(PLAN_OVERRIDE_FIELDS): _MONTHS}},
+    vol.Optional("weather_file"): cv.string,
+})
+
+SIMULATE_SCHEMA = vol.Schema({
+    vol.Optional("entry_id"): cv.string,
+    vol.Required("scenarios"): vol.All(
+        cv.ensure_list, vol.Length(min=1, max=SIMULATION_MAX_SCENARIOS), [SCENARIO_SCHEMA]
+    ),
+})
+
+
+async def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the Orchard Care services."""
+    if hass.services.has_service(DOMAIN, SERVICE_QUERY):
+        return
+
+    async def async_handle_query(call: ServiceCall) -> ServiceResponse:
+        """Answer a batched query across all orchard coordinators."""
+        coordinators = _get_coordinators(hass, call.data.get("entry_id"))
+        query = call.data["query"]
+
+        if query == QUERY_WORKLOAD:
+            return _query_workload(coordinators, call.data)
+
+        if query == QUERY_COMPLETIONS:
+            return _query_completions(coordinators, call.data)
+
+        # Overview: one row per planting so dashboards need a single round trip
+        rows: list[dict[str, Any]] = []
+        for coordinator in coordinators:
+            rows.extend(coordinator.get_overview_rows())
+
+        if query == QUERY_BLOCKS:
+            plant = call.data.get("plant")
+            location = call.data.get("location")
+            blocks = [
+                row for row in rows
+                if (plant is None or row["plant"] == plant)
+                and (location is None or row["location"] == location)
+            ]
+            species: dict[str, dict[str, Any]] = {}
+            for coordinator in coordinators:
+                for key, rollup in coordinator.summary.get("species", {}).items():
+                    species.setdefault(key, {}).update(_serialize(rollup))
+            return {"blocks": blocks, "count": len(blocks), "species": species}
+
+        return {"plantings": rows, "count": len(rows)}
+
+    async def async_handle_import_plan(call: ServiceCall) -> ServiceResponse:
+        """Import blocks from a plan file with a single entry update."""
+        coordinator = _get_target_coordinator(hass, call.data.get("entry_id"))
+        path = _resolve_plan_path(hass, call.data["path"])
+        plan = await _async_read_plan(hass, path, call.data.get("format"))
+
+        entry = coordinator.entry
+        blocks = plan.blocks
+        overrides = plan.overrides
+        if call.data["mode"] == PLAN_MODE_MERGE:
+            merged = {block.block_id: block for block in coordinator.blocks}
+            merged.update((block.block_id, block) for block in plan.blocks)
+            blocks = list(merged.values())
+            overrides = dict(coordinator.get_option(CONF_PLANT_OVERRIDES, {}))
+            for plant, months in plan.overrides.items():
+                overrides[plant] = {**overrides.get(plant, {}), **months}
+
+        # One update means one reload and one batched entity registration
+        if plan.blocks and not call.data["dry_run"]:
+            planted = (CONF_BLOCKS, "selected_plants", CONF_PLANT_OVERRIDES)
+            hass.config_entries.async_update_entry(
+                entry,
+                data={
+                    **entry.data,
+                    CONF_BLOCKS: [block.as_dict() for block in blocks],
+                    "selected_plants": list(dict.fromkeys(block.plant for block in blocks)),
+                    CONF_PLANT_OVERRIDES: overrides,
+                },
+                # The imported plan replaces plantings chosen in the options flow
+                options={key: value for key, value in entry.options.items() if key not in planted},
+            )
+
+        return {
+            "entry_id": entry.entry_id,
+            "dry_run": call.data["dry_run"],
+            "imported": len(plan.blocks),
+            "errors": plan.error_count,
+            "blocks": len(blocks),
+            "rows": plan.results,
+        }
+
+    async def async_handle_export_plan(call: ServiceCall) -> ServiceResponse:
+        """Export an orchard's blocks to a plan file or the response."""
+        coordinator = _get_target_coordinator(hass, call.data.get("entry_id"))
+        rows = plan_rows(
+            coordinator.blocks, coordinator.get_option(CONF_PLANT_OVERRIDES, {})
+        )
+        if "path" not in call.data:
+            blocks = list(rows)
+            return {"blocks": blocks, "count": len(blocks)}
+
+        path = _resolve_plan_path(hass, call.data["path"])
+        try:
+            fmt = plan_format(path, call.data.get("format"))
+            count = await hass.async_add_executor_job(write_plan, path, fmt, rows)
+        except (PlanError, OSError) as err:
+            raise ServiceValidationError(f"Cannot write plan {path}: {err}") from err
+        return {"path": path, "format": fmt, "count": count}
+
+    async def async_handle_simulate(call: ServiceCall) -> ServiceResponse:
+        """Compare season scenarios in the simulation process pool."""
+        coordinator = _get_target_coordinator(hass, call.data.get("entry_id"))
+        scenarios = [_build_scenario(hass, coordinator, spec) for spec in call.data["scenarios"]]
+        results = await async_get_simulation_pool(hass).async_run(scenarios)
+        return {"scenarios": results, "count": len(results)}
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_QUERY,
+        async_handle_query,
+        schema=QUERY_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_IMPORT_PLAN,
+        async_handle_import_plan,
+        schema=IMPORT_PLAN_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_EXPORT_PLAN,
+        async_handle_export_plan,
+        schema=EXPORT_PLAN_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SIMULATE,
+        async_handle_simulate,
+        schema=SIMULATE_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+
+
+async def _async_read_plan(
+    hass: HomeAssistant, path: str, requested_format: str | None
+) -> PlanImport:
+    """Stream and validate a plan file in executor batches."""
+    try:
+        fmt = plan_format(path, requested_format)
+        plan_file = await hass.async_add_executor_job(
+            partial(open, path, encoding="utf-8", newline="")
+        )
+    except (PlanError, OSError) as err:
+        raise ServiceValidationError(f"Cannot read plan {path}: {err}") from err
+
+    plan = PlanImport()
+    try:
+        rows = iter_plan_rows(plan_file, fmt)
+        while await hass.async_add_executor_job(plan.read_batch, rows, PLAN_BATCH_SIZE):
+            pass
+    except (PlanError, csv.Error, UnicodeDecodeError) as err:
+        raise ServiceValidationError(f"Cannot read plan {path}: {err}") from err
+    finally:
+        await hass.async_add_executor_job(plan_file.close)
+    return plan
+
+
+def _query_workload(coordinators: list, data: dict[str, Any]) -> ServiceResponse:
+    """Return labor hours between two dates, per orchard and combined."""
+    start = data.get("start_date") or date.today()
+    end = data.get("end_date") or start + timedelta(days=6)
+    if end < start:
+        raise ServiceValidationError("end_date must not be before start_date")
+
+    sites = {}
+    by_task: dict[str, float] = {}
+    for coordinator in coordinators:
+        if coordinator.workload is None:
+            continue
+        site = coordinator.workload.summary(start, end)
+        sites[coordinator.entry.entry_id] = site
+        for task, hours in site["by_task"].items():
+            by_task[task] = by_task.get(task, 0.0) + hours
+
+    return {
+        "start_date": start.isoformat(),
+        "end_date": end.isoformat(),
+        "hours": sum(by_task.values()),
+        "by_task": by_task,
+        "sites": sites,
+    }
+
+
+def _query_completions(coordinators: list, data: dict[str, Any]) -> ServiceResponse:
+    """Return completed tasks for one season from the indexed completion logs."""
+    season = data.get("season") or date.today().year
+    records = []
+    for coordinator in coordinators:
+        plants = [data["plant"]] if data.get("plant") else list(coordinator._data)
+        for plant in plants:
+            for record in coordinator.completions.season_records(plant, season):
+                records.append({**record, "entry_id": coordinator.entry.entry_id})
+    return {"season": season, "completed": records, "count": len(records)}
+
+
+def _build_scenario(hass: HomeAssistant, coordinator, spec: dict[str, Any]) -> Scenario:
+    """Return a scenario, taking whatever it leaves out from the orchard."""
+    plants = spec.get("plants")
+    if plants is None:
+        plants = {}
+        for block in coordinator.blocks:
+            plants[block.plant] = plants.get(block.plant, 0) + block.count
+        for plant in coordinator.get_option("selected_plants", []):
+            plants.setdefault(plant, 1)
+    elif isinstance(plants, list):
+        plants = dict.fromkeys(plants, 1)
+
+    setting = spec.get("climate_zone", coordinator.get_option(CONF_CLIMATE_ZONE))
+    if setting and setting.strip().lower() != CLIMATE_ZONE_AUTO and parse_zone(setting) is None:
+        raise ServiceValidationError(f"Unknown climate zone '{setting}' in {spec['name']}")
+
+    # Scenario months replace the orchard's field by field
+    overrides = {
+        plant: dict(months)
+        for plant, months in coordinator.get_option(CONF_PLANT_OVERRIDES, {}).items()
+    }
+    for plant, months in spec.get("overrides", {}).items():
+        overrides.setdefault(plant, {}).update(months)
+
+    weather_file = spec.get("weather_file")
+    if weather_file:
+        weather_file = _resolve_plan_path(hass, weather_file)
+
+    return Scenario(
+        name=spec["name"],
+        plants=plants,
+        season=spec.get("season") or date.today().year,
+        hemisphere=spec.get("hemisphere", coordinator.get_option("hemisphere", "northern")),
+        organic_preference=spec.get(
+            "organic_preference", coordinator.get_option("organic_preference", True)
+        ),
+        climate_zone=zone_for_site(setting, hass.config.latitude),
+        overrides=overrides,
+        location=coordinator.solar_location,
+        latitude=hass.config.latitude,
+        weather_file=weather_file,
+    )
+
+
+def _serialize(data: dict[str, Any]) -> dict[str, Any]:
+    """Convert datetimes in a flat dict to ISO strings for service responses."""
+    return {
+        key: value.isoformat() if isinstance(value, datetime) else value
+        for key, value in data.items()
+    }
+
+
+def _resolve_plan_path(hass: HomeAssistant, path: str) -> str:
+    """Return the absolute path of a plan or weather file, relative to the config directory."""
+    full_path = path if os.path.isabs(path) else hass.config.path(path)
+    if not hass.config.is_allowed_path(full_path):
+        raise ServiceValidationError(f"{path} is not in an allowed directory")
+    return full_path
+
+
+def _get_target_coordinator(hass: HomeAssistant, entry_id: str | None):
+    """Return the one coordinator a plan or simulation service applies to."""
+    coordinators = _get_coordinators(hass, entry_id)
+    if not coordinators:
+        raise ServiceValidationError("No matching Orchard Care entry")
+    if len(coordinators) > 1:
+        raise ServiceValidationError("Several orchards are configured; set entry_id")
+    return coordinators[0]
+
+
+def _get_coordinators(hass: HomeAssistant, entry_id: str | None) -> list:
+    """Return the coordinators a service call applies to."""
+    coordinators = hass.data.get(DOMAIN, {})
+    if entry_id:
+        coordinator = coordinators.get(entry_id)
+        return [coordinator] if coordinator else []
+    return list(coordinators.values())
@@ -0,0 +1,253 @@
+"""Season what-if simulation for the Orchard Care integration.
+
+A scenario is an orchard variant: which plants and how many, hemisphere,
+spray program, climate zone, month overrides and optionally a year of
+recorded weather. Scenarios are evaluated in a pool of worker processes with
+the same schedule compiler, occurrence generators, workload index and
+conflict checks the live orchard uses, so large batches run in parallel and
+never hold the event loop.
+"""
+import csv
+import multiprocessing
+import os
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from functools import lru_cache
+from typing import Any
+
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import Event, HomeAssistant, callback
+
+from .blocks import OrchardBlock
+from .conflicts import find_conflicts
+from .const import (
+    CONF_HUMIDITY_SENSOR,
+    CONF_RAIN_SENSOR,
+    CONF_SOLAR_RADIATION_SENSOR,
+    CONF_TEMPERATURE_SENSOR,
+    CONF_WIND_SPEED_SENSOR,
+    TASK_PRUNING,
+    TASK_SPRAY,
+)
+from .irrigation import (
+    DEFAULT_DEPLETION_FRACTION,
+    DEFAULT_ROOT_ZONE_WATER_MM,
+    DailyWeather,
+    crop_coefficient,
+)
+from .schedule import compile_schedule, iter_task_starts
+from .solar import SolarLocation
+from .workload import build_workload_index
+
+SIMULATION_WORKERS = max(1, min(4, (os.cpu_count() or 1) - 1))
+# Scenarios sent to a worker at a time; small enough to spread a batch evenly
+SIMULATION_CHUNK_SIZE = 16
+
+# Weather file columns and the readings they stand for (°C, %, m/s, W/m², mm)
+WEATHER_COLUMNS = {
+    "temp_min": CONF_TEMPERATURE_SENSOR,
+    "temp_max": CONF_TEMPERATURE_SENSOR,
+    "humidity": CONF_HUMIDITY_SENSOR,
+    "wind_speed": CONF_WIND_SPEED_SENSOR,
+    "solar_radiation": CONF_SOLAR_RADIATION_SENSOR,
+    "rain": CONF_RAIN_SENSOR,
+}
+
+DATA_SIMULATION_POOL = "orchard_care_simulation_pool"
+
+# Set in each worker process when it starts
+_CATALOG: dict[str, dict[str, Any]] = {}
+
+
+@dataclass(frozen=True, slots=True)
+class Scenario:
+    """One orchard variant to simulate for a season."""
+
+    name: str
+    plants: dict[str, int]
+    season: int
+    hemisphere: str = "northern"
+    organic_preference: bool = True
+    climate_zone: str | None = None
+    overrides: dict[str, dict[str, list[int]]] = field(default_factory=dict)
+    location: SolarLocation | None = None
+    latitude: float | None = None
+    weather_file: str | None = None
+
+
+def _init_worker() -> None:
+    """Load the plant catalog once per worker process."""
+    # The package is fully imported by the time a worker runs this
+    from . import PLANT_CARE_DATA
+
+    _CATALOG.update(PLANT_CARE_DATA)
+
+
+@lru_cache(maxsize=8)
+def read_weather(path: str) -> tuple[DailyWeather, ...]:
+    """Read a daily weather file, cached per worker.
+
+    The CSV has a ``date`` column and any of the WEATHER_COLUMNS; blank
+    cells are treated as missing readings.
+    """
+    days = []
+    with open(path, encoding="utf-8", newline="") as weather_file:
+        for row in csv.DictReader(weather_file):
+            weather = DailyWeather(date.fromisoformat(row["date"]))
+            for column, sensor in WEATHER_COLUMNS.items():
+                if row.get(column) not in (None, ""):
+                    weather.add(sensor, float(row[column]))
+            days.append(weather)
+    days.sort(key=lambda weather: weather.day)
+    return tuple(days)
+
+
+def _simulate_irrigation(
+    schedules: dict[str, dict[str, Any]],
+    weather: tuple[DailyWeather, ...],
+    latitude: float,
+    elevation: float,
+) -> dict[str, Any]:
+    """Run the soil water balance over a weather year, refilling when due."""
+    events = 0
+    water = 0.0
+    for schedule in schedules.values():
+        capacity = schedule.get("root_zone_water_mm") or DEFAULT_ROOT_ZONE_WATER_MM
+        readily_available = capacity * (
+            schedule.get("depletion_fraction") or DEFAULT_DEPLETION_FRACTION
+        )
+        depletion = 0.0
+        for day in weather:
+            et0 = day.et0(latitude, elevation)
+            if et0 is None:
+                continue
+            crop_et = crop_coefficient(schedule, day.day.month) * et0
+            depletion = min(max(depletion - day.rain + crop_et, 0.0), capacity)
+            if depletion >= readily_available:
+                events += 1
+                water += depletion
+                depletion = 0.0
+    return {"events": events, "water_mm": round(water, 1)}
+
+
+def simulate_scenario(scenario: Scenario) -> dict[str, Any]:
+    """Return the season's workload, sprays and conflicts for one scenario."""
+    schedules = {
+        plant: compile_schedule(
+            _CATALOG[plant],
+            scenario.hemisphere,
+            scenario.organic_preference,
+            scenario.climate_zone,
+            scenario.overrides.get(plant),
+        )
+        for plant in scenario.plants
+        if plant in _CATALOG
+    }
+    season_start = datetime(scenario.season, 1, 1)
+    season_end = datetime(scenario.season, 12, 31, 23, 59)
+    location = scenario.location
+
+    blocks = [OrchardBlock(plant, plant, count) for plant, count in scenario.plants.items()]
+    workload = build_workload_index(
+        schedules, blocks, season_start.date(), (season_end - season_start).days + 1
+    ).summary(season_start.date(), season_end.date())
+
+    tasks: Counter[str] = Counter()
+    products: Counter[str] = Counter()
+    for schedule in schedules.values():
+        tasks[TASK_PRUNING] += sum(1 for _ in iter_task_starts(
+            TASK_PRUNING, schedule["pruning_months"], season_start, season_end, location
+        ))
+        sprays = sum(1 for _ in iter_task_starts(
+            TASK_SPRAY, schedule["spray_months"], season_start, season_end, location
+        ))
+        tasks[TASK_SPRAY] += sprays
+        # Like the conflict checks, a spray applies the first three products
+        for product in schedule["spray_products"][:3]:
+            products[product] += sprays
+
+    conflicts = find_conflicts(schedules, season_start, season_end, location)
+
+    result = {
+        "name": scenario.name,
+        "season": scenario.season,
+        "climate_zone": scenario.climate_zone,
+        "workload": workload,
+        "pruning": tasks[TASK_PRUNING],
+        "sprays": {"applications": tasks[TASK_SPRAY], "by_product": dict(products)},
+        "conflicts": {
+            "count": len(conflicts),
+            "by_kind": dict(Counter(conflict.kind for conflict in conflicts)),
+            "by_product": dict(Counter(conflict.product for conflict in conflicts)),
+        },
+    }
+    if scenario.weather_file:
+        result["irrigation"] = _simulate_irrigation(
+            schedules,
+            read_weather(scenario.weather_file),
+            scenario.latitude or 0.0,
+            location.elevation if location else 0.0,
+        )
+    return result
+
+
+def simulate_batch(scenarios: list[Scenario]) -> list[dict[str, Any]]:
+    """Simulate scenarios in a worker; a failing scenario reports its error."""
+    results = []
+    for scenario in scenarios:
+        try:
+            results.append(simulate_scenario(scenario))
+        except (OSError, ValueError, KeyError, csv.Error) as err:
+            results.append({"name": scenario.name, "error": str(err)})
+    return results
+
+
+class SimulationPool:
+    """A process pool shared by every simulation."""
+
+    def __init__(self, hass: HomeAssistant, workers: int = SIMULATION_WORKERS) -> None:
+        """Initialize the pool without starting any process."""
+        self.hass = hass
+        # Spawned workers do not inherit the threads and locks of Home Assistant;
+        # they start on the first submitted chunk
+        self._executor = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+        )
+
+    def _run(self, scenarios: list[Scenario]) -> list[dict[str, Any]]:
+        """Fan scenarios out to the workers and wait for them, in order."""
+        chunks = [
+            scenarios[index:index + SIMULATION_CHUNK_SIZE]
+            for index in range(0, len(scenarios), SIMULATION_CHUNK_SIZE)
+        ]
+        return [
+            result
+            for results in self._executor.map(simulate_batch, chunks)
+            for result in results
+        ]
+
+    async def async_run(self, scenarios: list[Scenario]) -> list[dict[str, Any]]:
+        """Simulate scenarios off the event loop."""
+        return await self.hass.async_add_executor_job(self._run, scenarios)
+
+    def shutdown(self) -> None:
+        """Stop the worker processes."""
+        self._executor.shutdown(cancel_futures=True)
+
+
+@callback
+def async_get_simulation_pool(hass: HomeAssistant) -> SimulationPool:
+    """Return the shared simulation pool, stopped with Home Assistant."""
+    if (pool := hass.data.get(DATA_SIMULATION_POOL)) is None:
+        pool = hass.data[DATA_SIMULATION_POOL] = SimulationPool(hass)
+
+        async def _async_shutdown(_event: Event) -> None:
+            await hass.async_add_executor_job(pool.shutdown)
+
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, _async_shutdown)
+    return pool
+
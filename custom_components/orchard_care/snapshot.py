@@ -0,0 +1,69 @@
+"""Persisted schedule snapshot for the Orchard Care integration."""
+import hashlib
+import json
+from datetime import datetime
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN
+
+STORAGE_VERSION = 1
+# Bump when schedule compilation changes so old snapshots are not trusted
+SCHEDULE_VERSION = 1
+# Schedules change at most hourly; a late write only costs a recompute at boot
+SAVE_DELAY = 30
+
+_DATETIME_KEY = "$dt"
+
+
+def config_hash(catalog: dict[str, Any], *parts: Any) -> str:
+    """Return a digest of the catalog and every setting a schedule depends on."""
+    payload = json.dumps([SCHEDULE_VERSION, catalog, *parts], sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def _encode(value: Any) -> Any:
+    """Tag datetimes so they survive the JSON round trip."""
+    if isinstance(value, datetime):
+        return {_DATETIME_KEY: value.isoformat()}
+    if isinstance(value, dict):
+        return {key: _encode(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_encode(item) for item in value]
+    return value
+
+
+def _decode(value: Any) -> Any:
+    """Restore tagged datetimes."""
+    if isinstance(value, dict):
+        if len(value) == 1 and _DATETIME_KEY in value:
+            return datetime.fromisoformat(value[_DATETIME_KEY])
+        return {key: _decode(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_decode(item) for item in value]
+    return value
+
+
+class ScheduleSnapshot:
+    """The last compiled schedules, keyed by the hash of their inputs."""
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Initialize the snapshot store."""
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}.schedule"
+        )
+
+    async def async_load(self, digest: str) -> dict[str, Any] | None:
+        """Return the stored schedules and summary if they match the digest."""
+        data = await self._store.async_load()
+        if not data or data.get("hash") != digest:
+            return None
+        return _decode(data["snapshot"])
+
+    def async_save(self, digest: str, snapshot: dict[str, Any]) -> None:
+        """Schedule a write of freshly compiled schedules."""
+        self._store.async_delay_save(
+            lambda: {"hash": digest, "snapshot": _encode(snapshot)}, SAVE_DELAY
+        )
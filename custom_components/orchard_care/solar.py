@@ -0,0 +1,84 @@
+"""Solar task timing for the Orchard Care integration."""
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+from zoneinfo import ZoneInfo
+
+from astral import Observer
+from astral.sun import daylight
+
+from .const import (
+    IRRIGATION_DURATION_HOURS,
+    IRRIGATION_HOUR,
+    IRRIGATION_SUNRISE_OFFSET_MINUTES,
+    PRUNING_DURATION_HOURS,
+    PRUNING_HOUR,
+    PRUNING_SUNRISE_OFFSET_MINUTES,
+    SOLAR_CACHE_SIZE,
+    SPRAY_DURATION_HOURS,
+    SPRAY_HOUR,
+    SPRAY_SUNRISE_OFFSET_MINUTES,
+    TASK_IRRIGATION,
+    TASK_PRUNING,
+    TASK_SPRAY,
+)
+
+# Task kind -> (fallback hour, minutes after sunrise, duration in hours)
+TASK_TIMING = {
+    TASK_PRUNING: (PRUNING_HOUR, PRUNING_SUNRISE_OFFSET_MINUTES, PRUNING_DURATION_HOURS),
+    TASK_SPRAY: (SPRAY_HOUR, SPRAY_SUNRISE_OFFSET_MINUTES, SPRAY_DURATION_HOURS),
+    TASK_IRRIGATION: (IRRIGATION_HOUR, IRRIGATION_SUNRISE_OFFSET_MINUTES, IRRIGATION_DURATION_HOURS),
+}
+
+
+@dataclass(frozen=True, slots=True)
+class SolarLocation:
+    """Where the orchard is, used as part of the solar cache key."""
+
+    latitude: float
+    longitude: float
+    elevation: float
+    time_zone: str
+
+    @classmethod
+    def from_config(cls, config) -> "SolarLocation | None":
+        """Build a location from the Home Assistant core config."""
+        if config.latitude is None or config.longitude is None or not config.time_zone:
+            return None
+        return cls(
+            round(config.latitude, 4),
+            round(config.longitude, 4),
+            float(config.elevation or 0),
+            config.time_zone,
+        )
+
+
+@lru_cache(maxsize=SOLAR_CACHE_SIZE)
+def solar_day(location: SolarLocation, day: date) -> tuple[datetime, datetime] | None:
+    """Return naive local sunrise and sunset, or None when the sun does not rise or set."""
+    observer = Observer(location.latitude, location.longitude, location.elevation)
+    try:
+        sunrise, sunset = daylight(observer, day, tzinfo=ZoneInfo(location.time_zone))
+    except ValueError:
+        # Polar day or night
+        return None
+    return sunrise.replace(tzinfo=None), sunset.replace(tzinfo=None)
+
+
+def task_start(task: str, day: date, location: SolarLocation | None = None) -> datetime:
+    """Return when a task starts on a day, relative to sunrise where known.
+
+    On short days the start is brought forward so the task ends by sunset,
+    though never before sunrise.
+    """
+    hour, sunrise_offset, duration_hours = TASK_TIMING[task]
+    times = solar_day(location, day) if location is not None else None
+    if times is None:
+        return datetime(day.year, day.month, day.day, hour, 0)
+
+    sunrise, sunset = times
+    start = sunrise + timedelta(minutes=sunrise_offset)
+    if start + timedelta(hours=duration_hours) > sunset:
+        start = max(sunset - timedelta(hours=duration_hours), sunrise)
+    # Whole minutes keep starts identical to the compact occurrence records
+    return start.replace(second=0, microsecond=0)
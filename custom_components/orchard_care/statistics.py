@@ -0,0 +1,212 @@
+"""Season compliance statistics for the Orchard Care integration.
+
+Tasks due, tasks completed and spray applications per product are published
+per planting as external long-term statistics. Each statistic is a count
+kept as hourly sum rows: ``state`` is the count so far in the season (the
+calendar year) and ``sum`` the running total since the first season, so the
+recorder's statistics API can report any hour, day, week or month without
+reading state history. Rows are only written for hours in which a count
+changes. The rows last written are kept in storage, so a restart does not
+import every statistic again.
+"""
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import datetime, tzinfo
+from typing import Any
+
+from homeassistant.components.recorder import get_instance
+from homeassistant.components.recorder.models import (
+    StatisticData,
+    StatisticMeanType,
+    StatisticMetaData,
+)
+from homeassistant.components.recorder.statistics import async_add_external_statistics
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util, slugify
+
+from .const import DOMAIN, PLANT_TYPES, TASK_PRUNING, TASK_SPRAY
+from .schedule import iter_occurrences
+from .solar import SolarLocation
+
+TRACKED_TASKS = (TASK_PRUNING, TASK_SPRAY)
+
+STORAGE_VERSION = 1
+# Losing the last write only costs importing the same rows once more
+SAVE_DELAY = 30
+
+type StatisticRow = tuple[datetime, int, int]
+
+
+@dataclass(frozen=True, slots=True)
+class CountStatistic:
+    """The hourly rows of one published count."""
+
+    statistic_id: str
+    name: str
+    rows: tuple[StatisticRow, ...]
+
+
+def statistic_id(entry_id: str, plant: str, metric: str) -> str:
+    """Return the external statistic id of one planting's count."""
+    return f"{DOMAIN}:{slugify(f'{entry_id}_{plant}_{metric}')}"
+
+
+def count_rows(
+    times: Iterable[datetime], first_season: int, now: datetime, time_zone: tzinfo
+) -> tuple[StatisticRow, ...]:
+    """Return (UTC hour, season count, running total) rows for event times.
+
+    Times are naive local times. Every season after the first opens with a
+    row resetting its count, so the state never carries over a new year.
+    """
+    counts: dict[datetime, int] = {}
+    for season in range(first_season + 1, now.year + 1):
+        counts[datetime(season, 1, 1)] = 0
+    for time in times:
+        hour = time.replace(minute=0, second=0, microsecond=0)
+        counts[hour] = counts.get(hour, 0) + 1
+
+    rows = []
+    season, season_count, total = first_season, 0, 0
+    for hour in sorted(counts):
+        if hour.year != season:
+            season, season_count = hour.year, 0
+        season_count += counts[hour]
+        total += counts[hour]
+        start = dt_util.as_utc(hour.replace(tzinfo=time_zone))
+        rows.append((start.replace(minute=0), season_count, total))
+    return tuple(rows)
+
+
+def build_statistics(
+    entry_id: str,
+    schedules: dict[str, dict[str, Any]],
+    completions: Iterable[dict[str, Any]],
+    first_season: int,
+    now: datetime,
+    time_zone: tzinfo,
+    location: SolarLocation | None = None,
+) -> list[CountStatistic]:
+    """Return the compliance counts of every planting up to now.
+
+    Counting starts with the first season, or the earliest completion if the
+    log goes back further, so published rows stay put as years pass.
+    Tasks are due at their scheduled start, taken from the current schedule.
+    Completions count at the time they were marked done, and each completed
+    spray counts one application of every product in the planting's program.
+    """
+    done: dict[tuple[str, str], list[datetime]] = {}
+    for record in completions:
+        if record["task"] in TRACKED_TASKS and record["plant"] in schedules:
+            completed = datetime.fromisoformat(record["completed"])
+            done.setdefault((record["plant"], record["task"]), []).append(completed)
+
+    first_season = min(
+        first_season, now.year, *(time.year for times in done.values() for time in times)
+    )
+    season_start = datetime(first_season, 1, 1)
+
+    statistics = []
+    for plant, schedule in schedules.items():
+        plant_name = PLANT_TYPES.get(plant, plant.title())
+        due: dict[str, list[datetime]] = {task: [] for task in TRACKED_TASKS}
+        for start, task in iter_occurrences(schedule, season_start, now, location):
+            due[task].append(start)
+
+        counts = [
+            *((f"{task}_due", f"{task} due", due[task]) for task in TRACKED_TASKS),
+            *(
+                (f"{task}_completed", f"{task} completed", done.get((plant, task), []))
+                for task in TRACKED_TASKS
+            ),
+            *(
+                (f"spray_{product}", f"{product} applications", done.get((plant, TASK_SPRAY), []))
+                for product in schedule.get("spray_products", [])[:3]
+            ),
+        ]
+        statistics.extend(
+            CountStatistic(
+                statistic_id(entry_id, plant, metric),
+                f"{plant_name} {name}",
+                count_rows(times, first_season, now, time_zone),
+            )
+            for metric, name, times in counts
+        )
+
+    return statistics
+
+
+class ComplianceStatistics:
+    """Publish compliance counts, writing only statistics whose rows changed."""
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Initialize the publisher."""
+        self.hass = hass
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}.statistics"
+        )
+        self._published: dict[str, tuple[StatisticRow, ...]] = {}
+
+    async def async_load(self) -> None:
+        """Load the rows written before the last restart."""
+        data = await self._store.async_load() or {}
+        self._published = {
+            statistic: tuple(
+                (datetime.fromisoformat(start), state, total) for start, state, total in rows
+            )
+            for statistic, rows in data.get("published", {}).items()
+        }
+
+    @callback
+    def _async_save(self) -> None:
+        """Schedule a write of the published rows."""
+        self._store.async_delay_save(
+            lambda: {
+                "published": {
+                    statistic: [[start.isoformat(), state, total] for start, state, total in rows]
+                    for statistic, rows in self._published.items()
+                }
+            },
+            SAVE_DELAY,
+        )
+
+    @callback
+    def async_publish(self, statistics: list[CountStatistic]) -> int:
+        """Import changed statistics into the recorder; return how many were written."""
+        changed = False
+        written = 0
+        for statistic in statistics:
+            previous = self._published.get(statistic.statistic_id)
+            if previous == statistic.rows:
+                continue
+            rows = statistic.rows
+            if previous is not None:
+                known = set(previous)
+                if known <= set(rows):
+                    rows = tuple(row for row in rows if row not in known)
+                else:
+                    # Imports overwrite rows by hour but never delete them
+                    get_instance(self.hass).async_clear_statistics([statistic.statistic_id])
+
+            self._published[statistic.statistic_id] = statistic.rows
+            changed = True
+            if not rows:
+                continue
+            metadata = StatisticMetaData(
+                mean_type=StatisticMeanType.NONE,
+                has_sum=True,
+                name=statistic.name,
+                source=DOMAIN,
+                statistic_id=statistic.statistic_id,
+                unit_of_measurement=None,
+            )
+            async_add_external_statistics(self.hass, metadata, [
+                StatisticData(start=start, state=state, sum=total)
+                for start, state, total in rows
+            ])
+            written += 1
+
+        if changed:
+            self._async_save()
+        return written
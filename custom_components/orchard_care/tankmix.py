@@ -0,0 +1,168 @@
+"""Tank-mix batching planner for the Orchard Care integration."""
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
+from typing import Any
+
+from .const import TANK_MIX_WINDOW_DAYS, TASK_SPRAY
+from .schedule import iter_task_starts
+from .solar import SolarLocation, task_start
+
+# Window starts are aligned to a fixed epoch so a date always maps to one window
+_WINDOW_EPOCH = date(2000, 1, 3)
+
+type GroupKey = tuple[date, str]
+
+
+@dataclass(slots=True)
+class TankMixJob:
+    """Spray occurrences of several plantings sharing one product and window."""
+
+    product: str
+    window_start: date
+    plantings: dict[str, date] = field(default_factory=dict)
+    location: SolarLocation | None = None
+
+    @property
+    def start(self) -> datetime:
+        """Return when the combined job should start."""
+        return task_start(TASK_SPRAY, min(self.plantings.values()), self.location)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the job as a plain dict for attributes and service responses."""
+        return {
+            "product": self.product,
+            "date": self.start.isoformat(),
+            "plantings": sorted(self.plantings),
+        }
+
+
+class TankMixPlanner:
+    """Group spray occurrences of all plantings into shared tank-mix jobs.
+
+    Each planting remembers the groups it joined, so changing one planting
+    only touches those groups instead of re-planning the whole season.
+    """
+
+    def __init__(
+        self,
+        window_days: int = TANK_MIX_WINDOW_DAYS,
+        min_plantings: int = 2,
+        location: SolarLocation | None = None,
+    ) -> None:
+        """Initialize an empty planner."""
+        self.window_days = window_days
+        self.min_plantings = min_plantings
+        self.location = location
+        self._groups: dict[GroupKey, TankMixJob] = {}
+        self._keys_by_planting: dict[str, set[GroupKey]] = {}
+        self._signatures: dict[str, Any] = {}
+
+    def _window_start(self, day: date) -> date:
+        """Return the start of the batching window containing a day."""
+        offset = (day - _WINDOW_EPOCH).days % self.window_days
+        return day - timedelta(days=offset)
+
+    def update_planting(
+        self,
+        planting: str,
+        spray_months: list[int],
+        products: list[str],
+        start_date: datetime,
+        end_date: datetime,
+    ) -> bool:
+        """Add or refresh a planting; return True when any group changed."""
+        signature = (tuple(spray_months), tuple(products), start_date, end_date)
+        if self._signatures.get(planting) == signature:
+            return False
+
+        occurrences: dict[GroupKey, date] = {}
+        for event_date in iter_task_starts(
+            TASK_SPRAY, spray_months, start_date, end_date, self.location
+        ):
+            window = self._window_start(event_date.date())
+            for product in products:
+                occurrences[(window, product)] = event_date.date()
+
+        old_keys = self._keys_by_planting.get(planting, set())
+        for key in old_keys - occurrences.keys():
+            self._discard(key, planting)
+        for key, day in occurrences.items():
+            job = self._groups.get(key)
+            if job is None:
+                job = self._groups[key] = TankMixJob(
+                    product=key[1], window_start=key[0], location=self.location
+                )
+            job.plantings[planting] = day
+
+        self._keys_by_planting[planting] = set(occurrences)
+        self._signatures[planting] = signature
+        return True
+
+    def remove_planting(self, planting: str) -> None:
+        """Remove a planting from every group it joined."""
+        for key in self._keys_by_planting.pop(planting, set()):
+            self._discard(key, planting)
+        self._signatures.pop(planting, None)
+
+    def _discard(self, key: GroupKey, planting: str) -> None:
+        """Remove a planting from one group, dropping the group when empty."""
+        job = self._groups.get(key)
+        if job is None:
+            return
+        job.plantings.pop(planting, None)
+        if not job.plantings:
+            del self._groups[key]
+
+    @property
+    def plantings(self) -> set[str]:
+        """Return the plantings currently planned."""
+        return set(self._keys_by_planting)
+
+    def covered_sprays(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        skipped: frozenset[tuple[str, date]] = frozenset(),
+    ) -> set[tuple[str, date]]:
+        """Return the (planting, day) sprays whose every product is in a job in the range.
+
+        These sprays are done entirely from shared batches, so a calendar
+        listing the jobs does not need to list them again.
+        """
+        batched: dict[tuple[str, date], set[str]] = {}
+        for job in self.jobs(start_date, end_date, skipped):
+            for planting, day in job.plantings.items():
+                batched.setdefault((planting, day), set()).add(job.product)
+        return {
+            key for key, products in batched.items()
+            if products.issuperset(self._signatures[key[0]][1])
+        }
+
+    def jobs(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        skipped: frozenset[tuple[str, date]] = frozenset(),
+    ) -> list[TankMixJob]:
+        """Return the combined jobs starting inside a date range.
+
+        The (planting, day) sprays in ``skipped`` leave their jobs, and a job
+        left with too few plantings is not listed.
+        """
+        jobs = []
+        for job in self._groups.values():
+            if skipped and not skipped.isdisjoint(job.plantings.items()):
+                # Planned groups are shared, so the trimmed job is a copy
+                job = TankMixJob(
+                    product=job.product,
+                    window_start=job.window_start,
+                    plantings={
+                        planting: day
+                        for planting, day in job.plantings.items()
+                        if (planting, day) not in skipped
+                    },
+                    location=job.location,
+                )
+            if len(job.plantings) >= self.min_plantings and start_date <= job.start <= end_date:
+                jobs.append(job)
+        return sorted(jobs, key=lambda job: (job.start, job.product))
@@ -0,0 +1,110 @@
+"""Per-language text templates for the Orchard Care integration.
+
+Templates live in ``locales/<language>.json``. A language is read and compiled
+once, in the executor, the first time an entry needs it.
+"""
+import json
+import logging
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_LANGUAGE = "en"
+LOCALES_DIR = Path(__file__).parent / "locales"
+
+
+@dataclass(frozen=True, slots=True)
+class DescriptionTemplates:
+    """The compiled text templates of one language."""
+
+    summaries: dict[str, str]
+    lead_times: dict[str, str]
+    pruning: str
+    pruning_tips: dict[int, str]
+    pruning_tip: str
+    spray: str
+    spray_no_products: str
+    irrigation: str
+    reminders: dict[str, str]
+    spray_warnings: str
+    notification_title: str
+    notifications: dict[str, tuple[str, str]]
+
+
+def _join(value: str | list[str]) -> str:
+    """Return a template written as one string or as a list of lines."""
+    return "\n".join(value) if isinstance(value, list) else value
+
+
+def _read_locale(language: str) -> dict[str, Any]:
+    """Return the raw templates of a language, or an empty dict if there are none."""
+    path = LOCALES_DIR / f"{language}.json"
+    if not path.is_file():
+        return {}
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def load_templates(language: str) -> DescriptionTemplates:
+    """Read and compile the templates of a language.
+
+    A regional language such as ``pt-br`` is layered over its base language
+    ``pt``. Sections neither translates fall back to English, and so do the
+    keys a translated section leaves out. This reads files, so it must run
+    in the executor.
+    """
+    raw = _read_locale(DEFAULT_LANGUAGE)
+    translated_any = False
+    for layer in dict.fromkeys((language.split("-")[0], language)):
+        if layer == DEFAULT_LANGUAGE:
+            continue
+        translated = _read_locale(layer)
+        translated_any = translated_any or bool(translated)
+        for section, value in translated.items():
+            if isinstance(value, dict) and isinstance(raw.get(section), dict):
+                raw[section] = {**raw[section], **value}
+            else:
+                raw[section] = value
+    if language != DEFAULT_LANGUAGE and not translated_any:
+        _LOGGER.debug("No %s care texts, using English", language)
+
+    tips = dict(raw["pruning_tips"])
+    return DescriptionTemplates(
+        summaries=dict(raw["summary"]),
+        lead_times=dict(raw["lead_time"]),
+        pruning=_join(raw["pruning"]),
+        pruning_tips={int(month): tip for month, tip in tips.items() if month.isdigit()},
+        pruning_tip=tips["default"],
+        spray=_join(raw["spray"]),
+        spray_no_products=raw["spray_no_products"],
+        irrigation=_join(raw["irrigation"]),
+        reminders=dict(raw["reminder"]),
+        spray_warnings=raw["spray_warnings"],
+        notification_title=raw["notification"]["title"],
+        notifications={
+            key: tuple(texts) for key, texts in raw["notification"].items() if key != "title"
+        },
+    )
+
+
+# English is the fallback of every language, so it is compiled with the module,
+# which Home Assistant imports in the executor
+_TEMPLATES: dict[str, DescriptionTemplates] = {
+    DEFAULT_LANGUAGE: load_templates(DEFAULT_LANGUAGE)
+}
+
+
+async def async_load_templates(hass: HomeAssistant, language: str | None) -> str:
+    """Compile the templates of a language once; return the language to render in."""
+    language = (language or DEFAULT_LANGUAGE).lower()
+    if language not in _TEMPLATES:
+        _TEMPLATES[language] = await hass.async_add_executor_job(load_templates, language)
+    return language
+
+
+def get_templates(language: str) -> DescriptionTemplates:
+    """Return the compiled templates of a loaded language."""
+    return _TEMPLATES[language]
@@ -0,0 +1,136 @@
+"""To-do platform for Orchard Care task tracking."""
+from datetime import datetime, timedelta
+
+from homeassistant.components.todo import (
+    TodoItem,
+    TodoItemStatus,
+    TodoListEntity,
+    TodoListEntityFeature,
+)
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import async_track_time_interval
+
+from . import DOMAIN, OrchardCareCoordinator, PLANT_CARE_DATA
+from .const import TASK_IRRIGATION, TASK_PRUNING, TASK_SPRAY
+from .schedule import iter_occurrences, occurrence_id, parse_occurrence_id
+
+# Tasks stay on the list this long after their date so late work can be ticked off
+TODO_PAST_DAYS = 30
+TODO_FUTURE_DAYS = 30
+
+TASK_VERBS = {TASK_PRUNING: "Prune", TASK_SPRAY: "Spray", TASK_IRRIGATION: "Water"}
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    config_entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up the Orchard Care to-do list based on a config entry."""
+    coordinator = hass.data[DOMAIN][config_entry.entry_id]
+    async_add_entities([OrchardCareTodoList(coordinator, config_entry)])
+
+
+class OrchardCareTodoList(TodoListEntity):
+    """To-do list of scheduled care tasks across all plants."""
+
+    _attr_has_entity_name = True
+    _attr_should_poll = False
+    _attr_supported_features = TodoListEntityFeature.UPDATE_TODO_ITEM
+
+    def __init__(self, coordinator: OrchardCareCoordinator, config_entry: ConfigEntry):
+        """Initialize the to-do list."""
+        self.coordinator = coordinator
+        self.config_entry = config_entry
+        self._attr_unique_id = f"{DOMAIN}_{config_entry.entry_id}_tasks_todo"
+        self._attr_name = "Orchard Tasks"
+        self._attr_todo_items = []
+
+    @property
+    def device_info(self):
+        """Return device information."""
+        return {
+            "identifiers": {(DOMAIN, f"{self.config_entry.entry_id}_master")},
+            "name": "Orchard Care Master",
+            "manufacturer": "Orchard Care",
+            "model": "All Plants Combined",
+        }
+
+    async def async_added_to_hass(self):
+        """When entity is added to hass."""
+        await super().async_added_to_hass()
+        self._refresh_items()
+        self.async_on_remove(
+            async_track_time_interval(self.hass, self._async_refresh, timedelta(hours=1))
+        )
+        self.async_on_remove(self.coordinator.async_add_listener(self._handle_coordinator_update))
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Rebuild the items after the schedules or completions changed."""
+        self._refresh_items()
+        self.async_write_ha_state()
+
+    async def _async_refresh(self, now=None) -> None:
+        """Regenerate the items from the schedule."""
+        self._refresh_items()
+        self.async_write_ha_state()
+
+    def _refresh_items(self) -> None:
+        """Build to-do items for tasks around today."""
+        now = datetime.now()
+        start = (now - timedelta(days=TODO_PAST_DAYS)).replace(hour=0, minute=0)
+        end = now + timedelta(days=TODO_FUTURE_DAYS)
+        completions = self.coordinator.completions
+        overlay = self.coordinator.overlay
+
+        items = []
+        for plant, schedule in self.coordinator._data.items():
+            plant_name = PLANT_CARE_DATA.get(plant, {}).get("name", plant.title())
+            for task_start, task in iter_occurrences(
+                schedule, start, end, self.coordinator.solar_location
+            ):
+                uid = occurrence_id(plant, task, task_start)
+                # Tasks cancelled on the calendar leave the list; moved ones follow
+                if overlay.is_cancelled(uid):
+                    continue
+                edited = overlay.get(uid)
+                done = completions.is_completed(plant, task, task_start.date())
+                items.append(TodoItem(
+                    summary=f"{TASK_VERBS[task]} {plant_name}",
+                    uid=uid,
+                    status=TodoItemStatus.COMPLETED if done else TodoItemStatus.NEEDS_ACTION,
+                    due=edited.start.date() if edited else task_start.date(),
+                ))
+
+            # Planned irrigation moves on once it is ticked off
+            irrigation = self.coordinator.irrigation_plan.get(plant)
+            if irrigation and irrigation[0] <= end:
+                items.append(TodoItem(
+                    summary=f"{TASK_VERBS[TASK_IRRIGATION]} {plant_name} ({irrigation[1]:.0f} mm)",
+                    uid=occurrence_id(plant, TASK_IRRIGATION, irrigation[0]),
+                    status=TodoItemStatus.NEEDS_ACTION,
+                    due=irrigation[0].date(),
+                ))
+
+        items.sort(key=lambda item: (item.due, item.summary))
+        self._attr_todo_items = items
+
+    async def async_update_todo_item(self, item: TodoItem) -> None:
+        """Mark a task occurrence as completed or reopen it."""
+        parsed = parse_occurrence_id(item.uid)
+        if parsed is None:
+            raise HomeAssistantError(f"Unknown orchard task: {item.uid}")
+
+        plant, task, occurrence = parsed
+        completed = item.status == TodoItemStatus.COMPLETED
+        await self.coordinator.completions.async_set_completed(plant, task, occurrence, completed)
+        await self.coordinator.async_publish_statistics()
+
+        # Watering refills the root zone; other completions only drop reminders
+        if task == TASK_IRRIGATION and completed:
+            self.coordinator.record_irrigation(plant)
+        else:
+            self.coordinator.async_update_listeners()
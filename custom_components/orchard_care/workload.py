@@ -0,0 +1,97 @@
+"""Labor workload forecast for the Orchard Care integration."""
+from array import array
+from datetime import date, datetime, timedelta
+from typing import Any
+
+from .blocks import OrchardBlock
+from .const import (
+    PRUNING_DURATION_HOURS,
+    SPRAY_DURATION_HOURS,
+    TASK_PRUNING,
+    TASK_SPRAY,
+)
+from .schedule import iter_occurrences
+
+WORKLOAD_HORIZON_DAYS = 366
+
+TASK_DURATION_HOURS = {
+    TASK_PRUNING: PRUNING_DURATION_HOURS,
+    TASK_SPRAY: SPRAY_DURATION_HOURS,
+}
+
+
+class WorkloadIndex:
+    """Day-indexed labor hours with prefix sums for O(1) range queries."""
+
+    def __init__(self, start: date, horizon_days: int = WORKLOAD_HORIZON_DAYS) -> None:
+        """Initialize an empty index covering start .. start + horizon_days."""
+        self.start = start
+        self.horizon_days = horizon_days
+        self._daily = {task: array("d", bytes(8 * horizon_days)) for task in TASK_DURATION_HOURS}
+        self._prefix: dict[str, array] = {}
+
+    def add(self, day: date, task: str, hours: float) -> None:
+        """Add labor hours for a task on a day inside the horizon."""
+        offset = (day - self.start).days
+        if 0 <= offset < self.horizon_days:
+            self._daily[task][offset] += hours
+
+    def build(self) -> None:
+        """Compute the prefix sums; call once after all hours are added."""
+        for task, daily in self._daily.items():
+            prefix = array("d", bytes(8 * (self.horizon_days + 1)))
+            running = 0.0
+            for offset, hours in enumerate(daily):
+                running += hours
+                prefix[offset + 1] = running
+            self._prefix[task] = prefix
+
+    def _offset(self, day: date) -> int:
+        """Clamp a date to a prefix-sum offset."""
+        return min(max((day - self.start).days, 0), self.horizon_days)
+
+    def hours_between(self, start: date, end: date, task: str | None = None) -> float:
+        """Return labor hours due from start to end, both inclusive."""
+        first = self._offset(start)
+        last = self._offset(end + timedelta(days=1))
+        if last <= first:
+            return 0.0
+        tasks = [task] if task else list(self._prefix)
+        return sum(self._prefix[name][last] - self._prefix[name][first] for name in tasks)
+
+    def summary(self, start: date, end: date) -> dict[str, Any]:
+        """Return total and per-task hours for a date range."""
+        by_task = {task: self.hours_between(start, end, task) for task in self._prefix}
+        return {
+            "start_date": start.isoformat(),
+            "end_date": end.isoformat(),
+            "hours": sum(by_task.values()),
+            "by_task": by_task,
+        }
+
+
+def build_workload_index(
+    schedules: dict[str, dict[str, Any]],
+    blocks: list[OrchardBlock],
+    start: date,
+    horizon_days: int = WORKLOAD_HORIZON_DAYS,
+) -> WorkloadIndex:
+    """Build the workload index for all blocks over the planning horizon."""
+    plant_counts: dict[str, int] = {}
+    for block in blocks:
+        plant_counts[block.plant] = plant_counts.get(block.plant, 0) + block.count
+
+    index = WorkloadIndex(start, horizon_days)
+    range_start = datetime.combine(start, datetime.min.time())
+    range_end = range_start + timedelta(days=horizon_days)
+
+    # One pass per species; block counts scale the per-plant duration
+    for plant, count in plant_counts.items():
+        schedule = schedules.get(plant)
+        if not schedule or not count:
+            continue
+        for occurrence, task in iter_occurrences(schedule, range_start, range_end):
+            index.add(occurrence.date(), task, TASK_DURATION_HOURS[task] * count)
+
+    index.build()
+    return index
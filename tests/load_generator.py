@@ -0,0 +1,92 @@
+"""Synthetic orchard load generator for soak tests."""
+import random
+from dataclasses import dataclass, field
+from typing import Any
+
+from custom_components.orchard_care import PLANT_CARE_DATA
+from custom_components.orchard_care.const import ENTITY_MODE_AGGREGATE
+
+
+def synthetic_entry_data(
+    plantings: int,
+    entries: int,
+    entity_mode: str = ENTITY_MODE_AGGREGATE,
+    seed: int = 1,
+) -> list[dict[str, Any]]:
+    """Spread N plantings over M config entries with random species and counts."""
+    rng = random.Random(seed)
+    species = sorted(PLANT_CARE_DATA)
+    entry_data = []
+
+    for entry_index in range(entries):
+        blocks = []
+        for block_index in range(entry_index, plantings, entries):
+            blocks.append({
+                "block_id": f"site{entry_index}_block{block_index}",
+                "plant": rng.choice(species),
+                "count": rng.randint(1, 400),
+                "location": f"Row {block_index // 20 + 1}",
+            })
+        entry_data.append({
+            "hemisphere": "northern" if entry_index % 2 == 0 else "southern",
+            "organic_preference": rng.random() < 0.5,
+            "selected_plants": sorted({block["plant"] for block in blocks}),
+            "blocks": blocks,
+            "entity_mode": entity_mode,
+        })
+
+    return entry_data
+
+
+@dataclass
+class SoakResult:
+    """Measurements for one orchard size."""
+
+    plantings: int
+    entries: int
+    entities: int = 0
+    setup_seconds: float = 0.0
+    max_loop_lag: float = 0.0
+    state_writes: int = 0
+    recorder_rows: int = 0
+    peak_memory_mb: float = 0.0
+
+
+@dataclass
+class SoakReport:
+    """Results across orchard sizes and the size where scaling breaks down."""
+
+    lag_budget: float
+    results: list[SoakResult] = field(default_factory=list)
+
+    @property
+    def scaling_limit(self) -> SoakResult | None:
+        """Return the first size whose loop lag exceeds the budget."""
+        for result in self.results:
+            if result.max_loop_lag > self.lag_budget:
+                return result
+        return None
+
+    def format(self) -> str:
+        """Render the report as a plain-text table."""
+        lines = [
+            f"{'plantings':>10} {'entries':>8} {'entities':>9} {'setup s':>8} "
+            f"{'max lag s':>10} {'writes':>8} {'rows':>8} {'peak MB':>8}"
+        ]
+        for result in self.results:
+            lines.append(
+                f"{result.plantings:>10} {result.entries:>8} {result.entities:>9} "
+                f"{result.setup_seconds:>8.2f} {result.max_loop_lag:>10.3f} "
+                f"{result.state_writes:>8} {result.recorder_rows:>8} {result.peak_memory_mb:>8.1f}"
+            )
+
+        limit = self.scaling_limit
+        if limit is None:
+            lines.append(f"All sizes stayed within the {self.lag_budget:.3f} s loop lag budget.")
+        else:
+            lines.append(
+                f"Scaling limit: {limit.plantings} plantings over {limit.entries} entries "
+                f"blocked the loop for {limit.max_loop_lag:.3f} s "
+                f"(budget {self.lag_budget:.3f} s)."
+            )
+        return "\n".join(lines)
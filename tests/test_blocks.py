@@ -0,0 +1,31 @@
+"""Test the Orchard Care block model."""
+from custom_components.orchard_care.blocks import OrchardBlock, parse_blocks
+
+
+def test_parse_blocks_from_selected_plants():
+    """Test entries without blocks get one block per selected plant."""
+    blocks = parse_blocks({"selected_plants": ["apple", "pear"]})
+
+    assert blocks == [
+        OrchardBlock(block_id="apple", plant="apple"),
+        OrchardBlock(block_id="pear", plant="pear"),
+    ]
+
+
+def test_parse_blocks_with_counts_and_locations():
+    """Test explicit blocks keep their counts and locations."""
+    blocks = parse_blocks({
+        "selected_plants": ["apple"],
+        "blocks": [
+            {"block_id": "north-1", "plant": "apple", "count": 120, "location": "North slope"},
+            {"plant": "cherry", "count": "40"},
+            {"count": 5},
+        ],
+    })
+
+    assert len(blocks) == 2
+    assert blocks[0].count == 120
+    assert blocks[0].location == "North slope"
+    assert blocks[1].block_id == "cherry_2"
+    assert blocks[1].count == 40
+    assert blocks[1].as_dict()["plant"] == "cherry"
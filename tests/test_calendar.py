@@ -0,0 +1,238 @@
+"""Test the Orchard Care calendars."""
+from datetime import date, datetime, timedelta
+from unittest.mock import Mock, patch
+
+import pytest
+
+from homeassistant.components.calendar import EVENT_END, EVENT_START, EVENT_SUMMARY
+from homeassistant.core import HomeAssistant
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.exceptions import HomeAssistantError
+
+from custom_components.orchard_care import OrchardCareCoordinator
+from custom_components.orchard_care.calendar import (
+    OrchardCareCalendar,
+    OrchardCareMasterCalendar,
+)
+
+
+@pytest.fixture
+def mock_config_entry():
+    """Create a mock config entry."""
+    config_entry = Mock(spec=ConfigEntry)
+    config_entry.entry_id = "test_entry"
+    config_entry.options = {}
+    config_entry.data = {
+        "hemisphere": "northern",
+        "organic_preference": True,
+        "selected_plants": ["apple", "cherry"],
+    }
+    return config_entry
+
+
+@pytest.fixture
+async def coordinator(hass: HomeAssistant, mock_config_entry):
+    """Create a coordinator with computed schedules."""
+    coordinator = OrchardCareCoordinator(hass, mock_config_entry)
+    await coordinator._calculate_care_schedules()
+    return coordinator
+
+
+async def test_long_range_matches_direct_expansion(hass: HomeAssistant, coordinator, mock_config_entry):
+    """Test chunked expansion returns the same events as the in-loop path."""
+    calendar = OrchardCareCalendar(coordinator, "apple", mock_config_entry)
+    start, end = datetime(2026, 1, 1), datetime(2033, 12, 31)
+
+    chunked = await calendar.async_get_events(hass, start, end)
+    direct = calendar._get_events(start, end)
+
+    # Reminders whose tasks fall in the next chunk must not be lost at the boundary
+    assert chunked == direct
+
+
+async def test_long_range_reads_state_from_query_start(hass: HomeAssistant, coordinator, mock_config_entry):
+    """Test executor chunks do not see coordinator changes made during the query."""
+    calendar = OrchardCareCalendar(coordinator, "apple", mock_config_entry)
+    start, end = datetime(2026, 1, 1), datetime(2033, 12, 31)
+    direct = calendar._get_events(start, end)
+    run_in_executor = hass.async_add_executor_job
+
+    def replan_then_run(target, *args):
+        # The loop replaces the coordinator's plans between chunks
+        coordinator.irrigation_plan = {"apple": (datetime(2027, 6, 1, 6, 0), 12.0)}
+        coordinator._data = {}
+        return run_in_executor(target, *args)
+
+    with patch.object(hass, "async_add_executor_job", replan_then_run):
+        chunked = await calendar.async_get_events(hass, start, end)
+
+    assert chunked == direct
+
+
+async def test_long_range_is_capped(hass: HomeAssistant, coordinator, mock_config_entry):
+    """Test the master calendar never returns more than the event cap."""
+    calendar = OrchardCareMasterCalendar(coordinator, mock_config_entry)
+
+    with patch("custom_components.orchard_care.calendar.MAX_CALENDAR_EVENTS", 50):
+        events = await calendar.async_get_events(hass, datetime(2026, 1, 1), datetime(2036, 1, 1))
+
+    assert len(events) == 50
+    assert events == sorted(events, key=lambda event: event.start)
+
+
+async def test_event_cached_until_boundary(hass: HomeAssistant, coordinator, mock_config_entry, freezer):
+    """Test the current event is only looked up again once its boundary passes."""
+    freezer.move_to(datetime(2026, 3, 1, 12, 0))
+    calendar = OrchardCareCalendar(coordinator, "apple", mock_config_entry)
+
+    with patch.object(calendar, "_find_event", wraps=calendar._find_event) as find_event:
+        upcoming = calendar.event
+        assert calendar.event is upcoming
+        assert find_event.call_count == 1
+        assert upcoming.start > datetime(2026, 3, 1, 12, 0)
+
+        # Once the event starts it stays current until it ends
+        freezer.move_to(upcoming.start + timedelta(minutes=1))
+        assert calendar.event.start == upcoming.start
+        assert find_event.call_count == 2
+
+        freezer.move_to(upcoming.end + timedelta(minutes=1))
+        assert calendar.event.start > upcoming.start
+        assert find_event.call_count == 3
+
+
+async def test_schedule_change_notifies_listeners(hass: HomeAssistant, coordinator, mock_config_entry):
+    """Test listeners only hear about recomputations that change the schedules."""
+    listener = Mock()
+    remove_listener = coordinator.async_add_listener(listener)
+
+    await coordinator._calculate_care_schedules()
+    listener.assert_not_called()
+
+    mock_config_entry.data = {**mock_config_entry.data, "selected_plants": ["apple", "cherry", "peach"]}
+    await coordinator._calculate_care_schedules()
+    listener.assert_called_once()
+
+    remove_listener()
+    coordinator.async_update_listeners()
+    listener.assert_called_once()
+
+
+async def test_reminders_use_configured_lead_times(hass: HomeAssistant, coordinator, mock_config_entry):
+    """Test reminders follow the per-task lead times, even for tasks past the range end."""
+    mock_config_entry.options = {"spray_reminder_days": [10, 2], "pruning_reminder_days": []}
+    calendar = OrchardCareCalendar(coordinator, "apple", mock_config_entry)
+
+    # Apple is sprayed on March 7; the range ends before the spray itself
+    events = calendar._get_events(datetime(2026, 2, 20), datetime(2026, 3, 6))
+
+    assert [event.summary for event in events if not event.uid] == [
+        "📅 Reminder: 🌿 Spray Apple Tree (Organic) in 10 days",
+        "📅 Reminder: 🌿 Spray Apple Tree (Organic) in 2 days",
+    ]
+    assert not [event for event in events if event.uid]
+
+
+async def test_edits_overlay_generated_tasks(hass: HomeAssistant, coordinator, mock_config_entry):
+    """Test moved, cancelled and added events are merged without recompiling schedules."""
+    calendar = OrchardCareCalendar(coordinator, "apple", mock_config_entry)
+    master = OrchardCareMasterCalendar(coordinator, mock_config_entry)
+    start, end = datetime(2026, 2, 20), datetime(2026, 3, 31)
+    spray = next(event for event in calendar._get_events(start, end) if event.uid)
+
+    with patch.object(coordinator, "_calculate_care_schedules") as recompute:
+        # Move the March 7 spray to a dry day two days later
+        await calendar.async_update_event(spray.uid, {
+            EVENT_START: datetime(2026, 3, 9, 8, 0),
+            EVENT_END: datetime(2026, 3, 9, 10, 0),
+            EVENT_SUMMARY: "🌿 Spray Apple Tree (dry day)",
+        })
+        await master.async_create_event(**{
+            EVENT_START: datetime(2026, 3, 8, 9, 0),
+            EVENT_END: datetime(2026, 3, 8, 10, 0),
+            EVENT_SUMMARY: "Check the sprayer",
+        })
+    recompute.assert_not_called()
+
+    events = calendar._get_events(start, end)
+    assert [(event.start, event.summary) for event in events] == [
+        (datetime(2026, 3, 9, 8, 0), "🌿 Spray Apple Tree (dry day)")
+    ]
+    assert events[0].uid == spray.uid
+    master_events = await master.async_get_events(hass, start, end)
+    assert [
+        event.summary
+        for event in master_events
+        if datetime(2026, 3, 8) <= event.start < datetime(2026, 3, 10)
+    ] == ["Check the sprayer", "🌿 Spray Apple Tree (dry day)"]
+
+    await calendar.async_delete_event(spray.uid)
+    assert calendar._get_events(start, end) == []
+    assert coordinator.overlay.is_cancelled(spray.uid)
+
+
+async def test_all_day_edits_stay_all_day(hass: HomeAssistant, coordinator, mock_config_entry):
+    """Test events entered as dates stay all-day and are listed once in long queries."""
+    calendar = OrchardCareCalendar(coordinator, "apple", mock_config_entry)
+    await calendar.async_create_event(**{
+        EVENT_START: date(2026, 3, 30),
+        EVENT_END: date(2026, 4, 6),
+        EVENT_SUMMARY: "Bud check",
+    })
+
+    events = await calendar.async_get_events(hass, datetime(2026, 4, 2), datetime(2026, 4, 3))
+    assert [(event.start, event.end) for event in events if event.summary == "Bud check"] == [
+        (date(2026, 3, 30), date(2026, 4, 6))
+    ]
+    # The first chunk of a long query ends inside the event
+    events = await calendar.async_get_events(hass, datetime(2026, 1, 1), datetime(2033, 12, 31))
+    assert [event.summary for event in events].count("Bud check") == 1
+
+
+async def test_master_drops_sprays_done_by_tank_mix(hass: HomeAssistant, mock_config_entry):
+    """Test plant sprays done entirely from shared batches are listed once, as jobs."""
+    mock_config_entry.data["selected_plants"] = ["apple", "plum"]
+    coordinator = OrchardCareCoordinator(hass, mock_config_entry)
+    await coordinator._calculate_care_schedules()
+    master = OrchardCareMasterCalendar(coordinator, mock_config_entry)
+
+    events = await master.async_get_events(hass, datetime(2026, 3, 7), datetime(2026, 3, 8))
+
+    assert sorted(event.summary for event in events) == [
+        "🧪 Tank Mix: Copper fungicide (2 plantings)",
+        "🧪 Tank Mix: Horticultural oil (2 plantings)",
+        "🧪 Tank Mix: Neem oil (2 plantings)",
+    ]
+    # September sprays are apple only, so they stay on the calendar
+    events = await master.async_get_events(hass, datetime(2026, 9, 7), datetime(2026, 9, 8))
+    assert [event.uid for event in events] == ["apple:spray:2026-09-07"]
+
+    # A cancelled spray leaves its jobs, so the other planting is sprayed on its own
+    await master.async_delete_event("plum:spray:2026-03-07")
+    events = await master.async_get_events(hass, datetime(2026, 3, 7), datetime(2026, 3, 8))
+    assert [event.uid for event in events] == ["apple:spray:2026-03-07"]
+
+
+async def test_spray_descriptions_follow_the_schedule(hass: HomeAssistant, mock_config_entry):
+    """Test spray events list the products of the resolved schedule."""
+    mock_config_entry.options = {"organic_preference": False}
+    coordinator = OrchardCareCoordinator(hass, mock_config_entry)
+    await coordinator._calculate_care_schedules()
+    calendar = OrchardCareCalendar(coordinator, "apple", mock_config_entry)
+
+    events = calendar._get_events(datetime(2026, 2, 20), datetime(2026, 3, 31))
+
+    spray = next(event for event in events if event.uid)
+    assert "Captan, Imidacloprid, Malathion" in spray.description
+    assert "Neem oil" not in spray.description
+    assert all("Captan" in event.description for event in events if event.location == "Reminder")
+
+
+async def test_unknown_events_cannot_be_edited(hass: HomeAssistant, coordinator, mock_config_entry):
+    """Test ids of other plants and of no task are rejected."""
+    calendar = OrchardCareCalendar(coordinator, "apple", mock_config_entry)
+
+    with pytest.raises(HomeAssistantError):
+        await calendar.async_delete_event("cherry:spray:2026-03-07")
+    with pytest.raises(HomeAssistantError):
+        await calendar.async_delete_event("apple:spray:2026-03-08")
@@ -0,0 +1,123 @@
+"""Test the Orchard Care chill accumulator."""
+from datetime import date, datetime, timedelta
+from unittest.mock import Mock, patch
+
+import pytest
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, State
+
+from custom_components.orchard_care import OrchardCareCoordinator
+from custom_components.orchard_care.chill import (
+    ChillAccumulator,
+    dynamic_step,
+    season_start,
+    utah_units,
+)
+from custom_components.orchard_care.const import CONF_TEMPERATURE_SENSOR
+
+APPLE = {"chill_requirement": {"hours": 1000, "units": 1000, "portions": 2}}
+START = datetime(2026, 11, 1)
+
+
+def test_models_per_hour():
+    """Test the Utah weights and the Dynamic model's optimum."""
+    assert utah_units(1.0) == 0.0
+    assert utah_units(6.0) == 1.0
+    assert utah_units(10.0) == 0.5
+    assert utah_units(17.0) == -0.5
+    assert utah_units(25.0) == -1.0
+
+    def daily_portions(temperature):
+        intermediate = total = 0.0
+        for _ in range(24 * 30):
+            intermediate, portion = dynamic_step(intermediate, temperature)
+            total += portion
+        return total / 30
+
+    # Roughly 0.8 portions a day at the optimum and none when it stays warm
+    assert daily_portions(6.0) == pytest.approx(0.8, abs=0.1)
+    assert daily_portions(0.0) < daily_portions(6.0)
+    assert daily_portions(15.0) == 0.0
+
+
+def test_season_start():
+    """Test the chill season starts in autumn for either hemisphere."""
+    assert season_start(date(2027, 2, 1), "northern") == date(2026, 10, 1)
+    assert season_start(date(2026, 10, 1), "northern") == date(2026, 10, 1)
+    assert season_start(date(2026, 7, 1), "southern") == date(2026, 4, 1)
+    assert season_start(date(2026, 3, 1), "southern") == date(2025, 4, 1)
+
+
+async def test_accumulation_and_guidance(hass: HomeAssistant):
+    """Test hourly samples accrue every model and drive the pruning guidance."""
+    chill = ChillAccumulator(hass, "test_entry", {"apple": APPLE}, "northern")
+
+    for hour in range(48):
+        assert chill.add_sample(6.0, START + timedelta(hours=hour))
+    # Repeated readings within an hour are ignored
+    assert not chill.add_sample(2.0, START + timedelta(hours=47, minutes=30))
+
+    assert chill.totals["hours"] == 48
+    assert chill.totals["units"] == 48
+    assert chill.totals["portions"] == pytest.approx(1.0, abs=0.05)
+    assert chill.daily_rate() == pytest.approx(chill.totals["portions"] / 2)
+
+    status = chill.status("apple", START.date() + timedelta(days=2))
+    assert not status["satisfied"]
+    assert status["late_pruning_from"] == START.date() + timedelta(days=5)
+
+    for hour in range(48, 24 * 4):
+        chill.add_sample(6.0, START + timedelta(hours=hour))
+    status = chill.status("apple", START.date() + timedelta(days=4))
+    assert status["satisfied"]
+    assert status["progress"] == 100.0
+    assert status["late_pruning_from"] == chill.satisfied["apple"]
+
+    # Warm hours take Utah units away but never below zero
+    for hour in range(24 * 4, 24 * 10):
+        chill.add_sample(25.0, START + timedelta(hours=hour))
+    assert chill.totals["units"] == 0.0
+
+    # The next season starts from scratch
+    chill.add_sample(6.0, datetime(2027, 10, 1, 0))
+    assert chill.season == date(2027, 10, 1)
+    assert chill.totals["hours"] == 1
+    assert chill.satisfied == {}
+
+
+async def test_ring_buffer_is_bounded(hass: HomeAssistant):
+    """Test the rolling window keeps a fixed number of hours."""
+    chill = ChillAccumulator(hass, "test_entry", {}, "northern")
+    for hour in range(24 * 20):
+        chill.add_sample(3.0 if hour < 24 * 6 else 20.0, START + timedelta(hours=hour))
+
+    assert len(chill.window) == chill.window.maxlen
+    # Only warm hours remain in the last 14 days
+    assert chill.daily_rate("hours") == 0.0
+    assert chill.totals["hours"] == 24 * 6
+
+
+async def test_unavailable_temperature_stops_sampling(hass: HomeAssistant):
+    """Test chill is not accrued from the last reading once the sensor goes away."""
+    entry = Mock(spec=ConfigEntry)
+    entry.entry_id = "test_entry"
+    entry.data = {"selected_plants": ["apple"], CONF_TEMPERATURE_SENSOR: "sensor.orchard_temperature"}
+    entry.options = {}
+    coordinator = OrchardCareCoordinator(hass, entry)
+    coordinator._sensor_keys = {"sensor.orchard_temperature": CONF_TEMPERATURE_SENSOR}
+
+    def temperature_changed(state: str) -> None:
+        coordinator._async_weather_changed(Mock(data={
+            "entity_id": "sensor.orchard_temperature",
+            "new_state": State("sensor.orchard_temperature", state, {"unit_of_measurement": "°C"}),
+        }))
+
+    temperature_changed("4.5")
+    assert coordinator._last_temperature == 4.5
+
+    temperature_changed("unavailable")
+    assert coordinator._last_temperature is None
+    with patch.object(coordinator.chill, "add_sample") as add_sample:
+        coordinator._async_sample_chill(datetime.now())
+    add_sample.assert_not_called()
@@ -0,0 +1,55 @@
+"""Test the Orchard Care climate zones."""
+from unittest.mock import Mock
+
+from homeassistant.core import HomeAssistant
+from homeassistant.config_entries import ConfigEntry
+
+from custom_components.orchard_care import OrchardCareCoordinator
+from custom_components.orchard_care.climate import (
+    SeasonAdjustment,
+    adjust_months,
+    zone_for_site,
+)
+
+
+def test_zone_lookup():
+    """Test sites map to zones by latitude, Köppen code or USDA zone."""
+    assert zone_for_site("auto", 5.0) == "tropical"
+    assert zone_for_site(" Auto ", 5.0) == "tropical"
+    assert zone_for_site("auto", -37.8) == "mediterranean"
+    assert zone_for_site("auto", 45.0) == "temperate"
+    assert zone_for_site("auto", 69.6) == "subarctic"
+    assert zone_for_site("Csa", 52.0) == "mediterranean"
+    assert zone_for_site("dfb", None) == "continental"
+    assert zone_for_site("9b", None) == "subtropical"
+    assert zone_for_site("tropical", None) == "tropical"
+    assert zone_for_site("Xyz", 45.0) is None
+    assert zone_for_site("", 5.0) is None
+
+
+def test_adjust_months():
+    """Test windows are shifted and stretched run by run."""
+    assert adjust_months([12, 1, 2], SeasonAdjustment(offset=1)) == [1, 2, 3]
+    assert adjust_months([12, 1, 2], SeasonAdjustment(offset=-1, stretch=-1)) == [11, 12]
+    assert adjust_months([3, 4, 5, 9], SeasonAdjustment(offset=-1, stretch=1)) == [2, 3, 4, 5, 8, 9]
+    assert adjust_months([9, 10, 11, 3, 4], SeasonAdjustment(offset=1, stretch=-1)) == [10, 11, 4]
+    # A one-month window is never shortened away
+    assert adjust_months([6], SeasonAdjustment(stretch=-2)) == [6]
+    assert adjust_months([], SeasonAdjustment(offset=3)) == []
+
+
+async def test_zone_applied_when_schedules_compile(hass: HomeAssistant):
+    """Test the zone adjusts the catalog before the hemisphere shift."""
+    entry = Mock(spec=ConfigEntry)
+    entry.entry_id = "test_entry"
+    entry.options = {"climate_zone": "Csb"}
+    entry.data = {"hemisphere": "southern", "selected_plants": ["apple"]}
+
+    coordinator = OrchardCareCoordinator(hass, entry)
+    await coordinator._calculate_care_schedules()
+
+    schedule = coordinator._data["apple"]
+    assert schedule["climate_zone"] == "mediterranean"
+    # Sprays a month earlier and a month longer, then six months on
+    assert schedule["spray_months"] == [8, 9, 10, 11, 2, 3]
+    assert schedule["pruning_months"] == [6, 7, 8]
@@ -0,0 +1,65 @@
+"""Test the Orchard Care completion log."""
+import asyncio
+from datetime import date
+from unittest.mock import patch
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.orchard_care.completion_log import CompletionLog
+
+
+async def test_completion_log_round_trip(hass: HomeAssistant, tmp_path):
+    """Test completions survive a reload and reopened tasks are dropped."""
+    with patch.object(hass.config, "path", return_value=str(tmp_path / "log.jsonl")):
+        log = CompletionLog(hass, "entry")
+        await log.async_set_completed("apple", "pruning", date(2026, 1, 15), True)
+        await log.async_set_completed("apple", "spray", date(2026, 3, 7), True)
+        await log.async_set_completed("apple", "spray", date(2026, 3, 7), False)
+
+        reloaded = CompletionLog(hass, "entry")
+        await reloaded.async_load()
+
+    assert reloaded.is_completed("apple", "pruning", date(2026, 1, 15))
+    assert not reloaded.is_completed("apple", "spray", date(2026, 3, 7))
+    assert [record["task"] for record in reloaded.season_records("apple", 2026)] == ["pruning"]
+    assert reloaded.season_records("apple", 2025) == []
+    assert reloaded.completed_tasks("apple", date(2026, 1, 1), date(2027, 6, 1)) == {
+        ("pruning", "2026-01-15")
+    }
+    assert reloaded.completed_tasks("apple", date(2027, 1, 1), date(2027, 6, 1)) == frozenset()
+
+
+async def test_completion_log_compaction(hass: HomeAssistant, tmp_path):
+    """Test the log is rewritten once superseded lines dominate."""
+    path = tmp_path / "log.jsonl"
+    with patch.object(hass.config, "path", return_value=str(path)), patch(
+        "custom_components.orchard_care.completion_log.COMPACT_MIN_LINES", 4
+    ):
+        log = CompletionLog(hass, "entry")
+        for completed in (True, False, True, False, True):
+            await log.async_set_completed("pear", "spray", date(2026, 4, 7), completed)
+
+    assert log.is_completed("pear", "spray", date(2026, 4, 7))
+    assert len(path.read_text().splitlines()) < 5
+
+
+async def test_concurrent_writes_survive_compaction(hass: HomeAssistant, tmp_path):
+    """Test appends made while the log is compacted are not lost."""
+    path = tmp_path / "log.jsonl"
+    with patch.object(hass.config, "path", return_value=str(path)), patch(
+        "custom_components.orchard_care.completion_log.COMPACT_MIN_LINES", 4
+    ):
+        log = CompletionLog(hass, "entry")
+        await asyncio.gather(*(
+            log.async_set_completed("plum", "spray", date(2026, month, 7), completed)
+            for month in range(1, 13)
+            for completed in (True, False, True)
+        ))
+
+        reloaded = CompletionLog(hass, "entry")
+        await reloaded.async_load()
+
+    assert sorted(reloaded.iter_records(), key=lambda record: record["date"]) == sorted(
+        log.iter_records(), key=lambda record: record["date"]
+    )
+    assert reloaded.record_count == 12
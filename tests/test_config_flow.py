@@ -1,6 +1,10 @@
 """Test the Orchard Care config flow."""
 import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
 from homeassistant import config_entries
+from homeassistant.helpers import entity_registry as er
+
 from custom_components.orchard_care.const import DOMAIN
 
 async def test_form(hass):
@@ -9,4 +13,88 @@ async def test_form(hass):
         DOMAIN, context={"source": config_entries.SOURCE_USER}
     )
     assert result["type"] == "form"
-    assert result["errors"] == {}
\ No newline at end of file
+    assert result["errors"] == {}
+
+async def test_invalid_reminder_days(hass):
+    """Test reminder lead times must be whole days in range."""
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN, context={"source": config_entries.SOURCE_USER}
+    )
+    result = await hass.config_entries.flow.async_configure(
+        result["flow_id"],
+        {"spray_reminder_days": "7, soon"},
+    )
+    assert result["type"] == "form"
+    assert result["errors"] == {"spray_reminder_days": "invalid_reminder_days"}
+
+
+async def test_plant_search_and_pages(hass):
+    """Test plants are searched and selected across pages."""
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN, context={"source": config_entries.SOURCE_USER}
+    )
+    result = await hass.config_entries.flow.async_configure(result["flow_id"], {})
+    assert result["step_id"] == "plants"
+
+    result = await hass.config_entries.flow.async_configure(
+        result["flow_id"], {"search": "prunus", "action": "done"}
+    )
+    assert result["step_id"] == "plants"
+    assert result["description_placeholders"]["matches"] == "4"
+
+    result = await hass.config_entries.flow.async_configure(
+        result["flow_id"],
+        {"search": "prunus", "selected_plants": ["cherry", "plum"], "action": "done"},
+    )
+    assert result["type"] == "create_entry"
+    assert result["data"]["selected_plants"] == ["cherry", "plum"]
+
+
+async def test_plant_selection_kept_across_searches(hass):
+    """Test plants chosen under one search stay selected under the next."""
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN, context={"source": config_entries.SOURCE_USER}
+    )
+    result = await hass.config_entries.flow.async_configure(result["flow_id"], {})
+    result = await hass.config_entries.flow.async_configure(
+        result["flow_id"], {"search": "", "selected_plants": ["apple"], "action": "next_page"}
+    )
+    result = await hass.config_entries.flow.async_configure(
+        result["flow_id"], {"search": "blue", "action": "done"}
+    )
+    result = await hass.config_entries.flow.async_configure(
+        result["flow_id"],
+        {"search": "blue", "selected_plants": ["blueberry"], "action": "done"},
+    )
+    assert result["type"] == "create_entry"
+    assert result["data"]["selected_plants"] == ["apple", "blueberry"]
+
+
+async def test_options_plants_change_entities(hass, entity_registry: er.EntityRegistry):
+    """Test plants chosen in the options flow replace the plants chosen at setup."""
+    entry = MockConfigEntry(domain=DOMAIN, entry_id="orchard", data={"selected_plants": ["apple"]})
+    entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    assert entity_registry.async_get_entity_id("sensor", DOMAIN, "orchard_care_orchard_apple_pruning")
+
+    result = await hass.config_entries.options.async_init(entry.entry_id)
+    result = await hass.config_entries.options.async_configure(result["flow_id"], {})
+    # Apple is on the first page; leaving it unticked drops it
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"], {"search": "prunus", "selected_plants": [], "action": "done"}
+    )
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"], {"search": "prunus", "selected_plants": ["cherry"], "action": "done"}
+    )
+    assert result["type"] == "create_entry"
+    await hass.async_block_till_done()
+
+    assert entry.options["selected_plants"] == ["cherry"]
+    state = hass.states.get(
+        entity_registry.async_get_entity_id("sensor", DOMAIN, "orchard_care_orchard_cherry_pruning")
+    )
+    assert state is not None and state.state != "unavailable"
+    assert entity_registry.async_get_entity_id(
+        "calendar", DOMAIN, "orchard_care_orchard_cherry_calendar"
+    )
@@ -0,0 +1,95 @@
+"""Test the Orchard Care spray conflict checker."""
+from datetime import datetime
+
+from custom_components.orchard_care import PLANT_CARE_DATA
+from custom_components.orchard_care.conflicts import (
+    CONFLICT_PHI,
+    CONFLICT_REI,
+    CONFLICT_RESISTANCE,
+    IntervalTree,
+    find_conflicts,
+)
+
+SEASON_START = datetime(2026, 1, 1)
+SEASON_END = datetime(2026, 12, 31, 23, 59)
+
+
+def test_interval_tree_overlaps():
+    """Test overlap queries return exactly the intersecting intervals."""
+    tree = IntervalTree([(1, 5, "a"), (4, 8, "b"), (10, 12, "c"), (20, 30, "d")])
+
+    assert sorted(tree.overlapping(5, 5)) == ["a", "b"]
+    assert sorted(tree.overlapping(9, 11)) == ["c"]
+    assert tree.overlapping(13, 19) == []
+    assert sorted(tree.overlapping(0, 100)) == ["a", "b", "c", "d"]
+    assert IntervalTree([]).overlapping(0, 1) == []
+
+
+def test_pre_harvest_interval_conflict():
+    """Test sprays inside the PHI before harvest are flagged."""
+    schedules = {
+        "apple": {
+            "spray_months": [9],
+            "spray_products": ["Imidacloprid"],
+            "harvest_months": [9],
+        }
+    }
+
+    conflicts = find_conflicts(schedules, SEASON_START, SEASON_END)
+
+    # Picking that month also means entering the block inside the REI
+    assert [conflict.kind for conflict in conflicts] == [CONFLICT_PHI, CONFLICT_REI]
+    assert conflicts[0].date == datetime(2026, 9, 7, 7, 0)
+
+
+def test_rotation_conflicts():
+    """Test repeated modes of action are flagged."""
+    schedules = {
+        "peach": {
+            "spray_months": [1, 2, 3],
+            "spray_products": ["Chlorpyrifos"],
+            "pruning_months": [1],
+            "harvest_months": [],
+        },
+        "grape": {
+            "spray_months": [4, 5, 6],
+            "spray_products": ["Copper fungicide"],
+            "harvest_months": [],
+        },
+        "cherry": {
+            "spray_months": [3, 4, 5, 6],
+            "spray_products": ["Bacillus thuringiensis", "Spinosad"],
+            "harvest_months": [],
+        },
+    }
+    conflicts = find_conflicts(schedules, SEASON_START, SEASON_END)
+    kinds = {(conflict.plant, conflict.kind) for conflict in conflicts}
+
+    assert ("peach", CONFLICT_RESISTANCE) in kinds
+    # The 96 h re-entry interval ends before the mid-month pruning
+    assert ("peach", CONFLICT_REI) not in kinds
+    # Multi-site copper is exempt from rotation checks
+    assert not any(conflict.plant == "grape" for conflict in conflicts)
+    # Alternating insecticide groups is a rotation, not a repeat
+    assert not any(conflict.plant == "cherry" for conflict in conflicts)
+
+
+def test_re_entry_interval_conflict_with_catalog_data():
+    """Test the shipped apple plan flags harvest inside a re-entry interval."""
+    apple = PLANT_CARE_DATA["apple"]
+    schedules = {
+        "apple": {
+            "spray_months": apple["spray_months"],
+            "spray_products": apple["spray_products"]["organic"],
+            "pruning_months": apple["pruning_months"],
+            "harvest_months": apple["harvest_months"],
+        }
+    }
+
+    conflicts = find_conflicts(schedules, SEASON_START, SEASON_END)
+    rei = [conflict for conflict in conflicts if conflict.kind == CONFLICT_REI]
+
+    assert {conflict.date for conflict in rei} == {datetime(2026, 9, 7, 7, 0)}
+    assert "Harvest falls inside the 48 h re-entry interval of Copper fungicide" in [
+        conflict.message for conflict in rei
+    ]
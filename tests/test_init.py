@@ -0,0 +1,45 @@
+"""Test the Orchard Care config entry setup."""
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import device_registry as dr, entity_registry as er
+
+from custom_components.orchard_care import async_migrate_entry
+from custom_components.orchard_care.const import DOMAIN
+
+
+async def test_migrate_scopes_registry_ids(
+    hass: HomeAssistant, entity_registry: er.EntityRegistry, device_registry: dr.DeviceRegistry
+):
+    """Test per-plant unique IDs and devices of 1.1 entries gain the entry ID."""
+    entry = MockConfigEntry(
+        domain=DOMAIN, entry_id="orchard", data={"selected_plants": ["apple"]}, minor_version=1
+    )
+    entry.add_to_hass(hass)
+    other = MockConfigEntry(domain=DOMAIN, entry_id="other", data={"selected_plants": ["apple"]})
+    other.add_to_hass(hass)
+    device = device_registry.async_get_or_create(
+        config_entry_id=entry.entry_id, identifiers={(DOMAIN, "apple")}
+    )
+    shared = device_registry.async_get_or_create(
+        config_entry_id=entry.entry_id, identifiers={(DOMAIN, "master")}
+    )
+    device_registry.async_get_or_create(config_entry_id=other.entry_id, identifiers={(DOMAIN, "master")})
+    entity_registry.async_get_or_create(
+        "sensor", DOMAIN, "orchard_care_apple_pruning", config_entry=entry, device_id=device.id
+    )
+    entity_registry.async_get_or_create("calendar", DOMAIN, "orchard_care_master_calendar", config_entry=entry)
+    entity_registry.async_get_or_create("sensor", DOMAIN, "orchard_care_orchard_chill", config_entry=entry)
+
+    assert await async_migrate_entry(hass, entry)
+
+    assert entry.minor_version == 2
+    for platform, unique_id in (
+        ("sensor", "orchard_care_orchard_apple_pruning"),
+        ("calendar", "orchard_care_orchard_master_calendar"),
+        ("sensor", "orchard_care_orchard_chill"),
+    ):
+        assert entity_registry.async_get_entity_id(platform, DOMAIN, unique_id)
+    assert device_registry.async_get_device(identifiers={(DOMAIN, "orchard_apple")}).id == device.id
+    # The shared master device is left to the other orchard
+    assert device_registry.async_get(shared.id).config_entries == {other.entry_id}
@@ -0,0 +1,93 @@
+"""Test the Orchard Care irrigation engine."""
+from datetime import date, timedelta
+
+import pytest
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.orchard_care.const import (
+    CONF_RAIN_SENSOR,
+    CONF_TEMPERATURE_SENSOR,
+)
+from custom_components.orchard_care.irrigation import (
+    IrrigationEngine,
+    crop_coefficient,
+    extraterrestrial_radiation,
+    hargreaves_et0,
+    penman_monteith_et0,
+    to_metric,
+)
+
+APPLE = {
+    "pruning_months": [12, 1, 2],
+    "harvest_months": [8, 9, 10],
+    "crop_coefficients": [0.45, 0.95, 0.70],
+    "depletion_fraction": 0.5,
+    "root_zone_water_mm": 40,
+}
+DAY = date(2026, 7, 6)
+
+
+def test_reference_et_matches_fao_examples():
+    """Test the ET0 equations against the FAO-56 worked examples."""
+    assert extraterrestrial_radiation(date(2026, 9, 3), -20) == pytest.approx(32.2, abs=0.1)
+
+    radiation = extraterrestrial_radiation(DAY, 50.8)
+    assert radiation == pytest.approx(41.09, abs=0.05)
+    # Brussels, 6 July: 3.9 mm/day with measured humidity extremes
+    assert penman_monteith_et0(12.3, 21.5, 73.5, 2.078, 22.07, radiation, 100) == pytest.approx(3.9, abs=0.2)
+    assert hargreaves_et0(12.3, 21.5, radiation) == pytest.approx(4.06, abs=0.05)
+
+
+def test_unit_conversion_and_crop_coefficient():
+    """Test readings are converted to metric and Kc follows the season."""
+    assert to_metric(68, "°F") == pytest.approx(20)
+    assert to_metric(36, "km/h") == pytest.approx(10)
+    assert to_metric(12.5, "mm") == 12.5
+
+    assert crop_coefficient(APPLE, 1) == 0.45
+    assert crop_coefficient(APPLE, 6) == 0.95
+    assert crop_coefficient(APPLE, 9) == 0.70
+
+
+async def test_water_balance(hass: HomeAssistant):
+    """Test days close into the balance and irrigation is planned at the allowed depletion."""
+    engine = IrrigationEngine(hass, "test_entry", {"apple": APPLE}, 50.8, 100)
+    engine.weather.day = DAY
+
+    for temperature in (12.3, 18.0, 21.5):
+        assert not engine.add_reading(CONF_TEMPERATURE_SENSOR, temperature, DAY)
+    assert engine.roll_over(DAY + timedelta(days=1))
+
+    et0 = engine.recent_et0[-1]
+    assert engine.depletion["apple"] == pytest.approx(0.95 * et0, abs=0.01)
+
+    # 20 mm may be depleted before watering, at about 3.9 mm a day
+    due, amount = engine.plan("apple", DAY + timedelta(days=1))
+    assert due == DAY + timedelta(days=6)
+    assert amount >= 20
+
+    # Rain refills the root zone before the day's use is taken out
+    engine.add_reading(CONF_TEMPERATURE_SENSOR, 15.0, DAY + timedelta(days=1))
+    engine.add_reading(CONF_RAIN_SENSOR, 25.0, DAY + timedelta(days=1))
+    engine.roll_over(DAY + timedelta(days=2))
+    assert engine.depletion["apple"] == 0.0
+
+    engine.depletion["apple"] = 30.0
+    assert engine.plan("apple", DAY + timedelta(days=2)) == (DAY + timedelta(days=2), 30.0)
+    engine.record_irrigation("apple")
+    assert engine.depletion["apple"] == 0.0
+
+
+async def test_missed_days_are_estimated(hass: HomeAssistant):
+    """Test days without readings are closed at the recent mean ET0."""
+    engine = IrrigationEngine(hass, "test_entry", {"apple": APPLE}, 50.8, 100)
+    engine.weather.day = DAY
+    engine.recent_et0.extend([3.0, 5.0])
+
+    # Home Assistant was down for the two days after DAY
+    assert engine.roll_over(DAY + timedelta(days=3))
+
+    assert engine.weather.day == DAY + timedelta(days=3)
+    assert engine.depletion["apple"] == pytest.approx(2 * 0.95 * 4.0, abs=0.01)
+    assert list(engine.recent_et0) == [3.0, 5.0]
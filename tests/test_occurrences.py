@@ -0,0 +1,39 @@
+"""Test the Orchard Care occurrence records and shared descriptions."""
+from datetime import datetime
+
+from custom_components.orchard_care.descriptions import (
+    get_reminder_description,
+    get_task_description,
+)
+from custom_components.orchard_care.occurrences import Occurrence
+
+
+def test_occurrence_round_trip():
+    """Test records keep their start and derive reminder starts."""
+    occurrence = Occurrence("apple", "spray", datetime(2026, 3, 7, 7, 0))
+    reminder = occurrence.reminder(7)
+
+    assert occurrence.start == datetime(2026, 3, 7, 7, 0)
+    assert occurrence.uid == "apple:spray:2026-03-07"
+    assert not occurrence.is_reminder
+    assert reminder.is_reminder
+    assert reminder.start == datetime(2026, 2, 28, 7, 0)
+    assert reminder.task_start == occurrence.task_start
+    assert not hasattr(occurrence, "__dict__")
+
+
+def test_descriptions_are_shared():
+    """Test descriptions are built once per key and reused."""
+    first = get_task_description("en", "apple", "pruning", 1, "Organic", ())
+    second = get_task_description("en", "apple", "pruning", 1, "Organic", ())
+
+    assert first is second
+    assert "Apple Tree" in first
+    assert "Peak dormant season" in first
+    organic = ("Neem oil", "Copper fungicide")
+    assert "Neem oil, Copper fungicide" in get_task_description("en", "apple", "spray", 3, "Organic", organic)
+    assert "Captan" in get_task_description("en", "apple", "spray", 3, "Conventional", ("Captan",))
+    assert get_reminder_description("en", "apple", "spray", 3, "Organic", organic, 7).startswith("Prepare")
+    assert get_reminder_description("en", "apple", "spray", 3, "Organic", organic, 3).startswith(
+        "Check weather"
+    )
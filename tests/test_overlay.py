@@ -0,0 +1,62 @@
+"""Test the Orchard Care calendar overlay."""
+from datetime import datetime
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.orchard_care.overlay import CalendarOverlay, OverlayEvent
+
+
+def _event(uid: str, day: int, plant: str | None = None) -> OverlayEvent:
+    """Return a one-hour event on a day in March."""
+    return OverlayEvent(uid, plant, datetime(2026, 3, day, 9), datetime(2026, 3, day, 10), uid)
+
+
+async def test_events_by_start(hass: HomeAssistant):
+    """Test events are found by start time and replaced ids are tracked."""
+    overlay = CalendarOverlay(hass, "test_entry")
+    for day in (20, 5, 12):
+        overlay.async_set(_event(f"added-{day}", day))
+    overlay.async_set(_event("apple:spray:2026-03-07", 9, "apple"))
+
+    found = overlay.events(datetime(2026, 3, 5, 9), datetime(2026, 3, 12, 9))
+    assert [event.uid for event in found] == ["added-5", "apple:spray:2026-03-07", "added-12"]
+
+    overlay.async_cancel("apple:spray:2026-03-07")
+    overlay.async_delete("added-20")
+    assert overlay.is_cancelled("apple:spray:2026-03-07")
+    assert [event.uid for event in overlay.events(datetime(2026, 3, 1), datetime(2026, 3, 31))] == [
+        "added-5", "added-12",
+    ]
+    assert overlay.replaced == {"added-5", "added-12", "apple:spray:2026-03-07"}
+
+
+async def test_events_running_into_range(hass: HomeAssistant):
+    """Test events that started before a range and are still running are found."""
+    overlay = CalendarOverlay(hass, "test_entry")
+    overlay.async_set(OverlayEvent("harvest", None, datetime(2026, 3, 1), datetime(2026, 3, 4), "Harvest"))
+    overlay.async_set(_event("added-2", 2))
+    overlay.async_set(_event("added-5", 5))
+
+    found = overlay.events(datetime(2026, 3, 3, 12), datetime(2026, 3, 5, 12))
+    assert [event.uid for event in found] == ["harvest", "added-5"]
+    # An event ending as the range starts is over
+    assert overlay.events(datetime(2026, 3, 4), datetime(2026, 3, 4, 8)) == []
+
+
+async def test_load(hass: HomeAssistant, hass_storage: dict[str, Any]):
+    """Test stored edits are loaded into the index."""
+    hass_storage["orchard_care.test_entry.calendar_overlay"] = {
+        "version": 1,
+        "minor_version": 1,
+        "key": "orchard_care.test_entry.calendar_overlay",
+        "data": {
+            "events": {"apple:spray:2026-03-07": _event("apple:spray:2026-03-07", 9, "apple").as_dict()},
+            "cancelled": ["apple:spray:2026-04-06"],
+        },
+    }
+    overlay = CalendarOverlay(hass, "test_entry")
+    await overlay.async_load()
+
+    assert overlay.get("apple:spray:2026-03-07") == _event("apple:spray:2026-03-07", 9, "apple")
+    assert overlay.replaced == {"apple:spray:2026-03-07", "apple:spray:2026-04-06"}
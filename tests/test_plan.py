@@ -0,0 +1,81 @@
+"""Test the Orchard Care plan import and export."""
+import io
+
+from custom_components.orchard_care.blocks import OrchardBlock
+from custom_components.orchard_care.plan import (
+    PlanImport,
+    iter_plan_rows,
+    plan_rows,
+    write_plan,
+)
+
+CSV_PLAN = """block_id,plant,cultivar,count,location,pruning_months
+north-1,apple,Braeburn,120,North slope,1;2
+north-2,Apple Tree,Gala,80,North slope,
+,cherry,,,,
+north-1,pear,,10,,
+south-1,quince,,5,,
+south-2,pear,,many,,
+south-3,apple,,5,,13
+south-4,apple,,5,,3
+"""
+
+
+def _read(text: str, fmt: str, batch_size: int = 3) -> PlanImport:
+    """Validate a plan from text in small batches."""
+    plan = PlanImport()
+    rows = iter_plan_rows(io.StringIO(text), fmt)
+    while plan.read_batch(rows, batch_size):
+        pass
+    return plan
+
+
+def test_rows_are_validated_and_reported():
+    """Test every row gets a result and only valid rows become blocks."""
+    plan = _read(CSV_PLAN, "csv")
+
+    assert [block.block_id for block in plan.blocks] == ["north-1", "north-2", "cherry_3"]
+    assert plan.blocks[0] == OrchardBlock("north-1", "apple", 120, "North slope", "Braeburn")
+    assert plan.blocks[1].plant == "apple"
+    assert plan.blocks[2].count == 1
+    assert plan.overrides == {"apple": {"pruning_months": [1, 2]}}
+
+    assert len(plan.results) == 8
+    assert plan.error_count == 5
+    errors = {result["row"]: result["error"] for result in plan.results if result["status"] == "error"}
+    assert errors[4] == "duplicate block_id 'north-1'"
+    assert errors[5] == "unknown plant 'quince'"
+    assert errors[6] == "count must be a whole number"
+    assert errors[7] == "pruning_months must be months from 1 to 12"
+    assert errors[8] == "pruning_months conflicts with an earlier apple row"
+
+
+def test_json_lines_report_bad_lines():
+    """Test an undecodable JSON line fails only its own row."""
+    plan = _read('{"plant": "fig", "count": 3}\nnot json\n\n{"plant": "kiwi"}\n', "jsonl")
+
+    assert [block.plant for block in plan.blocks] == ["fig", "kiwi"]
+    assert plan.results[1]["status"] == "error"
+    assert plan.results[1]["error"].startswith("invalid JSON")
+
+
+def test_export_round_trip(tmp_path):
+    """Test an exported plan imports back to the same blocks."""
+    blocks = [
+        OrchardBlock("north-1", "apple", 120, "North slope", "Braeburn"),
+        OrchardBlock("east-1", "grape", 300, "East terrace"),
+    ]
+    overrides = {"apple": {"pruning_months": [1, 2]}}
+
+    for fmt in ("csv", "json", "jsonl"):
+        path = tmp_path / f"plan.{fmt}"
+        assert write_plan(str(path), fmt, plan_rows(blocks, overrides)) == 2
+
+        with open(path, encoding="utf-8", newline="") as plan_file:
+            plan = PlanImport()
+            rows = iter_plan_rows(plan_file, fmt)
+            while plan.read_batch(rows, 500):
+                pass
+
+        assert plan.blocks == blocks
+        assert plan.overrides == overrides
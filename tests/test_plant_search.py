@@ -0,0 +1,31 @@
+"""Test the Orchard Care plant catalog search."""
+from custom_components.orchard_care.plant_search import PrefixIndex, plant_index
+
+
+def test_search_by_prefix_and_alias():
+    """Test names, keys and botanical aliases are matched by word prefix."""
+    index = plant_index()
+
+    assert index.search("prunus") == ["apricot", "cherry", "peach", "plum"]
+    assert index.search("APP") == ["apple"]
+    assert index.search("cane fruit") == ["blackberry", "raspberry"]
+    assert index.search("prunus sweet") == ["cherry"]
+    assert index.search("durian") == []
+
+
+def test_empty_query_lists_catalog_by_name():
+    """Test an empty search lists every plant in name order."""
+    index = PrefixIndex({"b": "Banana", "a": "Zucchini", "c": "Apple"}, {})
+
+    assert index.search("  ") == ["c", "b", "a"]
+
+
+def test_pages():
+    """Test matches are returned a page at a time with the total."""
+    names = {f"plant_{number:03}": f"Plant {number:03}" for number in range(60)}
+    index = PrefixIndex(names, {})
+
+    keys, total = index.page("plant", 2, 25)
+    assert total == 60
+    assert keys == [f"plant_{number:03}" for number in range(50, 60)]
+    assert index.page("plant", 3, 25) == ([], 60)
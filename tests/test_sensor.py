@@ -1,27 +1,37 @@
 """Test the Orchard Care sensors."""
 import pytest
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from unittest.mock import Mock, patch
 
+from homeassistant.components.sensor import SensorDeviceClass
 from homeassistant.core import HomeAssistant
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from custom_components.orchard_care.sensor import (
     async_setup_entry,
+    OrchardCareChillSensor,
+    OrchardCareNextTaskSensor,
+    OrchardCarePlantingsSensor,
     OrchardCarePruningSensor,
     OrchardCareSpraySensor,
+    OrchardCareTasksDueSensor,
+    OrchardCareWaterDeficitSensor,
 )
 from custom_components.orchard_care import OrchardCareCoordinator, PLANT_CARE_DATA
+from custom_components.orchard_care.solar import task_start
 
 
 class TestOrchardCareSensors:
     """Test Orchard Care sensor functionality."""
 
     @pytest.fixture
-    def mock_coordinator(self):
+    def mock_coordinator(self, mock_config_entry):
         """Create a mock coordinator."""
         coordinator = Mock(spec=OrchardCareCoordinator)
+        coordinator.get_option.side_effect = lambda key, default=None: {
+            **mock_config_entry.data, **mock_config_entry.options
+        }.get(key, default)
         coordinator._data = {
             "apple": {
                 "pruning_months": [12, 1, 2],
@@ -32,17 +42,22 @@ class TestOrchardCareSensors:
                 "care_notes": "Test care notes"
             }
         }
+        coordinator.get_conflicts.return_value = []
+        coordinator.irrigation_enabled = False
+        coordinator.chill_enabled = False
         return coordinator
 
     @pytest.fixture
     def mock_config_entry(self):
         """Create a mock config entry."""
         config_entry = Mock(spec=ConfigEntry)
+        config_entry.entry_id = "test_entry"
         config_entry.data = {
             "hemisphere": "northern",
             "organic_preference": True,
             "selected_plants": ["apple", "pear"]
         }
+        config_entry.options = {}
         return config_entry
 
     async def test_async_setup_entry(self, hass: HomeAssistant, mock_coordinator, mock_config_entry):
@@ -63,16 +78,75 @@ class TestOrchardCareSensors:
             await async_setup_entry(hass, mock_config_entry, mock_add_entities)
 
             # Should create 2 sensors per plant (pruning + spray) * 2 plants = 4 sensors
-            assert len(entities) == 4
+            # plus the 2 orchard-wide labor forecast sensors
+            assert len(entities) == 6
             assert any(isinstance(entity, OrchardCarePruningSensor) for entity in entities)
             assert any(isinstance(entity, OrchardCareSpraySensor) for entity in entities)
 
+    async def test_async_setup_entry_aggregate(self, hass: HomeAssistant, mock_coordinator, mock_config_entry):
+        """Test aggregate mode creates a fixed set of sensors."""
+        mock_config_entry.options = {"entity_mode": "aggregate"}
+        hass.data = {'orchard_care': {'test_entry': mock_coordinator}}
+        mock_config_entry.entry_id = 'test_entry'
+        mock_config_entry.data["selected_plants"] = list(PLANT_CARE_DATA)
+
+        entities = []
+        async def mock_add_entities(new_entities):
+            entities.extend(new_entities)
+
+        await async_setup_entry(hass, mock_config_entry, mock_add_entities)
+
+        # Entity count no longer depends on the number of plants
+        assert len(entities) == 6
+        assert not any(isinstance(entity, OrchardCarePruningSensor) for entity in entities)
+
+    async def test_async_setup_entry_follows_options(
+        self, hass: HomeAssistant, mock_coordinator, mock_config_entry
+    ):
+        """Test plants chosen in the options flow replace those chosen at setup."""
+        hass.data = {'orchard_care': {'test_entry': mock_coordinator}}
+        mock_config_entry.options = {"selected_plants": ["cherry"]}
+
+        entities = []
+        await async_setup_entry(hass, mock_config_entry, entities.extend)
+
+        assert {entity.plant for entity in entities if hasattr(entity, "plant")} == {"cherry"}
+
+    def test_aggregate_sensor_states(self, mock_coordinator, mock_config_entry):
+        """Test aggregate sensors read the coordinator summary."""
+        next_spray = datetime.now() + timedelta(days=5)
+        mock_coordinator.summary = {
+            "tasks_due_week": [
+                {"plant": "apple", "task": "spray", "date": next_spray.isoformat(), "blocks": 3, "plants": 120},
+            ],
+            "next_task": {"spray": {"date": next_spray, "plants": ["apple"], "blocks": 3}},
+            "species": {"apple": {"name": "Apple Tree", "blocks": 3, "plants": 120}},
+            "total_blocks": 3,
+            "total_plants": 120,
+        }
+
+        tasks_due = OrchardCareTasksDueSensor(mock_coordinator, mock_config_entry)
+        assert tasks_due.native_value == 3
+        assert tasks_due.extra_state_attributes["plants_affected"] == 120
+
+        mock_config_entry.entry_id = "test_entry"
+        next_spray_sensor = OrchardCareNextTaskSensor(mock_coordinator, mock_config_entry, "spray")
+        assert next_spray_sensor.unique_id == "orchard_care_test_entry_next_spray"
+        assert "days" in next_spray_sensor.native_value
+
+        next_pruning_sensor = OrchardCareNextTaskSensor(mock_coordinator, mock_config_entry, "pruning")
+        assert next_pruning_sensor.native_value == "Not scheduled"
+
+        plantings = OrchardCarePlantingsSensor(mock_coordinator, mock_config_entry)
+        assert plantings.native_value == 120
+        assert plantings.extra_state_attributes["species"]["apple"]["blocks"] == 3
+
     def test_pruning_sensor_properties(self, mock_coordinator, mock_config_entry):
         """Test pruning sensor properties."""
         sensor = OrchardCarePruningSensor(mock_coordinator, "apple", mock_config_entry)
 
         # Test basic properties
-        assert sensor.unique_id == "orchard_care_apple_pruning"
+        assert sensor.unique_id == "orchard_care_test_entry_apple_pruning"
         assert sensor.name == "Apple Tree Pruning"
         assert sensor.icon == "mdi:content-cut"
 
@@ -80,6 +154,7 @@ class TestOrchardCareSensors:
         device_info = sensor.device_info
         assert device_info["name"] == "Apple Tree"
         assert device_info["manufacturer"] == "Orchard Care"
+        assert device_info["identifiers"] == {("orchard_care", "test_entry_apple")}
 
     def test_pruning_sensor_state(self, mock_coordinator, mock_config_entry):
         """Test pruning sensor state calculation."""
@@ -89,6 +164,41 @@ class TestOrchardCareSensors:
         state = sensor.native_value
         assert "15 days" in state or state == "In 15 days"
 
+    def test_timestamp_sensor_state(self, mock_coordinator, mock_config_entry):
+        """Test the timestamp mode reports the start of the next calendar event."""
+        mock_coordinator.get_option.side_effect = lambda key, default=None: (
+            "timestamp" if key == "sensor_state" else default
+        )
+        mock_coordinator.solar_location = None
+        mock_coordinator.completions = Mock()
+        mock_coordinator.completions.is_completed.return_value = False
+        sensor = OrchardCarePruningSensor(mock_coordinator, "apple", mock_config_entry)
+        now = datetime(2026, 1, 20, 12, 0)
+        february = task_start("pruning", date(2026, 2, 15), None)
+
+        assert sensor.device_class == SensorDeviceClass.TIMESTAMP
+        with patch("custom_components.orchard_care.sensor.datetime") as mock_datetime:
+            # Inside a pruning month the state is the next event, not the 1st of the month
+            mock_datetime.now.return_value = now
+            assert sensor.native_value.replace(tzinfo=None) == february
+            assert sensor.native_value.tzinfo is not None
+
+            # The state stays put from day to day
+            mock_datetime.now.return_value = now + timedelta(days=3)
+            assert sensor.native_value.replace(tzinfo=None) == february
+
+            # Completed tasks are skipped
+            mock_coordinator.completions.is_completed.side_effect = (
+                lambda plant, task, day: day == february.date()
+            )
+            assert sensor.native_value.replace(tzinfo=None) == task_start(
+                "pruning", date(2026, 12, 15), None
+            )
+
+        mock_coordinator.summary = {"next_task": {}}
+        next_spray = OrchardCareNextTaskSensor(mock_coordinator, mock_config_entry, "spray")
+        assert next_spray.native_value is None
+
     def test_pruning_sensor_attributes(self, mock_coordinator, mock_config_entry):
         """Test pruning sensor attributes."""
         sensor = OrchardCarePruningSensor(mock_coordinator, "apple", mock_config_entry)
@@ -105,7 +215,7 @@ class TestOrchardCareSensors:
         sensor = OrchardCareSpraySensor(mock_coordinator, "apple", mock_config_entry)
 
         # Test basic properties
-        assert sensor.unique_id == "orchard_care_apple_spray"
+        assert sensor.unique_id == "orchard_care_test_entry_apple_spray"
         assert sensor.name == "Apple Tree Spray"
         assert sensor.icon == "mdi:spray"
 
@@ -127,6 +237,8 @@ class TestOrchardCareSensors:
         assert "spray_products" in attributes
         assert "spray_type" in attributes
         assert attributes["spray_type"] == "organic"  # Based on config preference
+        assert attributes["product_details"][0]["name"] == "Neem oil"
+        assert attributes["conflicts"] == []
 
     def test_spray_sensor_conventional_products(self, mock_coordinator, mock_config_entry):
         """Test spray sensor with conventional preference."""
@@ -195,4 +307,42 @@ class TestOrchardCareSensors:
 
             assert pruning_sensor.unique_id.endswith("_pruning")
             assert spray_sensor.unique_id.endswith("_spray")
-            assert pruning_sensor.plant_data["name"]  # Should have plant data
\ No newline at end of file
+            assert pruning_sensor.plant_data["name"]  # Should have plant data
+
+    def test_water_deficit_sensor(self, mock_coordinator, mock_config_entry):
+        """Test the water deficit sensor reports the balance and the planned irrigation."""
+        next_irrigation = datetime.now() + timedelta(days=2)
+        mock_coordinator.irrigation = Mock(depletion={"apple": 42.5})
+        mock_coordinator.irrigation_plan = {"apple": (next_irrigation, 91.0)}
+        mock_coordinator._data["apple"]["root_zone_water_mm"] = 180
+
+        sensor = OrchardCareWaterDeficitSensor(mock_coordinator, "apple", mock_config_entry)
+
+        assert sensor.unique_id == "orchard_care_test_entry_apple_water_deficit"
+        assert sensor.native_value == 42.5
+        assert sensor.extra_state_attributes["next_irrigation"] == next_irrigation
+        assert sensor.extra_state_attributes["irrigation_amount_mm"] == 91.0
+        assert sensor.extra_state_attributes["root_zone_water_mm"] == 180
+
+    def test_chill_sensor(self, mock_coordinator, mock_config_entry):
+        """Test the chill sensor and the late-pruning guidance on the pruning sensor."""
+        status = {
+            "progress": 40.0,
+            "chill_portions": 22.0,
+            "satisfied": False,
+            "late_pruning_from": datetime.now().date() + timedelta(days=30),
+            "guidance": "Chill 40% complete; hold late pruning until about March 1",
+        }
+        mock_coordinator.chill_enabled = True
+        mock_coordinator.chill = Mock()
+        mock_coordinator.chill.status.return_value = status
+
+        sensor = OrchardCareChillSensor(mock_coordinator, "apple", mock_config_entry)
+        assert sensor.unique_id == "orchard_care_test_entry_apple_chill"
+        assert sensor.native_value == 40.0
+        assert sensor.extra_state_attributes["chill_portions"] == 22.0
+        assert sensor.extra_state_attributes["dormancy_satisfied"] is False
+
+        pruning = OrchardCarePruningSensor(mock_coordinator, "apple", mock_config_entry)
+        assert pruning.extra_state_attributes["late_pruning_from"] == status["late_pruning_from"]
+        assert pruning.extra_state_attributes["chill_guidance"] == status["guidance"]
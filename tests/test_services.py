@@ -0,0 +1,180 @@
+"""Test the Orchard Care services."""
+from datetime import datetime
+from unittest.mock import Mock, patch
+
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from homeassistant.core import HomeAssistant
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.exceptions import ServiceValidationError
+
+from custom_components.orchard_care import OrchardCareCoordinator
+from custom_components.orchard_care.const import DOMAIN
+from custom_components.orchard_care.services import (
+    SERVICE_EXPORT_PLAN,
+    SERVICE_IMPORT_PLAN,
+    SERVICE_QUERY,
+    SERVICE_SIMULATE,
+    async_setup_services,
+)
+from custom_components.orchard_care.simulate import SimulationPool, _init_worker, simulate_batch
+
+
+def _make_coordinator(hass: HomeAssistant, entry_id: str) -> OrchardCareCoordinator:
+    """Create a coordinator with a single apple planting."""
+    entry = Mock(spec=ConfigEntry)
+    entry.entry_id = entry_id
+    entry.data = {"selected_plants": ["apple"]}
+    entry.options = {}
+    coordinator = OrchardCareCoordinator(hass, entry)
+    coordinator._data = {
+        "apple": {
+            "next_pruning": datetime(2030, 12, 1),
+            "next_spray": None,
+            "spray_products": ["Neem oil", "Copper fungicide", "Horticultural oil", "Spinosad"],
+        }
+    }
+    return coordinator
+
+
+async def test_query_overview(hass: HomeAssistant):
+    """Test the overview query returns one row per planting across entries."""
+    hass.data[DOMAIN] = {
+        "first": _make_coordinator(hass, "first"),
+        "second": _make_coordinator(hass, "second"),
+    }
+    await async_setup_services(hass)
+
+    response = await hass.services.async_call(
+        DOMAIN, SERVICE_QUERY, {"query": "overview"}, blocking=True, return_response=True
+    )
+
+    assert response["count"] == 2
+    row = response["plantings"][0]
+    assert row["name"] == "Apple Tree"
+    assert row["next_pruning"] == "2030-12-01T00:00:00"
+    assert row["next_spray"] is None
+    assert len(row["spray_products"]) == 3
+
+
+async def test_query_single_entry(hass: HomeAssistant):
+    """Test limiting the query to one config entry."""
+    hass.data[DOMAIN] = {"first": _make_coordinator(hass, "first")}
+    await async_setup_services(hass)
+
+    response = await hass.services.async_call(
+        DOMAIN, SERVICE_QUERY, {"entry_id": "missing"}, blocking=True, return_response=True
+    )
+
+    assert response["count"] == 0
+
+
+async def test_query_blocks_follows_options(hass: HomeAssistant):
+    """Test plantings changed in the options flow replace those chosen at setup."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={"selected_plants": ["apple"], "hemisphere": "northern"},
+        options={"selected_plants": ["pear", "plum"], "hemisphere": "southern"},
+    )
+    coordinator = OrchardCareCoordinator(hass, entry)
+    await coordinator._calculate_care_schedules()
+    hass.data[DOMAIN] = {entry.entry_id: coordinator}
+    await async_setup_services(hass)
+
+    response = await hass.services.async_call(
+        DOMAIN, SERVICE_QUERY, {"query": "blocks"}, blocking=True, return_response=True
+    )
+
+    assert [block["plant"] for block in response["blocks"]] == ["pear", "plum"]
+    assert set(coordinator._data) == {"pear", "plum"}
+    # Southern orchards prune pears six months later
+    assert coordinator._data["pear"]["pruning_months"] == [6, 7, 8]
+
+
+async def test_import_plan(hass: HomeAssistant, tmp_path):
+    """Test a plan import updates the entry once and reports every row."""
+    entry = MockConfigEntry(domain=DOMAIN, data={"selected_plants": ["apple"]})
+    entry.add_to_hass(hass)
+    hass.data[DOMAIN] = {entry.entry_id: OrchardCareCoordinator(hass, entry)}
+    hass.config.allowlist_external_dirs = {str(tmp_path)}
+    await async_setup_services(hass)
+
+    rows = "\n".join(f"block-{index},pear,,{index % 50},Row {index // 100}" for index in range(2000))
+    plan_path = tmp_path / "plan.csv"
+    plan_path.write_text(f"block_id,plant,cultivar,count,location\n{rows}\nbad,quince,,1,\n")
+
+    with patch.object(
+        hass.config_entries, "async_update_entry", wraps=hass.config_entries.async_update_entry
+    ) as update_entry:
+        response = await hass.services.async_call(
+            DOMAIN, SERVICE_IMPORT_PLAN, {"path": str(plan_path)},
+            blocking=True, return_response=True,
+        )
+
+    assert update_entry.call_count == 1
+    assert response["imported"] == 2000
+    assert response["errors"] == 1
+    assert response["rows"][-1] == {"row": 2001, "status": "error", "error": "unknown plant 'quince'"}
+    assert len(entry.data["blocks"]) == 2000
+    assert entry.data["selected_plants"] == ["pear"]
+
+    # The reloaded orchard exports the imported blocks
+    hass.data[DOMAIN] = {entry.entry_id: OrchardCareCoordinator(hass, entry)}
+    response = await hass.services.async_call(
+        DOMAIN, SERVICE_EXPORT_PLAN, {}, blocking=True, return_response=True
+    )
+    assert response["count"] == 2000
+    assert response["blocks"][1] == {
+        "block_id": "block-1", "plant": "pear", "count": 1, "location": "Row 0", "cultivar": "",
+    }
+
+
+async def test_import_plan_rejects_paths_outside_allowlist(hass: HomeAssistant):
+    """Test plan files must be in an allowed directory."""
+    hass.data[DOMAIN] = {"first": _make_coordinator(hass, "first")}
+    await async_setup_services(hass)
+
+    with pytest.raises(ServiceValidationError):
+        await hass.services.async_call(
+            DOMAIN, SERVICE_IMPORT_PLAN, {"path": "/etc/passwd"},
+            blocking=True, return_response=True,
+        )
+
+
+async def test_simulate_fills_in_the_orchard(hass: HomeAssistant):
+    """Test scenarios take what they leave out from the orchard."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={"selected_plants": ["apple"], "organic_preference": False, "hemisphere": "northern"},
+    )
+    entry.add_to_hass(hass)
+    hass.data[DOMAIN] = {entry.entry_id: OrchardCareCoordinator(hass, entry)}
+    await async_setup_services(hass)
+    _init_worker()
+
+    # Run the workers' code in process; the pool itself is tested with the simulator
+    with patch.object(SimulationPool, "_run", lambda self, scenarios: simulate_batch(scenarios)):
+        response = await hass.services.async_call(
+            DOMAIN,
+            SERVICE_SIMULATE,
+            {"scenarios": [
+                {"name": "today", "season": 2026},
+                {"name": "organic", "season": 2026, "organic_preference": True, "plants": ["pear"]},
+            ]},
+            blocking=True,
+            return_response=True,
+        )
+
+    today, organic = response["scenarios"]
+    assert "Captan" in today["sprays"]["by_product"]
+    assert "Neem oil" in organic["sprays"]["by_product"]
+
+    with pytest.raises(ServiceValidationError):
+        await hass.services.async_call(
+            DOMAIN,
+            SERVICE_SIMULATE,
+            {"scenarios": [{"name": "bad", "climate_zone": "polar ice"}]},
+            blocking=True,
+            return_response=True,
+        )
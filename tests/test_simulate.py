@@ -0,0 +1,66 @@
+"""Test the Orchard Care season simulator."""
+from custom_components.orchard_care.climate import zone_for_site
+from custom_components.orchard_care.simulate import (
+    Scenario,
+    SimulationPool,
+    _init_worker,
+    simulate_batch,
+    simulate_scenario,
+)
+
+_init_worker()
+
+
+def test_scenario_counts():
+    """Test workload, sprays and conflicts of one season."""
+    result = simulate_scenario(Scenario("base", {"apple": 10}, 2026))
+
+    # Apple is pruned in Dec-Feb and sprayed in March-May and September
+    assert result["pruning"] == 3
+    assert result["sprays"]["applications"] == 4
+    assert result["sprays"]["by_product"]["Neem oil"] == 4
+    assert result["workload"]["by_task"]["pruning"] == 3 * 3 * 10
+    assert result["conflicts"]["count"] == sum(result["conflicts"]["by_kind"].values())
+    assert "irrigation" not in result
+
+
+def test_scenarios_differ():
+    """Test spray program and climate zone change the outcome."""
+    organic, conventional, subarctic = simulate_batch([
+        Scenario("organic", {"apple": 1}, 2026),
+        Scenario("conventional", {"apple": 1}, 2026, organic_preference=False),
+        Scenario("subarctic", {"apple": 1}, 2026, climate_zone=zone_for_site("Dfc", None)),
+    ])
+
+    assert "Captan" in conventional["sprays"]["by_product"]
+    assert "Captan" not in organic["sprays"]["by_product"]
+    assert subarctic["sprays"]["applications"] < organic["sprays"]["applications"]
+
+
+def test_weather_year(tmp_path):
+    """Test a recorded weather year drives the irrigation estimate."""
+    weather = tmp_path / "weather_2022.csv"
+    rows = ["date,temp_min,temp_max,rain"]
+    rows += [f"2022-07-{day:02d},16,34,0" for day in range(1, 32)]
+    weather.write_text("\n".join(rows) + "\n", encoding="utf-8")
+
+    dry, missing = simulate_batch([
+        Scenario("dry", {"apple": 1}, 2026, latitude=45.0, weather_file=str(weather)),
+        Scenario("missing", {"apple": 1}, 2026, weather_file=str(tmp_path / "none.csv")),
+    ])
+
+    assert dry["irrigation"]["events"] >= 1
+    assert dry["irrigation"]["water_mm"] > 0
+    assert "error" in missing
+
+
+def test_pool_runs_in_worker_processes():
+    """Test scenarios survive the trip to a worker process and back in order."""
+    pool = SimulationPool(None, workers=1)
+    try:
+        results = pool._run([Scenario(f"s{index}", {"pear": index}, 2026) for index in range(20)])
+    finally:
+        pool.shutdown()
+
+    assert [result["name"] for result in results] == [f"s{index}" for index in range(20)]
+    assert results[19]["workload"]["hours"] == 19 * results[1]["workload"]["hours"]
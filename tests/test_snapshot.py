@@ -0,0 +1,58 @@
+"""Test the Orchard Care schedule snapshot."""
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock
+
+from pytest_homeassistant_custom_component.common import MockConfigEntry, async_fire_time_changed
+
+from homeassistant.const import EVENT_HOMEASSISTANT_STARTED
+from homeassistant.core import CoreState, HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from custom_components.orchard_care import PLANT_CARE_DATA, OrchardCareCoordinator
+from custom_components.orchard_care.const import DOMAIN
+from custom_components.orchard_care.snapshot import SAVE_DELAY, _decode, _encode, config_hash
+
+
+def test_round_trip_and_hash():
+    """Test datetimes survive storage and the hash follows every input."""
+    snapshot = {"apple": {"next_pruning": datetime(2026, 12, 1, 9), "months": [12, 1, 2]}}
+    assert _decode(_encode(snapshot)) == snapshot
+
+    digest = config_hash(PLANT_CARE_DATA, {"selected_plants": ["apple"]}, {}, 52.0)
+    assert digest == config_hash(PLANT_CARE_DATA, {"selected_plants": ["apple"]}, {}, 52.0)
+    assert digest != config_hash(PLANT_CARE_DATA, {"selected_plants": ["pear"]}, {}, 52.0)
+    assert digest != config_hash(PLANT_CARE_DATA, {"selected_plants": ["apple"]}, {}, -33.9)
+
+
+async def test_startup_from_snapshot(hass: HomeAssistant, hass_storage):
+    """Test a restart comes up from the snapshot and revalidates after startup."""
+    entry = MockConfigEntry(domain=DOMAIN, data={"selected_plants": ["apple", "cherry"]})
+    entry.add_to_hass(hass)
+
+    first = OrchardCareCoordinator(hass, entry)
+    await first.async_initialize()
+    await hass.async_block_till_done()
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=SAVE_DELAY + 1))
+    await hass.async_block_till_done()
+    await first.async_cleanup()
+    assert hass_storage[f"{DOMAIN}.{entry.entry_id}.schedule"]["data"]["hash"]
+
+    hass.set_state(CoreState.not_running)
+    second = OrchardCareCoordinator(hass, entry)
+    await second.async_initialize()
+    scan = AsyncMock()
+    second.async_add_startup_scan(scan)
+
+    # Schedules come straight from the snapshot; derived data waits for startup
+    assert second._data == first._data
+    assert second.summary == first.summary
+    assert second.workload is None
+    scan.assert_not_awaited()
+
+    hass.set_state(CoreState.running)
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_STARTED)
+    await hass.async_block_till_done()
+
+    assert second.workload is not None
+    scan.assert_awaited_once()
+    await second.async_cleanup()
@@ -0,0 +1,160 @@
+"""Event-loop latency soak test for large synthetic orchards.
+
+Skipped by default. Run with, for example:
+
+    ORCHARD_SOAK=1 ORCHARD_SOAK_SIZES=100,1000,5000 ORCHARD_SOAK_ENTRIES=3 \\
+        pytest tests/test_soak.py -o log_cli=true --log-cli-level=INFO
+"""
+import asyncio
+import logging
+import os
+import time
+import tracemalloc
+from datetime import timedelta
+
+import pytest
+
+from homeassistant.components.recorder.db_schema import States
+from homeassistant.components.recorder.util import session_scope
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_fire_time_changed,
+)
+from pytest_homeassistant_custom_component.components.recorder.common import (
+    async_wait_recording_done,
+)
+
+from custom_components.orchard_care.const import DOMAIN
+
+from .load_generator import SoakReport, SoakResult, synthetic_entry_data
+
+_LOGGER = logging.getLogger(__name__)
+
+pytestmark = pytest.mark.skipif(
+    not os.environ.get("ORCHARD_SOAK"), reason="Set ORCHARD_SOAK=1 to run the soak test"
+)
+
+SIZES = [int(size) for size in os.environ.get("ORCHARD_SOAK_SIZES", "100,1000").split(",")]
+ENTRIES = int(os.environ.get("ORCHARD_SOAK_ENTRIES", "3"))
+LAG_BUDGET = float(os.environ.get("ORCHARD_SOAK_LAG_BUDGET", "0.1"))
+SEASON_DAYS = 365
+STEP = timedelta(hours=6)
+
+
+def _wall_clock() -> float:
+    """Return a monotonic wall clock.
+
+    The freezer fakes time.monotonic and with it the loop clock, but not
+    clock_gettime.
+    """
+    return time.clock_gettime(time.CLOCK_MONOTONIC)
+
+
+class LoopLagProbe:
+    """Measure the longest stretch the event loop goes without serving a waiting task.
+
+    The probe yields on every loop iteration, so the gap between two of its
+    resumptions is the time the loop spent running everything else.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the probe."""
+        self.max_lag = 0.0
+        self._task: asyncio.Task | None = None
+
+    async def _run(self) -> None:
+        """Record the gap between consecutive loop iterations."""
+        last = _wall_clock()
+        while True:
+            await asyncio.sleep(0)
+            now = _wall_clock()
+            self.max_lag = max(self.max_lag, now - last)
+            last = now
+
+    def start(self) -> None:
+        """Start probing; the task is not tracked by hass so block_till_done ignores it."""
+        self.max_lag = 0.0
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def async_stop(self) -> None:
+        """Stop probing."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+def _count_state_rows(hass: HomeAssistant) -> int:
+    """Return the number of state rows the recorder has written."""
+    with session_scope(hass=hass, read_only=True) as session:
+        return session.query(States).count()
+
+
+async def _async_run_size(hass: HomeAssistant, freezer, plantings: int) -> SoakResult:
+    """Set up one synthetic orchard and fast-forward it through a season."""
+    result = SoakResult(plantings=plantings, entries=ENTRIES)
+    state_writes = 0
+
+    def count_write(event) -> None:
+        nonlocal state_writes
+        state_writes += 1
+
+    await async_wait_recording_done(hass)
+    rows_before = _count_state_rows(hass)
+    unsub = hass.bus.async_listen(EVENT_STATE_CHANGED, count_write)
+    tracemalloc.start()
+
+    started = _wall_clock()
+    entries = []
+    for data in synthetic_entry_data(plantings, ENTRIES):
+        entry = MockConfigEntry(domain=DOMAIN, data=data)
+        entry.add_to_hass(hass)
+        assert await hass.config_entries.async_setup(entry.entry_id)
+        entries.append(entry)
+    await hass.async_block_till_done()
+    result.setup_seconds = _wall_clock() - started
+    result.entities = len([
+        state for state in hass.states.async_all() if state.entity_id.split(".")[1].startswith("orchard")
+    ])
+
+    # Each step runs every due timer while the probe waits for its turn on the loop
+    probe = LoopLagProbe()
+    probe.start()
+    now = dt_util.utcnow()
+    for _ in range(int(timedelta(days=SEASON_DAYS) / STEP)):
+        now += STEP
+        freezer.move_to(now)
+        async_fire_time_changed(hass, now)
+        await hass.async_block_till_done()
+    await probe.async_stop()
+    result.max_loop_lag = probe.max_lag
+
+    await async_wait_recording_done(hass)
+    result.recorder_rows = _count_state_rows(hass) - rows_before
+
+    result.state_writes = state_writes
+    result.peak_memory_mb = tracemalloc.get_traced_memory()[1] / 1_000_000
+    tracemalloc.stop()
+    unsub()
+
+    for entry in entries:
+        assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+    return result
+
+
+async def test_soak(recorder_mock, hass: HomeAssistant, enable_custom_integrations, freezer):
+    """Drive the real setup paths through a season at each size and report scaling."""
+    report = SoakReport(lag_budget=LAG_BUDGET)
+    for plantings in sorted(SIZES):
+        report.results.append(await _async_run_size(hass, freezer, plantings))
+
+    _LOGGER.info("Soak report:\n%s", report.format())
+
+    assert report.scaling_limit is None, report.format()
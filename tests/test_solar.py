@@ -0,0 +1,58 @@
+"""Test the Orchard Care solar task timing."""
+from datetime import date, datetime, timedelta
+
+from custom_components.orchard_care import PLANT_CARE_DATA
+from custom_components.orchard_care.const import TASK_PRUNING, TASK_SPRAY
+from custom_components.orchard_care.schedule import iter_occurrences
+from custom_components.orchard_care.solar import SolarLocation, solar_day, task_start
+
+LONDON = SolarLocation(51.5074, -0.1278, 11.0, "Europe/London")
+SVALBARD = SolarLocation(78.2232, 15.6267, 0.0, "Arctic/Longyearbyen")
+REYKJAVIK = SolarLocation(64.1466, -21.9426, 0.0, "Atlantic/Reykjavik")
+
+
+def test_fixed_hours_without_location():
+    """Test tasks keep the fixed hours when no location is known."""
+    assert task_start(TASK_SPRAY, date(2026, 3, 7)) == datetime(2026, 3, 7, 7, 0)
+    assert task_start(TASK_PRUNING, date(2026, 1, 15)) == datetime(2026, 1, 15, 9, 0)
+
+
+def test_spray_follows_sunrise():
+    """Test sprays start half an hour after local sunrise, to the minute."""
+    sunrise, _sunset = solar_day(LONDON, date(2026, 6, 7))
+    start = task_start(TASK_SPRAY, date(2026, 6, 7), LONDON)
+
+    assert start == (sunrise + timedelta(minutes=30)).replace(second=0, microsecond=0)
+    assert start < task_start(TASK_SPRAY, date(2026, 12, 7), LONDON)
+
+
+def test_short_days_end_by_sunset():
+    """Test tasks on short days start early enough to finish in daylight."""
+    sunrise, sunset = solar_day(REYKJAVIK, date(2026, 12, 15))
+    start = task_start(TASK_PRUNING, date(2026, 12, 15), REYKJAVIK)
+
+    # Two hours after sunrise would leave the three hour pruning in the dark
+    assert start < sunrise + timedelta(hours=2)
+    assert start >= sunrise.replace(second=0, microsecond=0)
+    assert start + timedelta(hours=3) <= sunset
+
+
+def test_polar_night_falls_back_to_fixed_hours():
+    """Test days without a sunrise use the fixed hours."""
+    assert task_start(TASK_SPRAY, date(2026, 12, 21), SVALBARD) == datetime(2026, 12, 21, 7, 0)
+
+
+def test_year_expansion_shares_solar_cache():
+    """Test a year of events for every plant needs at most one solar computation per day."""
+    solar_day.cache_clear()
+    schedule_start, schedule_end = datetime(2026, 1, 1), datetime(2026, 12, 31, 23, 59)
+
+    for plant_data in PLANT_CARE_DATA.values():
+        schedule = {
+            "pruning_months": plant_data["pruning_months"],
+            "spray_months": plant_data["spray_months"],
+        }
+        assert list(iter_occurrences(schedule, schedule_start, schedule_end, LONDON))
+
+    assert solar_day.cache_info().misses <= 365
+    assert solar_day.cache_info().hits > 0
@@ -0,0 +1,117 @@
+"""Test the Orchard Care compliance statistics."""
+from datetime import UTC, datetime, timedelta
+from unittest.mock import patch
+
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from custom_components.orchard_care.statistics import (
+    SAVE_DELAY,
+    ComplianceStatistics,
+    build_statistics,
+    count_rows,
+    statistic_id,
+)
+
+NOW = datetime(2026, 6, 1, 12, 0)
+SCHEDULES = {
+    "apple": {
+        "pruning_months": [1, 2],
+        "spray_months": [3, 4],
+        "spray_products": ["Neem oil", "Copper fungicide"],
+    }
+}
+
+
+def _completion(task: str, completed: str) -> dict:
+    """Return a completion log record."""
+    return {"plant": "apple", "task": task, "date": completed[:10], "completed": completed}
+
+
+def test_rows_reset_each_season():
+    """Test the state counts one season while the sum keeps running."""
+    rows = count_rows(
+        [datetime(2025, 3, 7, 7, 20), datetime(2025, 3, 7, 7, 40), datetime(2026, 3, 7, 7, 5)],
+        2025,
+        NOW,
+        UTC,
+    )
+
+    assert rows == (
+        (datetime(2025, 3, 7, 7, tzinfo=UTC), 2, 2),
+        (datetime(2026, 1, 1, tzinfo=UTC), 0, 2),
+        (datetime(2026, 3, 7, 7, tzinfo=UTC), 1, 3),
+    )
+
+
+def test_build_statistics():
+    """Test due, completed and per-product counts of a planting."""
+    statistics = {
+        statistic.statistic_id: statistic
+        for statistic in build_statistics(
+            "ENTRY",
+            SCHEDULES,
+            [_completion("spray", "2026-03-08T10:15:00"), _completion("pruning", "2026-01-16T09:00:00")],
+            2026,
+            NOW,
+            UTC,
+        )
+    }
+
+    assert set(statistics) == {
+        "orchard_care:entry_apple_pruning_due",
+        "orchard_care:entry_apple_spray_due",
+        "orchard_care:entry_apple_pruning_completed",
+        "orchard_care:entry_apple_spray_completed",
+        "orchard_care:entry_apple_spray_neem_oil",
+        "orchard_care:entry_apple_spray_copper_fungicide",
+    }
+    assert statistics["orchard_care:entry_apple_spray_due"].rows[-1][1:] == (2, 2)
+    assert statistics["orchard_care:entry_apple_spray_neem_oil"].name == "Apple Tree Neem oil applications"
+    assert statistics["orchard_care:entry_apple_spray_neem_oil"].rows == (
+        (datetime(2026, 3, 8, 10, tzinfo=UTC), 1, 1),
+    )
+
+
+async def test_publish_writes_only_changes(hass: HomeAssistant):
+    """Test unchanged statistics are skipped and new rows appended."""
+    publisher = ComplianceStatistics(hass, "entry")
+    completions = [_completion("spray", "2026-03-08T10:15:00")]
+
+    with patch(
+        "custom_components.orchard_care.statistics.async_add_external_statistics"
+    ) as add_statistics:
+        first = build_statistics("entry", SCHEDULES, completions, 2026, NOW, UTC)
+        # Statistics without rows yet are not written
+        assert publisher.async_publish(first) == 5
+        assert publisher.async_publish(first) == 0
+
+        completions.append(_completion("spray", "2026-04-08T10:15:00"))
+        assert publisher.async_publish(
+            build_statistics("entry", SCHEDULES, completions, 2026, NOW, UTC)
+        ) == 3
+
+    metadata, rows = add_statistics.call_args[0][1:]
+    assert metadata["statistic_id"] == statistic_id("entry", "apple", "spray_copper_fungicide")
+    assert metadata["has_sum"]
+    assert [row["sum"] for row in rows] == [2]
+
+
+async def test_published_rows_survive_restart(hass: HomeAssistant, hass_storage):
+    """Test a restarted publisher does not import unchanged statistics again."""
+    statistics = build_statistics(
+        "entry", SCHEDULES, [_completion("spray", "2026-03-08T10:15:00")], 2026, NOW, UTC
+    )
+
+    with patch("custom_components.orchard_care.statistics.async_add_external_statistics"):
+        publisher = ComplianceStatistics(hass, "entry")
+        await publisher.async_load()
+        assert publisher.async_publish(statistics) == 5
+        async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=SAVE_DELAY + 1))
+        await hass.async_block_till_done()
+
+        restarted = ComplianceStatistics(hass, "entry")
+        await restarted.async_load()
+        assert restarted.async_publish(statistics) == 0
@@ -0,0 +1,67 @@
+"""Test the Orchard Care tank-mix planner."""
+from datetime import date, datetime
+
+from custom_components.orchard_care.tankmix import TankMixPlanner
+
+SEASON_START = datetime(2026, 1, 1)
+SEASON_END = datetime(2026, 12, 31, 23, 59)
+
+
+def test_groups_shared_products():
+    """Test plantings sharing a product on the same day form one job."""
+    planner = TankMixPlanner()
+    planner.update_planting("apple", [3, 4], ["Copper fungicide", "Neem oil"], SEASON_START, SEASON_END)
+    planner.update_planting("cherry", [3], ["Copper fungicide"], SEASON_START, SEASON_END)
+
+    jobs = planner.jobs(SEASON_START, SEASON_END)
+
+    assert len(jobs) == 1
+    assert jobs[0].product == "Copper fungicide"
+    assert jobs[0].start == datetime(2026, 3, 7, 7, 0)
+    assert jobs[0].as_dict()["plantings"] == ["apple", "cherry"]
+
+
+def test_incremental_updates():
+    """Test unchanged plantings are skipped and removals shrink groups."""
+    planner = TankMixPlanner()
+    planner.update_planting("apple", [3], ["Copper fungicide"], SEASON_START, SEASON_END)
+    planner.update_planting("pear", [3], ["Copper fungicide"], SEASON_START, SEASON_END)
+
+    assert not planner.update_planting("apple", [3], ["Copper fungicide"], SEASON_START, SEASON_END)
+    assert planner.update_planting("pear", [4], ["Copper fungicide"], SEASON_START, SEASON_END)
+    assert planner.jobs(SEASON_START, SEASON_END) == []
+
+    planner.update_planting("cherry", [4], ["Copper fungicide"], SEASON_START, SEASON_END)
+    assert len(planner.jobs(SEASON_START, SEASON_END)) == 1
+
+    planner.remove_planting("cherry")
+    assert planner.plantings == {"apple", "pear"}
+    assert planner.jobs(SEASON_START, SEASON_END) == []
+
+
+def test_covered_sprays_need_every_product():
+    """Test a spray is covered only when all of its products are batched."""
+    planner = TankMixPlanner()
+    planner.update_planting("apple", [3], ["Copper fungicide", "Neem oil"], SEASON_START, SEASON_END)
+    planner.update_planting("plum", [3], ["Copper fungicide", "Neem oil"], SEASON_START, SEASON_END)
+    planner.update_planting("cherry", [3], ["Copper fungicide", "Bacillus subtilis"], SEASON_START, SEASON_END)
+
+    covered = planner.covered_sprays(SEASON_START, SEASON_END)
+
+    assert {planting for planting, _day in covered} == {"apple", "plum"}
+
+
+def test_skipped_sprays_leave_their_jobs():
+    """Test cancelled or moved sprays are left out of jobs and of covered sprays."""
+    planner = TankMixPlanner()
+    for planting in ("apple", "plum", "pear"):
+        planner.update_planting(planting, [3], ["Copper fungicide"], SEASON_START, SEASON_END)
+
+    jobs = planner.jobs(SEASON_START, SEASON_END, frozenset({("pear", date(2026, 3, 7))}))
+    assert [job.as_dict()["plantings"] for job in jobs] == [["apple", "plum"]]
+    # The planner's own group is untouched
+    assert len(planner.jobs(SEASON_START, SEASON_END)[0].plantings) == 3
+
+    skipped = frozenset({("pear", date(2026, 3, 7)), ("plum", date(2026, 3, 7))})
+    assert planner.jobs(SEASON_START, SEASON_END, skipped) == []
+    assert planner.covered_sprays(SEASON_START, SEASON_END, skipped) == set()
@@ -0,0 +1,116 @@
+"""Test the Orchard Care per-language text templates."""
+import json
+from unittest.mock import patch
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.orchard_care import templates
+from custom_components.orchard_care.descriptions import (
+    get_notification,
+    get_reminder_summary,
+    get_task_description,
+    get_task_summary,
+)
+from custom_components.orchard_care.templates import async_load_templates, load_templates
+
+
+def test_notifications_follow_lead_time():
+    """Test notification titles and messages for each lead time."""
+    summary = "🌿 Spray Apple Tree (Organic)"
+
+    assert get_notification("en", 0, summary) == (
+        "🚨 TODAY - Orchard Care", f"Today is the day for: {summary}"
+    )
+    assert get_notification("en", 1, summary)[1] == f"Don't forget: {summary} is tomorrow"
+    assert get_notification("en", 3, summary) == (
+        "📅 3 DAYS - Orchard Care", f"Coming up: {summary} in 3 days"
+    )
+    assert get_notification("en", 14, summary) == (
+        "📅 2 WEEKS - Orchard Care", f"Plan ahead: {summary} in 2 weeks"
+    )
+    assert get_notification("en", 10, summary)[1] == f"Plan ahead: {summary} in 10 days"
+
+
+def test_summaries():
+    """Test task and reminder summaries."""
+    summary = get_task_summary("en", "apple", "spray", "Organic")
+
+    assert summary == "🌿 Spray Apple Tree (Organic)"
+    assert get_task_summary("en", "apple", "pruning", "Organic") == "🌳 Prune Apple Tree"
+    assert get_reminder_summary("en", summary, 7) == f"📅 Reminder: {summary} in 1 week"
+
+
+def test_missing_sections_fall_back_to_english(tmp_path):
+    """Test a partial translation keeps English for what it leaves out."""
+    english = json.loads((templates.LOCALES_DIR / "en.json").read_text(encoding="utf-8"))
+    (tmp_path / "en.json").write_text(json.dumps(english), encoding="utf-8")
+    (tmp_path / "xx.json").write_text(
+        json.dumps({"spray_no_products": "Siehe Pflegeanleitung"}), encoding="utf-8"
+    )
+
+    with patch.object(templates, "LOCALES_DIR", tmp_path):
+        translated = load_templates("xx")
+        unknown = load_templates("zz")
+
+    assert translated.spray_no_products == "Siehe Pflegeanleitung"
+    assert translated.pruning == templates.get_templates("en").pruning
+    assert unknown == templates.get_templates("en")
+
+
+def test_partial_sections_fall_back_per_key(tmp_path):
+    """Test a translated section keeps English for the keys it leaves out."""
+    english = json.loads((templates.LOCALES_DIR / "en.json").read_text(encoding="utf-8"))
+    (tmp_path / "en.json").write_text(json.dumps(english), encoding="utf-8")
+    (tmp_path / "xx.json").write_text(
+        json.dumps({
+            "summary": {"pruning": "🌳 {plant_name} snoeien"},
+            "pruning_tips": {"1": "Snoei op een droge dag"},
+        }),
+        encoding="utf-8",
+    )
+
+    with patch.object(templates, "LOCALES_DIR", tmp_path):
+        translated = load_templates("xx")
+
+    english_templates = templates.get_templates("en")
+    assert translated.summaries["pruning"] == "🌳 {plant_name} snoeien"
+    assert translated.summaries["spray"] == english_templates.summaries["spray"]
+    assert translated.pruning_tips[1] == "Snoei op een droge dag"
+    assert translated.pruning_tips[2] == english_templates.pruning_tips[2]
+    assert translated.pruning_tip == english_templates.pruning_tip
+
+
+def test_regional_language_falls_back_to_base(tmp_path):
+    """Test a regional language uses its base language before English."""
+    english = json.loads((templates.LOCALES_DIR / "en.json").read_text(encoding="utf-8"))
+    (tmp_path / "en.json").write_text(json.dumps(english), encoding="utf-8")
+    (tmp_path / "xx.json").write_text(
+        json.dumps({"spray_no_products": "Siehe Pflegeanleitung", "spray_warnings": "Achtung"}),
+        encoding="utf-8",
+    )
+    (tmp_path / "xx-ch.json").write_text(json.dumps({"spray_warnings": "Obacht"}), encoding="utf-8")
+
+    with patch.object(templates, "LOCALES_DIR", tmp_path):
+        regional = load_templates("xx-ch")
+        base_only = load_templates("xx-at")
+
+    assert regional.spray_warnings == "Obacht"
+    assert regional.spray_no_products == "Siehe Pflegeanleitung"
+    assert base_only.spray_warnings == "Achtung"
+    assert base_only.pruning == templates.get_templates("en").pruning
+
+
+async def test_language_loaded_once(hass: HomeAssistant):
+    """Test a language is compiled once and shared by later entries."""
+    with patch.object(templates, "load_templates", wraps=load_templates) as load:
+        assert await async_load_templates(hass, "NL") == "nl"
+        assert await async_load_templates(hass, "nl") == "nl"
+        assert await async_load_templates(hass, None) == "en"
+        # Regional codes are cached under the code the entry asked for
+        assert await async_load_templates(hass, "pt-BR") == "pt-br"
+        assert await async_load_templates(hass, "pt-br") == "pt-br"
+
+    assert [call.args for call in load.call_args_list] == [("nl",), ("pt-br",)]
+    assert get_task_description("nl", "apple", "pruning", 1, "Organic", ()) == (
+        get_task_description("en", "apple", "pruning", 1, "Organic", ())
+    )
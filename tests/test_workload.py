@@ -0,0 +1,37 @@
+"""Test the Orchard Care labor workload forecast."""
+from datetime import date
+
+from custom_components.orchard_care.blocks import OrchardBlock
+from custom_components.orchard_care.workload import WorkloadIndex, build_workload_index
+
+
+def test_workload_index_range_queries():
+    """Test range queries against the prefix sums."""
+    index = WorkloadIndex(date(2026, 1, 1), horizon_days=10)
+    index.add(date(2026, 1, 2), "pruning", 3.0)
+    index.add(date(2026, 1, 5), "spray", 2.0)
+    index.add(date(2026, 1, 20), "spray", 99.0)  # Outside the horizon
+    index.build()
+
+    assert index.hours_between(date(2026, 1, 1), date(2026, 1, 10)) == 5.0
+    assert index.hours_between(date(2026, 1, 2), date(2026, 1, 2)) == 3.0
+    assert index.hours_between(date(2026, 1, 3), date(2026, 1, 4)) == 0.0
+    assert index.hours_between(date(2026, 1, 1), date(2026, 1, 10), "spray") == 2.0
+    assert index.hours_between(date(2026, 1, 5), date(2026, 1, 1)) == 0.0
+
+
+def test_build_workload_index_scales_by_block_count():
+    """Test durations are multiplied by the planting counts."""
+    schedules = {"apple": {"pruning_months": [12, 1, 2], "spray_months": [3, 4, 5, 9]}}
+    blocks = [
+        OrchardBlock(block_id="a1", plant="apple", count=10),
+        OrchardBlock(block_id="a2", plant="apple", count=5),
+    ]
+
+    index = build_workload_index(schedules, blocks, date(2026, 1, 1))
+    summary = index.summary(date(2026, 1, 1), date(2026, 12, 31))
+
+    # Three pruning months at 3 hours and four spray months at 2 hours, for 15 plants
+    assert summary["by_task"] == {"pruning": 135.0, "spray": 120.0}
+    assert summary["hours"] == 255.0
+    assert index.hours_between(date(2026, 3, 7), date(2026, 3, 7), "spray") == 30.0
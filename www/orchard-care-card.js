@@ -4,10 +4,11 @@ class OrchardCareCard extends HTMLElement {
         super();
         this.attachShadow({ mode: 'open' });
         this.currentPlantIndex = 0;
+        this._overview = null;
     }
 
     setConfig(config) {
-        if (!config.entity) {
+        if (config.mode !== 'overview' && !config.entity) {
             throw new Error('You need to define an entity');
         }
         this.config = {
@@ -19,9 +20,19 @@ class OrchardCareCard extends HTMLElement {
 
     set hass(hass) {
         this._hass = hass;
+        if (this.config && this.config.mode === 'overview') {
+            // Overview rows come from one batched service call, not from state updates
+            if (!this._overview) this._overview = new OrchardOverview(this, this.config);
+            this._overview.connect(hass);
+            return;
+        }
         this.render();
     }
 
+    disconnectedCallback() {
+        if (this._overview) this._overview.disconnect();
+    }
+
     render() {
         if (!this._hass || !this.config) return;
 
@@ -203,11 +214,194 @@ class OrchardCareCard extends HTMLElement {
     getStatusClass(state) { if (state === 'Now') return 'status-urgent'; if (state.includes('day') && parseInt(state) <= 7) return 'status-warning'; return 'status-good'; }
     getStatusIcon(state) { if (state === 'Now') return '🚨'; if (state.includes('day') && parseInt(state) <= 7) return '⚠️'; if (state.includes('day') && parseInt(state) <= 14) return '⏰'; return '✅'; }
     getStatusText(state) { if (state === 'Now') return 'Action Required'; if (state.includes('day') && parseInt(state) <= 7) return 'Due Soon'; if (state.includes('day') && parseInt(state) <= 14) return 'Upcoming'; return 'On Schedule'; }
-    getCardSize() { return 4; }
+    getCardSize() { return this.config && this.config.mode === 'overview' ? 8 : 4; }
     static getConfigElement() { return document.createElement('orchard-care-card-editor'); }
     static getStubConfig() { return { entity: 'sensor.apple_tree_pruning', plants: [], hemisphere: 'Northern', organic_preference: true, show_plant_selector: true }; }
 }
 
+// Windowed grid of every planting; only the rows in view are kept in the DOM
+class OrchardOverview {
+    constructor(card, config) {
+        this.card = card;
+        this.rowHeight = config.row_height || 40;
+        this.viewportHeight = config.height || 480;
+        this.overscan = 6;
+        this.refreshInterval = (config.refresh_interval || 300) * 1000;
+        this.rows = [];
+        this.view = [];
+        this.sortKey = config.sort_by || 'next_action';
+        this.sortAsc = true;
+        this.filter = '';
+        this.rowPool = [];
+        this._timer = null;
+        this._frame = null;
+        this._built = false;
+    }
+
+    connect(hass) {
+        this.hass = hass;
+        if (!this._built) this.build();
+        if (!this._timer) {
+            this.fetch();
+            this._timer = setInterval(() => this.fetch(), this.refreshInterval);
+        }
+    }
+
+    disconnect() {
+        if (this._timer) clearInterval(this._timer);
+        this._timer = null;
+    }
+
+    async fetch() {
+        try {
+            const result = await this.hass.callWS({
+                type: 'call_service',
+                domain: 'orchard_care',
+                service: 'query',
+                service_data: { query: 'overview' },
+                return_response: true
+            });
+            this.setRows(result.response.plantings || []);
+        } catch (err) {
+            console.error('Orchard Care overview query failed', err);
+        }
+    }
+
+    setRows(plantings) {
+        // Pre-compute sort keys once per fetch so sorting never parses dates
+        this.rows = plantings.map(row => {
+            const pruning = row.next_pruning ? Date.parse(row.next_pruning) : Infinity;
+            const spray = row.next_spray ? Date.parse(row.next_spray) : Infinity;
+            return {
+                ...row,
+                pruningTs: pruning,
+                sprayTs: spray,
+                nextTs: Math.min(pruning, spray),
+                search: `${row.name} ${row.plant} ${(row.spray_products || []).join(' ')}`.toLowerCase()
+            };
+        });
+        this.applyView();
+    }
+
+    applyView() {
+        const needle = this.filter.trim().toLowerCase();
+        const view = needle ? this.rows.filter(row => row.search.includes(needle)) : this.rows.slice();
+        const key = { name: 'name', next_pruning: 'pruningTs', next_spray: 'sprayTs', next_action: 'nextTs' }[this.sortKey] || 'nextTs';
+        const direction = this.sortAsc ? 1 : -1;
+        view.sort((a, b) => (a[key] < b[key] ? -1 : a[key] > b[key] ? 1 : 0) * direction);
+        this.view = view;
+        this.spacer.style.height = `${view.length * this.rowHeight}px`;
+        this.countLabel.textContent = `${view.length} of ${this.rows.length} plantings`;
+        this.renderWindow();
+    }
+
+    build() {
+        const root = this.card.shadowRoot;
+        root.innerHTML = `
+            ${this.card.getStyles()}
+            ${this.getStyles()}
+            <ha-card>
+                <div class="orchard-card overview">
+                    <div class="overview-toolbar">
+                        <input class="overview-filter" type="search" placeholder="Filter plantings or products">
+                        <span class="overview-count"></span>
+                    </div>
+                    <div class="overview-header">
+                        <button data-sort="name">Planting</button>
+                        <button data-sort="next_pruning">✂️ Pruning</button>
+                        <button data-sort="next_spray">🌿 Spray</button>
+                    </div>
+                    <div class="overview-viewport" style="height: ${this.viewportHeight}px">
+                        <div class="overview-spacer"></div>
+                        <div class="overview-rows"></div>
+                    </div>
+                </div>
+            </ha-card>
+        `;
+        this.viewport = root.querySelector('.overview-viewport');
+        this.spacer = root.querySelector('.overview-spacer');
+        this.rowsEl = root.querySelector('.overview-rows');
+        this.countLabel = root.querySelector('.overview-count');
+
+        root.querySelector('.overview-filter').addEventListener('input', ev => {
+            this.filter = ev.target.value;
+            this.viewport.scrollTop = 0;
+            this.applyView();
+        });
+        root.querySelectorAll('.overview-header button').forEach(button => {
+            button.addEventListener('click', () => {
+                const key = button.dataset.sort;
+                this.sortAsc = this.sortKey === key ? !this.sortAsc : true;
+                this.sortKey = key;
+                this.applyView();
+            });
+        });
+        this.viewport.addEventListener('scroll', () => {
+            if (this._frame) return;
+            this._frame = requestAnimationFrame(() => {
+                this._frame = null;
+                this.renderWindow();
+            });
+        }, { passive: true });
+        this._built = true;
+    }
+
+    renderWindow() {
+        const first = Math.max(0, Math.floor(this.viewport.scrollTop / this.rowHeight) - this.overscan);
+        const visible = Math.ceil(this.viewportHeight / this.rowHeight) + this.overscan * 2;
+        const last = Math.min(this.view.length, first + visible);
+
+        // Grow the pool to the window size once; afterwards rows are only re-labelled
+        while (this.rowPool.length < last - first) {
+            const el = document.createElement('div');
+            el.className = 'overview-row';
+            el.innerHTML = '<span class="cell-name"></span><span class="cell-pruning"></span><span class="cell-spray"></span>';
+            this.rowsEl.appendChild(el);
+            this.rowPool.push(el);
+        }
+
+        this.rowsEl.style.transform = `translateY(${first * this.rowHeight}px)`;
+        this.rowPool.forEach((el, offset) => {
+            const row = this.view[first + offset];
+            if (!row) {
+                el.style.display = 'none';
+                return;
+            }
+            el.style.display = '';
+            el.style.height = `${this.rowHeight}px`;
+            el.children[0].textContent = `${this.card.getPlantIcon(row.name)} ${row.name}`;
+            el.children[1].textContent = this.formatDate(row.pruningTs);
+            el.children[2].textContent = this.formatDate(row.sprayTs);
+            el.children[2].title = (row.spray_products || []).join(', ');
+        });
+    }
+
+    formatDate(ts) {
+        if (ts === Infinity) return 'Not scheduled';
+        const days = Math.floor((ts - Date.now()) / 86400000);
+        if (days <= 0) return 'Now';
+        if (days <= 30) return `In ${days} days`;
+        return new Date(ts).toLocaleDateString(undefined, { month: 'long', year: 'numeric' });
+    }
+
+    getStyles() {
+        return `
+            <style>
+                .overview-toolbar { display: flex; align-items: center; gap: 12px; margin-bottom: 12px; }
+                .overview-filter { flex: 1; padding: 8px 12px; border-radius: 10px; border: 1px solid rgba(0, 0, 0, 0.15); font-size: 13px; }
+                .overview-count { font-size: 11px; color: var(--secondary-text-color); white-space: nowrap; }
+                .overview-header, .overview-row { display: grid; grid-template-columns: 2fr 1fr 1fr; align-items: center; gap: 8px; }
+                .overview-header button { background: none; border: none; text-align: left; font-size: 12px; font-weight: 600; color: var(--primary-text-color); cursor: pointer; padding: 6px 4px; }
+                .overview-viewport { overflow-y: auto; position: relative; contain: strict; }
+                .overview-spacer { width: 1px; }
+                .overview-rows { position: absolute; top: 0; left: 0; right: 0; will-change: transform; }
+                .overview-row { font-size: 12px; border-bottom: 1px solid rgba(0, 0, 0, 0.06); padding: 0 4px; box-sizing: border-box; }
+                .overview-row span { overflow: hidden; text-overflow: ellipsis; white-space: nowrap; }
+            </style>
+        `;
+    }
+}
+
 class OrchardCareCardEditor extends HTMLElement {
     constructor() { super(); this.attachShadow({ mode: 'open' }); }
     setConfig(config) { this.config = config; this.render(); }